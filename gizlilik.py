@@ -1,28 +1,54 @@
 import os
 import sys
+import errno
 import json
 import hashlib
+import hmac
 import base64
 import shutil
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from cryptography.fernet import Fernet
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import subprocess
 import threading
+import queue
 import webbrowser
 import time
 import io
+import zlib
+import lzma
+import struct
+import sqlite3
+import tempfile
+import ctypes
+import bisect
+import stat
+import itertools
 from datetime import datetime
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from PIL import Image, ImageTk
 import tkinterweb  # pip install tkinterweb
 import customtkinter as ctk  # pip install customtkinter
+try:
+    import zstandard  # pip install zstandard (isteğe bağlı)
+except ImportError:
+    zstandard = None
+try:
+    import fcntl  # Yalnızca Unix; reflink klonlama için
+except ImportError:
+    fcntl = None
 import mimetypes
 import random
 import string
 import platform
-from functools import partial
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, FIRST_EXCEPTION, wait
 
 class ModernTheme:
     # Tema renkleri
@@ -348,7 +374,7 @@ class VideoPlayer(ctk.CTkToplevel):
         self.destroy()
 
 class TextEditor(ctk.CTkToplevel):
-    def __init__(self, master, file_path):
+    def __init__(self, master, file_path, on_save=None):
         super().__init__(master)
         self.title("Metin Düzenleyici")
         self.geometry("800x600")
@@ -358,6 +384,7 @@ class TextEditor(ctk.CTkToplevel):
         self.configure(fg_color=self.theme.bg_primary)
         
         self.file_path = file_path
+        self.on_save = on_save  # Kayıttan sonra çağrılır (ör. yeniden şifreleme)
         
         # Ana çerçeve
         main_frame = ctk.CTkFrame(self, fg_color=self.theme.bg_primary)
@@ -434,8 +461,23 @@ class TextEditor(ctk.CTkToplevel):
     def _save_file(self):
         try:
             content = self.text_area.get('1.0', tk.END)
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                file.write(content)
+            # Yeni dosyaya yazıp değiştir: ortak depodaki bloblar yerinde değişmez.
+            # Geçici ad benzersizdir; klasördeki "<ad>.tmp" adlı bir dosyayı ezmez.
+            fd, partial_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.file_path) + ".", suffix=".tmp",
+                dir=os.path.dirname(self.file_path)
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    file.write(content)
+                shutil.copymode(self.file_path, partial_path)
+                os.replace(partial_path, self.file_path)
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+            if self.on_save:
+                self.on_save()
             messagebox.showinfo("Bilgi", "Dosya başarıyla kaydedildi.")
         except Exception as e:
             messagebox.showerror("Hata", f"Dosya kaydedilemedi: {str(e)}")
@@ -455,20 +497,42 @@ class TextEditor(ctk.CTkToplevel):
             self.destroy()
 
 class FileExplorer(ctk.CTkToplevel):
-    def __init__(self, master, folder_path, hidden_id=None):
+    # Bu kadar öğeden büyük dizinlerde Treeview'e yalnızca görünen satırlar eklenir
+    VIRTUAL_THRESHOLD = 1000
+    # Disk dizinleri arka planda taranır, girdiler bu boyda partilerle gelir
+    LIST_BATCH = 500
+    LIST_POLL_MS = 30
+    # Dizin izleyicisinin (inotify) olay okuma aralığı
+    WATCH_POLL_MS = 300
+    
+    def __init__(self, master, folder_path, hidden_id=None, app=None):
         super().__init__(master)
         self.title("Gizli Klasör İçeriği")
         self.geometry("900x600")
         self.minsize(800, 500)
         
-        self.master_app = master
-        self.theme = master.theme
+        self.master_app = app or master
+        self.theme = self.master_app.theme
         self.configure(fg_color=self.theme.bg_primary)
         
         self.folder_path = folder_path
         self.hidden_id = hidden_id
         self.current_path = folder_path
         
+        # Şifreli/sıkıştırılmış klasörlerde dosyalar geçici bir dizine çözülerek açılır
+        folder_info = getattr(self.master_app, "hidden_folders", {}).get(hidden_id)
+        self.codec = VaultCodec.from_record(folder_info)
+        self.temp_dir = None
+        
+        # Dizin listesi diskten değil klasörün şifreli manifestinden okunur
+        self.manifest = self._load_manifest() if folder_info is not None else None
+        
+        # Klasörler arası yapıştırmada açık gezginin manifesti ortak kullanılır
+        explorers = getattr(self.master_app, "explorers", None)
+        if explorers is not None and hidden_id is not None:
+            explorers[hidden_id] = self
+        self.paste_job = None
+        
         # Ana çerçeve
         main_frame = ctk.CTkFrame(self, fg_color=self.theme.bg_primary)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -517,6 +581,14 @@ class FileExplorer(ctk.CTkToplevel):
         )
         self.new_folder_btn.pack(side=tk.RIGHT, padx=5, pady=5)
         
+        # Yapıştır butonu (Kopyala/Kes ile panoya alınan öğe)
+        self.paste_btn = ctk.CTkButton(
+            button_frame, text="📋 Yapıştır", command=self._paste,
+            fg_color=self.theme.accent, hover_color=self.theme.accent_hover,
+            text_color="#FFFFFF", width=100
+        )
+        self.paste_btn.pack(side=tk.RIGHT, padx=5, pady=5)
+        
         # Mevcut yol gösterimi
         path_frame = ctk.CTkFrame(main_frame, fg_color=self.theme.bg_secondary, height=30)
         path_frame.pack(fill=tk.X, pady=(0, 10))
@@ -555,13 +627,35 @@ class FileExplorer(ctk.CTkToplevel):
         self.file_tree.column("date", width=150, anchor="w")
         self.file_tree.column("type", width=100, anchor="w")
         
-        # Kaydırma çubukları
-        vsb = ttk.Scrollbar(file_frame, orient="vertical", command=self.file_tree.yview)
+        # Kaydırma çubukları (dikey çubuk sanal listede pencereyi kaydırır)
+        self.vsb = ttk.Scrollbar(file_frame, orient="vertical", command=self._on_vscroll)
         hsb = ttk.Scrollbar(file_frame, orient="horizontal", command=self.file_tree.xview)
-        self.file_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.file_tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=hsb.set)
+        
+        # Sanal liste: tüm girdiler listing'de, Treeview'de yalnızca görünen pencere
+        self.listing = []
+        self.virtual = False
+        self.window_start = 0
+        self.window_rows = 20
+        self.selected_index = None
+        
+        # Süren dizin taraması (gezinince iptal edilir)
+        self.list_job = None
+        self.list_poll = None
+        
+        # Gösterilen dizindeki değişiklikler satır satır yansıtılır
+        # (manifestli klasörlerde önce manifeste işlenir)
+        self.watcher = None
+        self.watch_poll = None
+        self.watch_pending = set()
+        if DirectoryWatcher.supported():
+            try:
+                self.watcher = DirectoryWatcher()
+            except OSError:
+                self.watcher = None
         
         # Yerleştirme
-        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
         hsb.pack(side=tk.BOTTOM, fill=tk.X)
         self.file_tree.pack(fill=tk.BOTH, expand=True)
         
@@ -576,9 +670,24 @@ class FileExplorer(ctk.CTkToplevel):
         # Çift tıklama olayı
         self.file_tree.bind("<Double-1>", self._on_item_double_click)
         
+        # Sanal liste kaydırma ve seçim takibi
+        self.file_tree.bind("<Configure>", self._on_tree_resize)
+        self.file_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.file_tree.bind("<MouseWheel>", lambda event: self._on_wheel(-1 if event.delta > 0 else 1))
+        self.file_tree.bind("<Button-4>", lambda event: self._on_wheel(-1))
+        self.file_tree.bind("<Button-5>", lambda event: self._on_wheel(1))
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "page-"), ("<Next>", "page+"),
+                          ("<Home>", "home"), ("<End>", "end")):
+            self.file_tree.bind(key, lambda event, step=step: self._on_key_scroll(step))
+        
         # Sağ tık menüsü
         self.file_tree.bind("<Button-3>", self._show_context_menu)
         
+        # Pano kısayolları
+        self.file_tree.bind("<Control-c>", lambda event: self._copy_selected(cut=False))
+        self.file_tree.bind("<Control-x>", lambda event: self._copy_selected(cut=True))
+        self.file_tree.bind("<Control-v>", lambda event: self._paste())
+        
         # Dosya listesini doldur
         self._populate_files()
         
@@ -613,47 +722,600 @@ class FileExplorer(ctk.CTkToplevel):
             foreground=[("selected", "#FFFFFF")]
         )
     
+    def _load_manifest(self):
+        """Klasörün manifestini yükler; eksikse klasörü bir kez tarayıp oluşturur
+
+        Kataloğa kayıtlı her klasörün gezgini listeyi bu manifestten okur;
+        diskten listeleme yalnızca kaydı olmayan klasörler ve manifestin
+        okunamadığı durum içindir.
+        """
+        try:
+            manifest = FolderManifest.for_folder(
+                self.master_app.hidden_dir, self.hidden_id, self.master_app._session_cipher()
+            ).load()
+            if not manifest.is_indexed():
+                self._reindex(manifest)
+            return manifest
+        except Exception as e:
+            # Manifest okunamazsa gezgin diskten listelemeye devam eder
+            print(f"Manifest yüklenemedi: {str(e)}")
+            return None
+    
+    def _reindex(self, manifest):
+        """Manifesti diskteki ağaçtan yeniden kurar (blob özetleri korunur)"""
+        old_entries = manifest.entries
+        index = FolderStats.scan(self.folder_path, keep_index=True).index
+        for rel_path, fields in index.items():
+            if "h" in old_entries.get(rel_path, {}):
+                fields["h"] = old_entries[rel_path]["h"]
+        manifest.entries = {}
+        manifest.set_index(index)
+        manifest.save()
+    
+    def _rel_path(self, path):
+        rel_path = os.path.relpath(path, self.folder_path)
+        return "" if rel_path == "." else rel_path
+    
+    @staticmethod
+    def _scan_dir(path):
+        """Disk dizinindeki öğeleri (ad, tür, boyut, zaman) olarak üretir"""
+        # DirEntry tür bilgisini dizin okumasından, stat'ı önbellekten verir
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    stat_info = entry.stat()
+                except OSError:
+                    # Kırık sembolik bağlantı: bağlantının kendisi listelenir
+                    stat_info = entry.stat(follow_symlinks=False)
+                kind = "d" if entry.is_dir() else "f"
+                yield (entry.name, kind, stat_info.st_size, stat_info.st_mtime)
+    
+    @staticmethod
+    def _manifest_entries(children):
+        """Manifest alt öğelerini disk listesiyle aynı (ad, tür, boyut, zaman) biçiminde üretir
+
+        Satır metinleri burada değil, _row_values ile yalnızca Treeview'e
+        gerçekten eklenen satırlar için üretilir.
+        """
+        for name, fields in children.items():
+            yield (name, fields.get("t", "f"), fields.get("s", 0), fields.get("m", 0))
+    
+    def _manifest_changed(self):
+        """Manifesti kaydeder, klasör kaydındaki boyut ve önizlemeyi günceller"""
+        if self.manifest is None:
+            return
+        self.manifest.save()
+        
+        folder_info = self.master_app.hidden_folders.get(self.hidden_id)
+        if folder_info is not None:
+            folder_info.update(FolderStats.from_index(self.manifest.entries).to_record())
+            self.master_app.save_hidden_folders()
+    
+    def _file_saved(self, stored_path, plain_path):
+        """Düzenlenip kaydedilen dosyanın manifest girdisini günceller"""
+        if self.manifest is None:
+            return
+        st = os.stat(plain_path)
+        # Dosya yeniden yazıldığı için depodaki blobla bağı kalmadı ("h" düşer)
+        self.manifest.put(self._rel_path(stored_path), {"t": "f", "s": st.st_size, "m": int(st.st_mtime)})
+        self._manifest_changed()
+    
+    @staticmethod
+    def _sort_key(entry):
+        # Önce klasörler, sonra dosyalar; her grup ada göre sıralı
+        return (entry[1] != "d", entry[0])
+    
     def _populate_files(self):
-        # Mevcut dosya listesini temizle
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        # Önceki dizinin taraması sürüyorsa bırakılır
+        self._cancel_listing()
+        
+        # Yol etiketini güncelle
+        self.path_var.set(self.current_path)
+        
+        cache = getattr(self.master_app, "listing_cache", None)
+        key = self._cache_key()
+        
+        # İzleme listelemeden önce başlar: listeleme sırasında gelen olaylar sonra
+        # uygulanır. Manifestli klasörlerde olaylar önce manifeste işlenir.
+        self._watch(self.current_path)
+        
+        if self.manifest is not None:
+            # Manifestli dizinin damgası manifest sürümüdür
+            stamp = self.manifest.version
+            entries = cache.get(key, stamp) if cache is not None else None
+            if entries is not None:
+                self._show_listing(entries)
+                self._show_counts()
+                return
+            
+            children = self.manifest.children(self._rel_path(self.current_path))
+            if len(children) <= self.LIST_BATCH:
+                # Küçük dizin: manifest bellekte, liste beklemeden kurulur
+                entries = sorted(self._manifest_entries(children), key=self._sort_key)
+                self._show_listing(entries)
+                self._show_counts()
+                self._cache_listing(key, stamp, entries)
+                return
+            
+            # Büyük dizin diskteki gibi partiler halinde gösterilir; iş parçacığı
+            # manifestin kendisine değil, buradaki kopyasına bakar
+            self._start_listing(self._manifest_entries(dict(children)), key, stamp)
+            return
+        
+        # Zaman taramadan önce alınır: tarama sırasında değişen dizin
+        # bir sonraki gezinmede yeniden okunur
+        try:
+            mtime = os.stat(self.current_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if cache is not None and mtime is not None:
+            entries = cache.get(key, mtime)
+            if entries is not None:
+                self._show_listing(entries)
+                self._show_counts()
+                return
         
+        # Disk dizini iş parçacığında taranır
+        self._start_listing(self._scan_dir(self.current_path), key, mtime)
+    
+    def _cache_key(self):
+        """Geçerli dizinin liste önbelleğindeki anahtarı"""
+        if self.manifest is not None:
+            return ("manifest", self.hidden_id, self.current_path)
+        return self.current_path
+    
+    def _cache_listing(self, key, stamp, entries):
+        cache = getattr(self.master_app, "listing_cache", None)
+        if cache is None or stamp is None:
+            return
+        # Disk dizininde damga dizin zamanıdır; çok yeni zaman güvenilmez
+        if self.manifest is None and not ListingCache.settled(stamp):
+            return
+        cache.put(key, stamp, entries)
+    
+    def _start_listing(self, source, key, stamp):
+        """source üretecini iş parçacığında tüketir, partiler after() ile eklenir"""
+        job = Job("Klasör listeleniyor", None)
+        batches = queue.Queue()
+        self.list_job = job
+        self._show_listing([])
+        self.status_label.configure(text="Yükleniyor…")
+        threading.Thread(target=self._scan_worker, args=(source, job, batches), daemon=True).start()
+        self.list_poll = self.after(self.LIST_POLL_MS, self._poll_listing, job, batches, key, stamp)
+    
+    def _scan_worker(self, source, job, batches):
+        # İş parçacığı: Tk nesnelerine asla dokunmaz
+        entries = []
+        batch = []
         try:
-            # Klasörleri ve dosyaları listele
-            folders = []
-            files = []
+            for entry in source:
+                batch.append(entry)
+                if len(batch) >= self.LIST_BATCH:
+                    job.check_cancelled()
+                    batches.put(("batch", batch))
+                    entries.extend(batch)
+                    batch = []
+            entries.extend(batch)
+            batches.put(("batch", batch))
             
-            for item in os.listdir(self.current_path):
-                item_path = os.path.join(self.current_path, item)
-                
-                # Dosya bilgilerini al
-                stat_info = os.stat(item_path)
-                size = stat_info.st_size
-                mod_time = datetime.fromtimestamp(stat_info.st_mtime).strftime('%d.%m.%Y %H:%M')
-                
-                if os.path.isdir(item_path):
-                    # Klasör
-                    folders.append((item, "<Klasör>", mod_time, "Klasör"))
-                else:
-                    # Dosya
-                    size_str = self._format_size(size)
-                    file_type = self._get_file_type(item)
-                    files.append((item, size_str, mod_time, file_type))
+            # Son sıralama da ana döngüyü bekletmesin diye burada yapılır
+            job.check_cancelled()
+            entries.sort(key=self._sort_key)
+            batches.put(("done", entries))
+        except JobCancelled:
+            pass
+        except Exception as e:
+            batches.put(("error", e))
+    
+    def _poll_listing(self, job, batches, key, stamp):
+        """Taramadan gelen partileri listeye ekler"""
+        self.list_poll = None
+        if job is not self.list_job:
+            return
+        
+        while True:
+            try:
+                kind, payload = batches.get_nowait()
+            except queue.Empty:
+                break
             
-            # Önce klasörleri ekle
-            for folder in sorted(folders):
-                self.file_tree.insert("", tk.END, values=folder, tags=("folder",))
+            if kind == "batch":
+                self._append_listing(payload)
+            elif kind == "done":
+                # Gelme sırasındaki liste, sıralanmış haliyle değiştirilir
+                self.list_job = None
+                self._show_listing(payload, keep_position=True)
+                self._show_counts()
+                self._cache_listing(key, stamp, payload)
+                # Tarama sırasında biriken değişiklikler
+                self._flush_pending()
+                return
+            else:
+                self.list_job = None
+                self.status_label.configure(text="")
+                messagebox.showerror("Hata", f"Klasör içeriği listelenemedi: {str(payload)}")
+                return
+        
+        self.status_label.configure(text=f"Yükleniyor… {len(self.listing)} öğe")
+        self.list_poll = self.after(self.LIST_POLL_MS, self._poll_listing, job, batches, key, stamp)
+    
+    def _cancel_listing(self):
+        if self.list_job is not None:
+            self.list_job.cancel()
+            self.list_job = None
+        if self.list_poll is not None:
+            self.after_cancel(self.list_poll)
+            self.list_poll = None
+    
+    def _watch(self, path):
+        """İzleyiciyi verilen dizine taşır (None: izleme durur)"""
+        if self.watcher is None:
+            return
+        if path != self.watcher.path:
+            self.watch_pending = set()
+        try:
+            if path is None:
+                self.watcher.unwatch()
+            else:
+                self.watcher.watch(path)
+        except OSError:
+            # İzlenemeyen dizin (ör. izleme sınırı dolu) elle yenilenir
+            self.watcher.unwatch()
+            return
+        if path is not None and self.watch_poll is None:
+            self.watch_poll = self.after(self.WATCH_POLL_MS, self._poll_watcher)
+    
+    def _poll_watcher(self):
+        self.watch_poll = None
+        if self.watcher is None or self.watcher.wd is None:
+            return
+        
+        names, status = self.watcher.read()
+        if status == "overflow" and self.manifest is None:
+            # Kaçan olaylar bilinemez: dizin baştan okunur
+            cache = getattr(self.master_app, "listing_cache", None)
+            if cache is not None:
+                cache.discard(self._cache_key())
+            self._populate_files()
+        elif status == "gone":
+            # Gösterilen dizin silindi ya da taşındı: var olan ilk üst dizine çık
+            self._leave_missing_dir()
+        else:
+            if status == "overflow":
+                # Kaçan olaylar bilinemez: dizindeki her ad manifestle karşılaştırılır
+                names = self._dir_names()
+            self.watch_pending |= names
+            self._flush_pending()
+        
+        if self.watcher.wd is not None and self.watch_poll is None:
+            self.watch_poll = self.after(self.WATCH_POLL_MS, self._poll_watcher)
+    
+    def _flush_pending(self):
+        """Biriken değişiklikleri uygular
+
+        Liste taranırken beklenir. Manifestli klasörde değişiklikler önce
+        manifeste işlenir; klasörde yapıştırma gibi bir iş sürerken manifesti
+        o iş güncellediği için beklenir.
+        """
+        if not self.watch_pending or self.list_job is not None:
+            return
+        if self.manifest is not None:
+            if self._folder_busy():
+                return
+            if self._reconcile(self.watch_pending):
+                self._manifest_changed()
+        self._apply_changes(self.watch_pending)
+        self.watch_pending = set()
+    
+    def _folder_busy(self):
+        return self.hidden_id in getattr(self.master_app, "busy_folder_ids", ())
+    
+    def _dir_names(self):
+        """Geçerli dizinde manifestte ya da diskte bulunan bütün adlar"""
+        names = set(self.manifest.children(self._rel_path(self.current_path)))
+        try:
+            names.update(os.listdir(self.current_path))
+        except OSError:
+            pass
+        return names
+    
+    def _reconcile(self, names):
+        """Geçerli dizindeki adların manifest girdilerini diskteki hallerine getirir
+
+        Yalnızca farklı olan girdiler değişir; değişiklik olduysa True döner.
+        Şifreli/sıkıştırılmış klasörde diskteki boyut orijinal boyut
+        olmadığından eski boyut korunur.
+        """
+        rel_dir = self._rel_path(self.current_path)
+        changed = False
+        for name in names:
+            rel_path = os.path.join(rel_dir, name)
+            old = self.manifest.entries.get(rel_path)
+            new = self._disk_fields(name)
+            if new is None:
+                if old is not None:
+                    self.manifest.remove_tree(rel_path)
+                    changed = True
+            elif old is None or old.get("t") != new["t"]:
+                if old is not None:
+                    self.manifest.remove_tree(rel_path)
+                if new["t"] == "d":
+                    # Dışarıdan gelen klasör bir kez taranıp alt öğeleriyle eklenir
+                    path = os.path.join(self.current_path, name)
+                    subtree = {"": new}
+                    subtree.update(FolderStats.scan(path, keep_index=True).index)
+                    self.manifest.put_tree(rel_path, subtree)
+                else:
+                    self.manifest.put(rel_path, new)
+                changed = True
+            elif old.get("m") != new["m"] or (new["t"] != "d" and not self.codec and old.get("s") != new["s"]):
+                if new["t"] == "d":
+                    fields = dict(old, m=new["m"])
+                else:
+                    # İçerik değişti: depodaki blobla bağı kalmadı ("h" düşer)
+                    fields = new
+                    if self.codec:
+                        fields["s"] = old.get("s", new["s"])
+                self.manifest.put(rel_path, fields)
+                changed = True
+        return changed
+    
+    def _disk_fields(self, name):
+        """Diskteki öğenin manifest alanları (FolderStats ile aynı biçim); yoksa None"""
+        try:
+            st = os.lstat(os.path.join(self.current_path, name))
+        except OSError:
+            return None
+        if stat.S_ISLNK(st.st_mode):
+            kind = "l"
+        elif stat.S_ISDIR(st.st_mode):
+            kind = "d"
+        else:
+            kind = "f"
+        return {"t": kind, "s": 0 if kind == "d" else st.st_size, "m": int(st.st_mtime)}
+    
+    def _leave_missing_dir(self):
+        path = self.current_path
+        while path != self.folder_path and not os.path.isdir(path):
+            path = os.path.dirname(path)
+        if os.path.isdir(path):
+            self.current_path = path
+            if self.manifest is not None and not self._folder_busy():
+                # Silinen ya da taşınan dizin üst dizinde manifestle karşılaştırılır
+                if self._reconcile(self._dir_names()):
+                    self._manifest_changed()
+            self._populate_files()
+        else:
+            self._cancel_listing()
+            self._show_listing([])
+            self._show_counts()
+    
+    def _stat_entry(self, name):
+        """Disk dizinindeki öğenin güncel (ad, tür, boyut, zaman) hali; yoksa None"""
+        path = os.path.join(self.current_path, name)
+        try:
+            stat_info = os.stat(path)
+        except FileNotFoundError:
+            # Kırık sembolik bağlantı: bağlantının kendisi listelenir
+            try:
+                stat_info = os.lstat(path)
+            except OSError:
+                return None
+        except OSError:
+            return None
+        kind = "d" if stat.S_ISDIR(stat_info.st_mode) else "f"
+        return (name, kind, stat_info.st_size, stat_info.st_mtime)
+    
+    def _current_entry(self, name):
+        """Öğenin listede görünmesi gereken hali (manifestli klasörde manifestten)"""
+        if self.manifest is None:
+            return self._stat_entry(name)
+        fields = self.manifest.children(self._rel_path(self.current_path)).get(name)
+        if fields is None:
+            return None
+        return next(self._manifest_entries({name: fields}))
+    
+    def _apply_changes(self, names):
+        """Değişen adları listeye satır satır uygular; diğer satırlara dokunulmaz"""
+        # Liste önbellekle ya da başka bir gezginle ortak olabilir; kopyası değiştirilir
+        listing = list(self.listing)
+        rows = None if self.virtual else list(self.file_tree.get_children())
+        
+        for name in sorted(names):
+            old_index = None
+            # Manifestli klasörlerde bağlantılar "l" türündedir; dosyalarla aynı sırada durur
+            for key in ((False, name), (True, name)):
+                index = bisect.bisect_left(listing, key, key=self._sort_key)
+                if index < len(listing) and self._sort_key(listing[index]) == key:
+                    old_index = index
+                    break
+            old = listing[old_index] if old_index is not None else None
+            new = self._current_entry(name)
+            if old == new:
+                continue
             
-            # Sonra dosyaları ekle
-            for file in sorted(files):
-                self.file_tree.insert("", tk.END, values=file, tags=("file",))
+            if old is not None and new is not None and old[1] == new[1]:
+                # Yalnızca boyut/zaman değişti: satır yerinde güncellenir
+                listing[old_index] = new
+                if rows is not None:
+                    self.file_tree.item(rows[old_index], values=self._row_values(new), tags=self._row_tags(new))
+                continue
             
-            # Yol etiketini güncelle
-            self.path_var.set(self.current_path)
-            self.status_label.configure(text=f"{len(folders)} klasör, {len(files)} dosya")
+            if old is not None:
+                del listing[old_index]
+                if rows is not None:
+                    self.file_tree.delete(rows.pop(old_index))
+                elif self.selected_index is not None:
+                    if self.selected_index == old_index:
+                        self.selected_index = None
+                    elif self.selected_index > old_index:
+                        self.selected_index -= 1
             
-        except Exception as e:
-            messagebox.showerror("Hata", f"Klasör içeriği listelenemedi: {str(e)}")
+            if new is not None:
+                index = bisect.bisect_left(listing, self._sort_key(new), key=self._sort_key)
+                listing.insert(index, new)
+                if rows is not None:
+                    rows.insert(index, self.file_tree.insert("", index, values=self._row_values(new), tags=self._row_tags(new)))
+                elif self.selected_index is not None and self.selected_index >= index:
+                    self.selected_index += 1
+        
+        self.listing = listing
+        if self.virtual:
+            self._render_window()
+        elif len(listing) > self.VIRTUAL_THRESHOLD:
+            self._show_listing(listing)
+        self._show_counts()
+        
+        # Dizin zamanı değişmeden büyüyen dosyalar da olabilir; önbellekteki liste eskidi
+        cache = getattr(self.master_app, "listing_cache", None)
+        if cache is not None:
+            cache.discard(self._cache_key())
+    
+    def _append_listing(self, batch):
+        """Tarama sürerken gelen partiyi gelme sırasıyla sona ekler"""
+        if not batch:
+            return
+        self.listing.extend(batch)
+        if self.virtual:
+            self._render_window()
+        elif len(self.listing) > self.VIRTUAL_THRESHOLD:
+            self._show_listing(self.listing)
+        else:
+            for entry in batch:
+                self.file_tree.insert("", tk.END, values=self._row_values(entry), tags=self._row_tags(entry))
+    
+    def _show_counts(self):
+        folder_count = sum(1 for entry in self.listing if entry[1] == "d")
+        self.status_label.configure(text=f"{folder_count} klasör, {len(self.listing) - folder_count} dosya")
+    
+    def _show_listing(self, entries, keep_position=False):
+        """Sıralı girdileri gösterir; büyük dizinlerde sanal listeye geçer"""
+        self.listing = entries
+        self.selected_index = None
+        if not keep_position:
+            self.window_start = 0
+        self.file_tree.delete(*self.file_tree.get_children())
+        self.virtual = len(entries) > self.VIRTUAL_THRESHOLD
+        
+        if self.virtual:
+            self._render_window()
+            return
+        
+        # Satır metinleri (tarih, boyut, tür) yalnızca eklenen satırlar için üretilir
+        for entry in entries:
+            self.file_tree.insert("", tk.END, values=self._row_values(entry), tags=self._row_tags(entry))
+    
+    @staticmethod
+    def _row_tags(entry):
+        return ("folder",) if entry[1] == "d" else ("file",)
+    
+    def _render_window(self, start=None):
+        """Sanal listede listing[start:start+window_rows] aralığını gösterir
+
+        Treeview'deki satırlar silinip eklenmez, değerleri değiştirilerek
+        yeniden kullanılır; satır sayısı pencere boyunu hiç aşmaz.
+        """
+        total = len(self.listing)
+        if start is not None:
+            self.window_start = start
+        self.window_start = max(0, min(self.window_start, total - self.window_rows))
+        
+        rows = list(self.file_tree.get_children())
+        wanted = min(self.window_rows, total)
+        if len(rows) > wanted:
+            self.file_tree.delete(*rows[wanted:])
+            rows = rows[:wanted]
+        while len(rows) < wanted:
+            rows.append(self.file_tree.insert("", tk.END))
+        
+        for offset, iid in enumerate(rows):
+            entry = self.listing[self.window_start + offset]
+            self.file_tree.item(iid, values=self._row_values(entry), tags=self._row_tags(entry))
+        
+        # Seçim satıra değil girdiye bağlıdır; pencere dışına çıkınca gizlenir
+        offset = None if self.selected_index is None else self.selected_index - self.window_start
+        if offset is not None and 0 <= offset < len(rows):
+            self.file_tree.selection_set(rows[offset])
+        else:
+            self.file_tree.selection_set(())
+        
+        if total:
+            self.vsb.set(self.window_start / total, (self.window_start + len(rows)) / total)
+        else:
+            self.vsb.set(0, 1)
+    
+    def _on_tree_yscroll(self, first, last):
+        # Sanal listede çubuğu _render_window ayarlar
+        if not self.virtual:
+            self.vsb.set(first, last)
+    
+    def _on_vscroll(self, *args):
+        if not self.virtual:
+            self.file_tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._render_window(int(float(args[1]) * len(self.listing)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.window_rows if args[2] == "pages" else 1)
+            self._render_window(self.window_start + step)
+    
+    def _on_wheel(self, direction):
+        if not self.virtual:
+            return None
+        self._render_window(self.window_start + direction * 3)
+        return "break"
+    
+    def _on_key_scroll(self, step):
+        """Sanal listede klavyeyle seçimi taşır, gerekirse pencereyi kaydırır"""
+        if not self.virtual:
+            return None
+        last = len(self.listing) - 1
+        current = self.window_start if self.selected_index is None else self.selected_index
+        if step == "home":
+            target = 0
+        elif step == "end":
+            target = last
+        elif step in ("page-", "page+"):
+            target = current + (self.window_rows if step == "page+" else -self.window_rows)
+        else:
+            target = current + step
+        self.selected_index = max(0, min(target, last))
+        
+        if self.selected_index < self.window_start:
+            self._render_window(self.selected_index)
+        elif self.selected_index >= self.window_start + self.window_rows:
+            self._render_window(self.selected_index - self.window_rows + 1)
+        else:
+            self._render_window()
+        return "break"
+    
+    def _on_tree_select(self, event):
+        selection = self.file_tree.selection()
+        if self.virtual and selection:
+            self.selected_index = self.window_start + self.file_tree.index(selection[0])
+    
+    def _on_tree_resize(self, event):
+        # Pencere boyu Treeview'e sığan satır sayısıdır (başlık satırı hariç)
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        rows = max(1, event.height // row_height - 1)
+        if rows != self.window_rows:
+            self.window_rows = rows
+            if self.virtual:
+                self._render_window()
+    
+    def _row_values(self, entry):
+        """(ad, tür, boyut, zaman) girdisini Treeview satırına çevirir"""
+        name, kind, size, mtime = entry
+        mod_time = self._format_time(int(mtime) // 60)
+        if kind == "d":
+            return (name, "<Klasör>", mod_time, "Klasör")
+        return (name, self._format_size(size), mod_time, self._get_file_type(name))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_time(minute):
+        # Tarih dakika çözünürlüğünde gösterildiği için aynı dakikadaki öğeler paylaşır
+        return datetime.fromtimestamp(minute * 60).strftime('%d.%m.%Y %H:%M')
     
     def _format_size(self, size_bytes):
         """Dosya boyutunu okunaklı formata dönüştürür"""
@@ -666,7 +1328,8 @@ class FileExplorer(ctk.CTkToplevel):
         else:
             return f"{size_bytes/(1024*1024*1024):.1f} GB"
     
-    def _get_file_type(self, filename):
+    @staticmethod
+    def _get_file_type(filename):
         """Dosya uzantısına göre türünü belirler"""
         _, ext = os.path.splitext(filename)
         
@@ -719,6 +1382,12 @@ class FileExplorer(ctk.CTkToplevel):
         ext = ext.lower()
         
         try:
+            stored_path = file_path
+            on_save = partial(self._file_saved, stored_path, stored_path)
+            if self.codec and self.codec.is_encoded(file_path):
+                file_path = self._decrypt_to_temp(stored_path)
+                on_save = partial(self._encrypt_back, file_path, stored_path)
+            
             # Resim dosyaları
             if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']:
                 ImageViewer(self, file_path)
@@ -729,7 +1398,7 @@ class FileExplorer(ctk.CTkToplevel):
             
             # Metin dosyaları
             elif ext in ['.txt', '.md', '.rtf', '.json', '.xml', '.html', '.css', '.js']:
-                TextEditor(self, file_path)
+                TextEditor(self, file_path, on_save=on_save)
             
             # Diğer dosyalar - sistem varsayılan uygulamasıyla aç
             else:
@@ -746,6 +1415,54 @@ class FileExplorer(ctk.CTkToplevel):
         except Exception as e:
             messagebox.showerror("Hata", f"Dosya açılamadı: {str(e)}")
     
+    def _decrypt_to_temp(self, stored_path):
+        """Saklanan dosyayı gezgine özel geçici dizine çözer"""
+        if self.temp_dir is None:
+            temp_root = os.path.join(self.master_app.app_data_dir, "tmp")
+            os.makedirs(temp_root, exist_ok=True)
+            self.temp_dir = tempfile.mkdtemp(dir=temp_root)
+        
+        rel_path = os.path.relpath(stored_path, self.folder_path)
+        temp_path = os.path.join(self.temp_dir, rel_path)
+        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+        self.codec.decode_file(stored_path, temp_path)
+        return temp_path
+    
+    def _encrypt_back(self, temp_path, stored_path):
+        """Düzenlenen geçici dosyayı yeniden kodlayıp gizli klasöre yazar"""
+        # Benzersiz geçici ad: klasördeki "<ad>.tmp" adlı bir dosyayı ezmez
+        fd, partial_path = tempfile.mkstemp(
+            prefix=os.path.basename(stored_path) + ".", suffix=".tmp", dir=os.path.dirname(stored_path)
+        )
+        os.close(fd)
+        try:
+            self.codec.encode_file(temp_path, partial_path)
+            os.replace(partial_path, stored_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        self._file_saved(stored_path, temp_path)
+    
+    def destroy(self):
+        self._cancel_listing()
+        if self.watch_poll is not None:
+            self.after_cancel(self.watch_poll)
+            self.watch_poll = None
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
+        
+        explorers = getattr(self.master_app, "explorers", None)
+        if explorers is not None and explorers.get(self.hidden_id) is self:
+            del explorers[self.hidden_id]
+        
+        # Çözülmüş geçici dosyaları temizle
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+        super().destroy()
+    
     def _go_back(self):
         """Geri düğmesi işlevi"""
         if self.current_path != self.folder_path:
@@ -764,17 +1481,33 @@ class FileExplorer(ctk.CTkToplevel):
             self._populate_files()
     
     def _refresh(self):
-        """Mevcut klasörü yenile"""
+        """Mevcut klasörü yenile (manifest diskten yeniden kurulur)"""
+        # Yenileme önbelleği atlar: dizin zamanı değişmeden büyüyen dosyalar da görünür
+        cache = getattr(self.master_app, "listing_cache", None)
+        if cache is not None:
+            cache.discard(self._cache_key())
+        if self.manifest is not None:
+            try:
+                self._reindex(self.manifest)
+                self._manifest_changed()
+            except Exception as e:
+                messagebox.showerror("Hata", f"Klasör taranamadı: {str(e)}")
         self._populate_files()
     
     def _create_folder(self):
         """Yeni klasör oluştur"""
-        folder_name = simpledialog_askstring("Yeni Klasör", "Klasör adı:")
-        if folder_name:
+        folder_name = simpledialog.askstring("Yeni Klasör", "Klasör adı:", parent=self)
+        if folder_name and not self._valid_name(folder_name):
+            messagebox.showerror("Hata", "Geçersiz klasör adı.")
+        elif folder_name:
             try:
                 new_folder_path = os.path.join(self.current_path, folder_name)
                 os.makedirs(new_folder_path)
-                self._refresh()
+                if self.manifest is not None:
+                    mtime = int(os.stat(new_folder_path).st_mtime)
+                    self.manifest.put(self._rel_path(new_folder_path), {"t": "d", "s": 0, "m": mtime})
+                    self._manifest_changed()
+                self._populate_files()
             except Exception as e:
                 messagebox.showerror("Hata", f"Klasör oluşturulamadı: {str(e)}")
     
@@ -783,6 +1516,11 @@ class FileExplorer(ctk.CTkToplevel):
         # Tıklanan öğeyi seç
         item = self.file_tree.identify_row(event.y)
         if not item:
+            # Boş alanda yalnızca yapıştırma sunulur
+            if getattr(self.master_app, "explorer_clipboard", None):
+                context_menu = tk.Menu(self, tearoff=0)
+                context_menu.add_command(label="Yapıştır", command=self._paste)
+                context_menu.tk_popup(event.x_root, event.y_root)
             return
         
         # Öğeyi seç
@@ -804,22 +1542,39 @@ class FileExplorer(ctk.CTkToplevel):
             context_menu.add_command(label="Yeniden Adlandır", command=lambda: self._rename_item(item_path))
             context_menu.add_command(label="Sil", command=lambda: self._delete_item(item_path))
         
+        context_menu.add_separator()
+        context_menu.add_command(label="Kopyala", command=lambda: self._copy_item(item_path, cut=False))
+        context_menu.add_command(label="Kes", command=lambda: self._copy_item(item_path, cut=True))
+        if getattr(self.master_app, "explorer_clipboard", None):
+            context_menu.add_command(label="Yapıştır", command=self._paste)
+        
         # Menüyü göster
         context_menu.tk_popup(event.x_root, event.y_root)
     
     def _rename_item(self, item_path):
         """Dosya veya klasör yeniden adlandırma"""
         old_name = os.path.basename(item_path)
-        new_name = simpledialog_askstring("Yeniden Adlandır", "Yeni ad:", initialvalue=old_name)
+        new_name = simpledialog.askstring("Yeniden Adlandır", "Yeni ad:", initialvalue=old_name, parent=self)
         
-        if new_name and new_name != old_name:
+        if new_name and not self._valid_name(new_name):
+            messagebox.showerror("Hata", "Geçersiz ad.")
+        elif new_name and new_name != old_name:
             try:
                 new_path = os.path.join(os.path.dirname(item_path), new_name)
                 os.rename(item_path, new_path)
-                self._refresh()
+                if self.manifest is not None:
+                    self.manifest.rename_tree(self._rel_path(item_path), self._rel_path(new_path))
+                    self._manifest_changed()
+                self._populate_files()
             except Exception as e:
                 messagebox.showerror("Hata", f"Yeniden adlandırılamadı: {str(e)}")
     
+    @staticmethod
+    def _valid_name(name):
+        # Ad tek bir yol bileşeni olmalı; aksi hâlde manifest ile disk ayrışır
+        separators = [os.sep] + ([os.altsep] if os.altsep else [])
+        return name not in (".", "..") and not any(sep in name for sep in separators)
+    
     def _delete_item(self, item_path):
         """Dosya veya klasör silme"""
         name = os.path.basename(item_path)
@@ -835,10 +1590,222 @@ class FileExplorer(ctk.CTkToplevel):
                     shutil.rmtree(item_path)
                 else:
                     os.remove(item_path)
-                self._refresh()
+                if self.manifest is not None:
+                    self.manifest.remove_tree(self._rel_path(item_path))
+                    self._manifest_changed()
+                self._populate_files()
             except Exception as e:
                 messagebox.showerror("Hata", f"Silinemedi: {str(e)}")
 
+    def _copy_selected(self, cut):
+        selection = self.file_tree.selection()
+        if selection:
+            name = self.file_tree.item(selection[0], "values")[0]
+            self._copy_item(os.path.join(self.current_path, name), cut)
+    
+    def _copy_item(self, item_path, cut):
+        """Öğeyi kopyalamak ya da taşımak için uygulama panosuna alır"""
+        self.master_app.explorer_clipboard = {
+            "op": "move" if cut else "copy",
+            "folder_id": self.hidden_id,
+            "root": self.folder_path,
+            "path": item_path
+        }
+        action = "taşınmak" if cut else "kopyalanmak"
+        self.status_label.configure(text=f"'{os.path.basename(item_path)}' {action} üzere panoya alındı")
+    
+    def _paste_target(self, src_path):
+        """Geçerli dizinde çakışmayan hedef yol ("ad (2).uzantı" biçiminde)"""
+        name = os.path.basename(src_path)
+        target = os.path.join(self.current_path, name)
+        stem, ext = os.path.splitext(name) if os.path.isfile(src_path) else (name, "")
+        counter = 2
+        while os.path.lexists(target):
+            target = os.path.join(self.current_path, f"{stem} ({counter}){ext}")
+            counter += 1
+        return target
+    
+    def _paste(self):
+        """Panodaki öğeyi geçerli dizine kopyalar ya da taşır
+
+        Aynı kodlamayı (şifreleme anahtarı ve sıkıştırma) kullanan klasörler
+        arasında taşıma anlık bir rename'dir; diğer durumlarda dosyalar
+        ParallelCopier ile paralel kopyalanır, kodlamalar farklıysa her dosya
+        kaynağın codec'iyle çözülüp hedefinkiyle yeniden kodlanır. İş arka
+        planda çalışır, ilerleme durum satırında gösterilir.
+        """
+        app = self.master_app
+        clip = getattr(app, "explorer_clipboard", None)
+        if not clip or self.hidden_id is None:
+            return
+        if self.paste_job is not None:
+            messagebox.showwarning("Uyarı", "Önceki yapıştırma işlemi devam ediyor.")
+            return
+        
+        src_path = clip["path"]
+        src_id = clip["folder_id"]
+        src_info = app.hidden_folders.get(src_id)
+        dst_info = app.hidden_folders.get(self.hidden_id)
+        if src_info is None or dst_info is None or not os.path.lexists(src_path):
+            app.explorer_clipboard = None
+            messagebox.showerror("Hata", "Panodaki öğe artık mevcut değil.")
+            return
+        if src_id in app.busy_folder_ids or self.hidden_id in app.busy_folder_ids:
+            messagebox.showwarning("Uyarı", "Klasör üzerinde devam eden bir işlem var.")
+            return
+        
+        move = clip["op"] == "move"
+        same_folder = src_id == self.hidden_id
+        if os.path.isdir(src_path) and not os.path.islink(src_path) and same_folder and (
+                os.path.commonpath([src_path, self.current_path]) == src_path):
+            messagebox.showerror("Hata", "Bir klasör kendi içine yapıştırılamaz.")
+            return
+        if move and same_folder and os.path.dirname(src_path) == self.current_path:
+            return  # Zaten burada
+        
+        dst_path = self._paste_target(src_path)
+        encoding = lambda info: (info.get("content_key"), (info.get("compression") or {}).get("algo"))
+        same_codec = same_folder or encoding(src_info) == encoding(dst_info)
+        method = "rename" if move and same_codec and app.mover.same_device(src_path, dst_path) else "copy"
+        
+        src_codec = VaultCodec.from_record(src_info)
+        dst_codec = self.codec
+        dedup_target = bool(dst_info.get("dedup"))
+        src_explorer = getattr(app, "explorers", {}).get(src_id)
+        src_manifest = src_explorer.manifest if src_explorer else None
+        if src_manifest is None and not same_folder:
+            try:
+                src_manifest = FolderManifest.for_folder(app.hidden_dir, src_id, app._session_cipher()).load()
+            except Exception:
+                src_manifest = None
+        if same_folder:
+            src_manifest = self.manifest
+        src_rel = os.path.relpath(src_path, clip["root"])
+        moved_entries = src_manifest.subtree(src_rel) if src_manifest is not None else None
+        
+        def transcode(src, dst, job=None):
+            # Kaynağın codec'iyle akış hâlinde çöz, hedefinkiyle kodla (geçici dosya yok)
+            if dst_codec:
+                dst_codec.transcode_file(src, dst, src_codec, job)
+            elif src_codec and src_codec.is_encoded(src):
+                src_codec.decode_file(src, dst, job)
+            else:
+                if job:
+                    job.check_cancelled()
+                shutil.copy2(src, dst)
+                if job:
+                    job.advance(os.path.getsize(dst), 1)
+        
+        def work(job):
+            try:
+                if method == "rename":
+                    job.set_total(0, 1)
+                    os.rename(src_path, dst_path)
+                    job.advance(0, 1)
+                    if not same_folder and not dedup_target and moved_entries:
+                        # Ortak depoya bağlı dosyalar tekilleştirmesiz klasöre
+                        # geçerken kendi kopyalarına ayrılır
+                        linked = FolderManifest(None, None)
+                        linked.put_tree(os.path.basename(dst_path), moved_entries)
+                        app.store.materialize_tree(os.path.dirname(dst_path), linked)
+                    return
+                
+                file_func = app.copier.copy_file if same_codec else transcode
+                if os.path.isdir(src_path) and not os.path.islink(src_path):
+                    app.copier.copy_tree(src_path, dst_path, job, file_func=file_func)
+                elif os.path.islink(src_path):
+                    os.symlink(os.readlink(src_path), dst_path)
+                else:
+                    job.set_total(os.path.getsize(src_path), 1)
+                    file_func(src_path, dst_path, job)
+            except BaseException:
+                # Yarım kalan kopyayı geri al; kaynak yerinde durur
+                if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                    shutil.rmtree(dst_path, ignore_errors=True)
+                elif os.path.lexists(dst_path):
+                    os.remove(dst_path)
+                raise
+            
+            if move:
+                if os.path.isdir(src_path) and not os.path.islink(src_path):
+                    shutil.rmtree(src_path)
+                else:
+                    os.remove(src_path)
+        
+        busy = {src_id, self.hidden_id}
+        app.busy_folder_ids.update(busy)
+        
+        def finish(job):
+            self.paste_job = None
+            app.busy_folder_ids.difference_update(busy)
+            if job.state == "hata":
+                messagebox.showerror("Hata", f"Yapıştırılamadı: {str(job.error)}")
+            elif job.state == "tamamlandı":
+                self._pasted(src_manifest, src_rel, src_id, src_explorer, dst_path,
+                             moved_entries, keep_links=method == "rename" and (same_folder or dedup_target),
+                             move=move)
+                if move:
+                    app.explorer_clipboard = None
+            if not self.winfo_exists():
+                return
+            self._populate_files()
+            if job.state == "tamamlandı":
+                self.status_label.configure(text=f"'{os.path.basename(dst_path)}' yapıştırıldı")
+            elif job.state == "iptal":
+                self.status_label.configure(text="Yapıştırma iptal edildi")
+        
+        title = f"{'Taşınıyor' if move else 'Kopyalanıyor'}: {os.path.basename(src_path)}"
+        self.paste_job = Job(title, work, on_done=finish, on_error=finish)
+        app.jobs.submit(self.paste_job)
+        self._show_paste_progress()
+    
+    def _show_paste_progress(self):
+        # Liste donmadan ilerlemeyi durum satırında göster
+        job = self.paste_job
+        if job is None or not self.winfo_exists():
+            return
+        self.status_label.configure(text=f"{job.title} (%{job.fraction() * 100:.0f})")
+        self.after(200, self._show_paste_progress)
+    
+    def _pasted(self, src_manifest, src_rel, src_id, src_explorer, dst_path, moved_entries,
+                keep_links, move):
+        """Yapıştırma bitince kaynak ve hedef manifestlerini günceller"""
+        app = self.master_app
+        
+        if self.manifest is not None:
+            if moved_entries is None:
+                # Kaynağın manifesti yoksa hedef ağaç taranır
+                index = FolderStats.scan(dst_path, keep_index=True).index if os.path.isdir(dst_path) else {}
+                st = os.lstat(dst_path)
+                moved_entries = {"": {"t": "d" if os.path.isdir(dst_path) else "f",
+                                      "s": 0 if os.path.isdir(dst_path) else st.st_size,
+                                      "m": int(st.st_mtime)}}
+                moved_entries.update(index)
+            entries = {}
+            for suffix, fields in moved_entries.items():
+                fields = dict(fields)
+                if not keep_links:
+                    # Kopyalar ortak depoya bağlı değildir
+                    fields.pop("h", None)
+                entries[suffix] = fields
+            
+            if move and src_manifest is self.manifest:
+                self.manifest.remove_tree(src_rel)
+            self.manifest.put_tree(self._rel_path(dst_path), entries)
+            self._manifest_changed()
+        
+        if move and src_id != self.hidden_id and src_manifest is not None:
+            src_manifest.remove_tree(src_rel)
+            if src_explorer is not None and src_explorer.winfo_exists():
+                src_explorer._manifest_changed()
+                src_explorer._populate_files()
+            else:
+                src_manifest.save()
+                src_info = app.hidden_folders.get(src_id)
+                if src_info is not None:
+                    src_info.update(FolderStats.from_index(src_manifest.entries).to_record())
+                    app.save_hidden_folders()
+
 class PrivateBrowser(ctk.CTkToplevel):
     def __init__(self, master):
         super().__init__(master)
@@ -998,94 +1965,2963 @@ class PrivateBrowser(ctk.CTkToplevel):
         else:
             self.status_bar.configure(text=f"Yükleme hatası: {self.url_var.get()}")
 
-class FolderHiderApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Klasör Gizleme Uygulaması")
-        self.root.geometry("1000x700")
-        self.root.minsize(800, 600)
+class BatchHideDialog(ctk.CTkToplevel):
+    """Toplu gizleme için klasör listesi hazırlama penceresi"""
+
+    def __init__(self, master, theme, on_confirm):
+        super().__init__(master)
+        self.title("Toplu Klasör Gizleme")
+        self.geometry("600x450")
+        self.minsize(500, 350)
         
-        # Tema seçimi
-        self.themes = {
-            "Açık": ModernTheme.Light,
-            "Koyu": ModernTheme.Dark,
-            "Neon Koyu": ModernTheme.NeonDark,
-            "Orman": ModernTheme.Forest,
-            "Okyanus": ModernTheme.Ocean
-        }
+        self.theme = theme
+        self.on_confirm = on_confirm
+        self.folder_paths = []
+        self.configure(fg_color=self.theme.bg_primary)
         
-        # Varsayılan temayı ayarla
-        self.current_theme = "Koyu"
-        self.theme = self.themes[self.current_theme]
+        # Ana çerçeve
+        main_frame = ctk.CTkFrame(self, fg_color=self.theme.bg_primary)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # CustomTkinter ayarları
-        ctk.set_appearance_mode("dark" if "Dark" in self.current_theme else "light")
-        ctk.set_default_color_theme("blue")
+        # Üst buton çubuğu
+        button_frame = ctk.CTkFrame(main_frame, fg_color=self.theme.bg_secondary)
+        button_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Uygulama verilerinin saklanacağı dizin
-        self.app_data_dir = os.path.join(os.getenv('APPDATA') or os.path.expanduser('~/.config'), 'FolderHider')
-        if not os.path.exists(self.app_data_dir):
-            os.makedirs(self.app_data_dir)
-            
-        self.config_file = os.path.join(self.app_data_dir, "hidden_folders.dat")
-        self.settings_file = os.path.join(self.app_data_dir, "settings.json")
-        self.hidden_dir = os.path.join(self.app_data_dir, "hidden")
-        if not os.path.exists(self.hidden_dir):
-            os.makedirs(self.hidden_dir)
-            
-        self.salt = b'klasorgizle_salt_456789'  # Daha güçlü salt değeri
-        self.hidden_folders = {}
-        self.current_password = None
-        self.is_authenticated = False
+        self.add_btn = ctk.CTkButton(
+            button_frame, text="➕ Klasör Ekle", command=self._add_folder,
+            fg_color=self.theme.accent, hover_color=self.theme.accent_hover,
+            text_color="#FFFFFF", width=110
+        )
+        self.add_btn.pack(side=tk.LEFT, padx=5, pady=5)
         
-        # Ayarları yükle
-        self.settings = self._load_settings()
+        # Bir üst klasördeki tüm alt klasörleri tek seferde ekle
+        self.add_children_btn = ctk.CTkButton(
+            button_frame, text="📂 Alt Klasörleri Ekle", command=self._add_subfolders,
+            fg_color=self.theme.accent, hover_color=self.theme.accent_hover,
+            text_color="#FFFFFF", width=150
+        )
+        self.add_children_btn.pack(side=tk.LEFT, padx=5, pady=5)
         
-        # Tema ayarını uygula
-        if "theme" in self.settings:
-            self.current_theme = self.settings["theme"]
-            self.theme = self.themes[self.current_theme]
+        self.remove_btn = ctk.CTkButton(
+            button_frame, text="➖ Kaldır", command=self._remove_selected,
+            fg_color=self.theme.error, hover_color="#D32F2F",
+            text_color="#FFFFFF", width=80
+        )
+        self.remove_btn.pack(side=tk.LEFT, padx=5, pady=5)
         
-        # UI kurulumu
-        self.setup_ui()
-        self.check_first_run()
+        # Seçilen klasörler
+        self.listbox = tk.Listbox(
+            main_frame,
+            bg=self.theme.bg_secondary,
+            fg=self.theme.text_primary,
+            selectbackground=self.theme.accent,
+            selectforeground="#FFFFFF",
+            selectmode=tk.EXTENDED,
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.listbox.pack(fill=tk.BOTH, expand=True)
         
-    def _load_settings(self):
-        """Kullanıcı ayarlarını yükle"""
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {"theme": "Koyu"}
-        return {"theme": "Koyu"}
-    
-    def _save_settings(self):
-        """Kullanıcı ayarlarını kaydet"""
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f)
-        except Exception as e:
-            print(f"Ayarlar kaydedilemedi: {str(e)}")
-    
-    def setup_ui(self):
-        # Ana çerçeveler
-        self.login_frame = ctk.CTkFrame(self.root)
-        self.main_frame = ctk.CTkFrame(self.root)
+        # Alt çubuk
+        bottom_frame = ctk.CTkFrame(main_frame, fg_color=self.theme.bg_primary)
+        bottom_frame.pack(fill=tk.X, pady=(10, 0))
         
-        # Login çerçevesi
-        login_header = ctk.CTkLabel(
-            self.login_frame, 
-            text="Klasör Gizleme Uygulaması", 
-            font=ctk.CTkFont(size=24, weight="bold")
+        self.count_label = ctk.CTkLabel(
+            bottom_frame, text="0 klasör seçildi", text_color=self.theme.text_secondary
         )
-        login_header.pack(pady=(40, 20))
-        
-        # Logo veya ikon (burada bir metin olarak temsil edildi)
-        logo_frame = ctk.CTkFrame(self.login_frame, fg_color="transparent")
-        logo_frame.pack(pady=(0, 30))
+        self.count_label.pack(side=tk.LEFT)
         
-        logo_text = ctk.CTkLabel(
+        self.hide_btn = ctk.CTkButton(
+            bottom_frame, text="🔒 Gizle", command=self._confirm,
+            fg_color=self.theme.accent, hover_color=self.theme.accent_hover,
+            text_color="#FFFFFF", width=100
+        )
+        self.hide_btn.pack(side=tk.RIGHT, padx=5)
+        
+        self.cancel_btn = ctk.CTkButton(
+            bottom_frame, text="✖ Vazgeç", command=self.destroy,
+            fg_color=self.theme.error, hover_color="#D32F2F",
+            text_color="#FFFFFF", width=100
+        )
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
+        
+        self.transient(master)
+        self.grab_set()
+    
+    def _add_paths(self, paths):
+        for path in paths:
+            if path not in self.folder_paths:
+                self.folder_paths.append(path)
+                self.listbox.insert(tk.END, path)
+        self.count_label.configure(text=f"{len(self.folder_paths)} klasör seçildi")
+    
+    def _add_folder(self):
+        folder_path = filedialog.askdirectory(parent=self, title="Gizlenecek Klasörü Seçin")
+        if folder_path:
+            self._add_paths([folder_path])
+    
+    def _add_subfolders(self):
+        parent_path = filedialog.askdirectory(parent=self, title="Alt Klasörleri Eklenecek Klasörü Seçin")
+        if not parent_path:
+            return
+        try:
+            with os.scandir(parent_path) as it:
+                paths = sorted(
+                    entry.path for entry in it if entry.is_dir(follow_symlinks=False)
+                )
+        except OSError as e:
+            messagebox.showerror("Hata", f"Klasör okunamadı: {str(e)}", parent=self)
+            return
+        self._add_paths(paths)
+    
+    def _remove_selected(self):
+        for index in reversed(self.listbox.curselection()):
+            self.listbox.delete(index)
+            del self.folder_paths[index]
+        self.count_label.configure(text=f"{len(self.folder_paths)} klasör seçildi")
+    
+    def _confirm(self):
+        if not self.folder_paths:
+            messagebox.showerror("Hata", "Lütfen en az bir klasör ekleyin.", parent=self)
+            return
+        folder_paths = list(self.folder_paths)
+        self.destroy()
+        self.on_confirm(folder_paths)
+
+class JobCancelled(Exception):
+    """Kullanıcı devam eden işi iptal ettiğinde fırlatılır"""
+
+class Job:
+    """Arka planda çalışan tek bir ağır işlem ve ilerleme bilgisi"""
+
+    FINISHED = ("tamamlandı", "iptal", "hata")
+
+    def __init__(self, title, func, on_done=None, on_error=None):
+        self.title = title
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+
+        self.state = "bekliyor"  # bekliyor, çalışıyor, tamamlandı, iptal, hata
+        self.result = None
+        self.error = None
+
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.files_done = 0
+        self.files_total = 0
+
+        # Toplu işlerde her öğenin kendi ilerlemesi olur (bkz. child)
+        self.children = []
+
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def child(self, title):
+        """Eşzamanlı çalışan bir öğe için ayrı sayaçlı alt iş oluşturur
+
+        Alt işler birbirinin toplamlarını sıfırlamaz; üst iş iptal edilince
+        hepsi iptal edilir, bir alt işin iptali ise diğerlerini etkilemez.
+        """
+        child = Job(title, None)
+        with self._lock:
+            self.children.append(child)
+        if self.cancel_event.is_set():
+            child.cancel()
+        return child
+
+    def finished_children(self):
+        """Bitmiş (başarılı, iptal ya da hatalı) alt iş sayısı"""
+        with self._lock:
+            return sum(1 for child in self.children if child.state in self.FINISHED)
+
+    def set_total(self, nbytes, nfiles):
+        """Yeni bir aşamanın toplamlarını ayarlar ve sayaçları sıfırlar"""
+        with self._lock:
+            self.bytes_total = nbytes
+            self.files_total = nfiles
+            self.bytes_done = 0
+            self.files_done = 0
+
+    def advance(self, nbytes=0, nfiles=0):
+        """İlerlemeyi artırır ve iptal istenmişse işi durdurur"""
+        with self._lock:
+            self.bytes_done += nbytes
+            self.files_done += nfiles
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def cancel(self):
+        self.cancel_event.set()
+        with self._lock:
+            children = list(self.children)
+        for child in children:
+            child.cancel()
+
+    def fraction(self):
+        """0-1 arası tamamlanma oranı"""
+        with self._lock:
+            children = list(self.children)
+            if children:
+                # Biten öğeler tam, çalışanlar kendi oranlarıyla sayılır
+                done = sum(1 for child in children if child.state in self.FINISHED)
+                running = sum(child.fraction() for child in children if child.state == "çalışıyor")
+                total = max(self.files_total, len(children))
+                return min((done + running) / total, 1.0)
+            if self.bytes_total:
+                return min(self.bytes_done / self.bytes_total, 1.0)
+            if self.files_total:
+                return min(self.files_done / self.files_total, 1.0)
+            return 0.0
+
+class JobManager:
+    """İşleri sırayla iş parçacığında çalıştırır, sonuçları Tk ana döngüsüne taşır"""
+
+    def __init__(self, root, on_update=None, poll_interval=100):
+        self.root = root
+        self.on_update = on_update
+        self.poll_interval = poll_interval
+
+        self.current = None
+        self.pending = []
+        self._queue = queue.Queue()
+        self._finished = queue.Queue()
+        self._lock = threading.Lock()
+
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        self.root.after(self.poll_interval, self._poll)
+
+    def submit(self, job):
+        """İşi kuyruğa ekler"""
+        with self._lock:
+            self.pending.append(job)
+        self._queue.put(job)
+        return job
+
+    def cancel(self, job=None):
+        """Verilen işi, verilmezse çalışan işi iptal eder"""
+        job = job or self.current
+        if job:
+            job.cancel()
+
+    def cancel_all(self):
+        with self._lock:
+            jobs = list(self.pending)
+            if self.current:
+                jobs.append(self.current)
+        for job in jobs:
+            job.cancel()
+
+    def is_busy(self):
+        with self._lock:
+            return self.current is not None or bool(self.pending)
+
+    def _run(self):
+        # İş parçacığı: Tk nesnelerine asla dokunmaz
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                self.pending.remove(job)
+                self.current = job
+
+            if job.cancel_event.is_set():
+                job.state = "iptal"
+            else:
+                job.state = "çalışıyor"
+                try:
+                    job.result = job.func(job)
+                    job.state = "tamamlandı"
+                except JobCancelled:
+                    job.state = "iptal"
+                except Exception as e:
+                    job.error = e
+                    job.state = "hata"
+
+            with self._lock:
+                self.current = None
+            self._finished.put(job)
+
+    def _poll(self):
+        # Ana döngü: biten işlerin geri çağrılarını çalıştır
+        while True:
+            try:
+                job = self._finished.get_nowait()
+            except queue.Empty:
+                break
+
+            callback = job.on_done if job.state == "tamamlandı" else job.on_error
+            if callback:
+                try:
+                    callback(job)
+                except Exception as e:
+                    print(f"İş geri çağrısı başarısız: {str(e)}")
+
+        if self.on_update:
+            self.on_update(self)
+
+        self.root.after(self.poll_interval, self._poll)
+
+class ContentCipher:
+    """Gizli dosya içerikleri için akış tabanlı, parçalı AES-GCM kapsayıcısı
+
+    Biçim: başlık (MAGIC, sürüm, parça boyutu, 16 bayt tuz) ve ardından her biri
+    kendi etiketiyle şifrelenmiş parçalar. Her dosyanın anahtarı klasör
+    anahtarından tuz ile HKDF ile türetilir; nonce parça sırasını ve son parça
+    bayrağını içerdiğinden parçalar yer değiştiremez, dosya kesilemez. Bellek
+    kullanımı dosya boyutundan bağımsız olarak iki parça ile sınırlıdır.
+    """
+
+    MAGIC = b"FHENC"
+    VERSION = 1
+    SEGMENT_SIZE = 1024 * 1024  # 1 MB
+    HEADER = struct.Struct(">5sBI16s")
+    TAG_SIZE = 16
+
+    def __init__(self, key):
+        self.key = key
+
+    @staticmethod
+    def generate_key():
+        """Yeni rastgele klasör anahtarı (urlsafe base64 metin)"""
+        return base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256)).decode()
+
+    @classmethod
+    def from_record(cls, folder_info):
+        """Klasör kaydındaki anahtarla şifreleyici oluşturur; şifresiz kayıtlar için None"""
+        key = folder_info.get("content_key") if folder_info else None
+        return cls(base64.urlsafe_b64decode(key)) if key else None
+
+    @classmethod
+    def is_encrypted(cls, path):
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(cls.MAGIC)) == cls.MAGIC
+        except OSError:
+            return False
+
+    def _file_aead(self, salt):
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            info=b"FolderHider content v1",
+        )
+        return AESGCM(hkdf.derive(self.key))
+
+    @staticmethod
+    def _nonce(index, final):
+        return struct.pack(">QI", index, 1 if final else 0)
+
+    def encrypt_stream(self, fsrc, fdst, job=None):
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.SEGMENT_SIZE, os.urandom(16))
+        aead = self._file_aead(header[-16:])
+        fdst.write(header)
+
+        index = 0
+        chunk = fsrc.read(self.SEGMENT_SIZE)
+        while True:
+            # Son parçayı işaretleyebilmek için bir sonrakini önceden oku
+            next_chunk = fsrc.read(self.SEGMENT_SIZE) if chunk else b""
+            final = not next_chunk
+            fdst.write(aead.encrypt(self._nonce(index, final), chunk, header))
+            if job:
+                job.advance(len(chunk))
+            if final:
+                break
+            chunk = next_chunk
+            index += 1
+
+    def decrypt_stream(self, fsrc, fdst, job=None):
+        for plain in self.decrypt_chunks(fsrc):
+            fdst.write(plain)
+            if job:
+                job.advance(len(plain))
+
+    def decrypt_chunks(self, fsrc):
+        """Şifreli akışı doğrulanmış düz parçalar olarak üretir"""
+        header = fsrc.read(self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            raise ValueError("Şifreli dosya başlığı eksik")
+        magic, version, segment_size, salt = self.HEADER.unpack(header)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Desteklenmeyen şifreli dosya biçimi")
+        aead = self._file_aead(salt)
+
+        stored_size = segment_size + self.TAG_SIZE
+        index = 0
+        chunk = fsrc.read(stored_size)
+        while True:
+            next_chunk = fsrc.read(stored_size)
+            final = not next_chunk
+            yield aead.decrypt(self._nonce(index, final), chunk, header)
+            if final:
+                break
+            chunk = next_chunk
+            index += 1
+
+class ContentCompressor:
+    """Gizlenen dosyalar için türe duyarlı akış sıkıştırması
+
+    Sıkıştırmalı klasörlerdeki her dosya MAGIC, sürüm ve algoritma
+    kimliğinden oluşan bir başlıkla başlar. Zaten sıkıştırılmış türler
+    (resim, video, ses, arşiv) ve çok küçük dosyalar "stored" (0) olarak
+    olduğu gibi yazılır. Sıkıştırma çıktısı belirleyici olduğundan
+    tekilleştirme ile birlikte kullanılabilir.
+    """
+
+    MAGIC = b"FHZ"
+    VERSION = 1
+    HEADER = struct.Struct(">3sBB")
+    ALGORITHMS = {"stored": 0, "zlib": 1, "lzma": 2, "zstd": 3}
+    SKIP_TYPES = {"Resim", "Video", "Ses", "Arşiv"}
+    MIN_SIZE = 1024
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, algorithm="zlib"):
+        if algorithm not in self.available():
+            raise ValueError(f"Sıkıştırma algoritması kullanılamıyor: {algorithm}")
+        self.algorithm = algorithm
+
+        # Klasör başına oran ve hız istatistikleri
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available():
+        algorithms = ["zlib", "lzma"]
+        if zstandard is not None:
+            algorithms.append("zstd")
+        return algorithms
+
+    def should_compress(self, path, size):
+        return (size >= self.MIN_SIZE
+                and FileExplorer._get_file_type(os.path.basename(path)) not in self.SKIP_TYPES)
+
+    def _compressor(self, algorithm):
+        if algorithm == "zlib":
+            return zlib.compressobj(6)
+        if algorithm == "lzma":
+            return lzma.LZMACompressor(preset=6)
+        return zstandard.ZstdCompressor(level=3).compressobj()
+
+    def _decompressor(self, algorithm_id):
+        if algorithm_id == self.ALGORITHMS["zlib"]:
+            return zlib.decompressobj()
+        if algorithm_id == self.ALGORITHMS["lzma"]:
+            return lzma.LZMADecompressor()
+        if algorithm_id == self.ALGORITHMS["zstd"]:
+            if zstandard is None:
+                raise ValueError("zstd ile sıkıştırılmış dosya için zstandard paketi gerekli")
+            return zstandard.ZstdDecompressor().decompressobj()
+        raise ValueError(f"Bilinmeyen sıkıştırma algoritması: {algorithm_id}")
+
+    def compress_chunks(self, fsrc, path, job=None, size=None):
+        """Dosyayı başlık + (sıkıştırılmış) veri parçaları olarak üretir
+
+        Kaynak dosya değil de bir akışsa (ör. başka codec'le çözülen içerik)
+        boyut tahmini size ile verilir.
+        """
+        if size is None:
+            size = os.fstat(fsrc.fileno()).st_size
+        algorithm = self.algorithm if self.should_compress(path, size) else "stored"
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.ALGORITHMS[algorithm])
+        yield header
+
+        compressor = self._compressor(algorithm) if algorithm != "stored" else None
+        raw = stored = 0
+        while True:
+            chunk = fsrc.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            raw += len(chunk)
+            out = compressor.compress(chunk) if compressor else chunk
+            stored += len(out)
+            if job:
+                job.advance(len(chunk))
+            if out:
+                yield out
+
+        if compressor:
+            out = compressor.flush()
+            stored += len(out)
+            if out:
+                yield out
+
+        with self._lock:
+            self.raw_bytes += raw
+            self.stored_bytes += stored + len(header)
+
+    def compressing_reader(self, fsrc, path, job=None, size=None):
+        """compress_chunks çıktısını read(n) ile okunabilir dosya nesnesine sarar"""
+        return io.BufferedReader(
+            _ChunkReader(self.compress_chunks(fsrc, path, job, size)), buffer_size=self.CHUNK_SIZE
+        )
+
+    def decompressing_writer(self, fdst, job=None):
+        """write() ile beslenen, çözdüğü veriyi fdst'ye yazan nesne"""
+        return _DecompressWriter(self, fdst, job)
+
+    def summary(self, seconds):
+        """Klasör kaydında saklanacak oran ve hız bilgisi"""
+        return {
+            "algo": self.algorithm,
+            "raw": self.raw_bytes,
+            "stored": self.stored_bytes,
+            "seconds": round(seconds, 3)
+        }
+
+class _ChunkReader(io.RawIOBase):
+    """Bayt parçası üreten bir yineleyiciyi okunabilir akışa çevirir"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buf = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buf:
+            try:
+                self._buf = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+class _DecompressWriter:
+    """Sıkıştırma başlığını okuyup gelen veriyi çözerek hedefe yazar"""
+
+    def __init__(self, compressor, fdst, job=None):
+        self.compressor = compressor
+        self.fdst = fdst
+        self.job = job
+        self._header = b""
+        self._decompressor = None
+        self._stored = False
+
+    def write(self, data):
+        if not self._stored and self._decompressor is None:
+            self._header += bytes(data)
+            size = ContentCompressor.HEADER.size
+            if len(self._header) < size:
+                return
+            magic, version, algorithm_id = ContentCompressor.HEADER.unpack(self._header[:size])
+            if magic != ContentCompressor.MAGIC or version != ContentCompressor.VERSION:
+                raise ValueError("Desteklenmeyen sıkıştırılmış dosya biçimi")
+            data = self._header[size:]
+            if algorithm_id == ContentCompressor.ALGORITHMS["stored"]:
+                self._stored = True
+            else:
+                self._decompressor = self.compressor._decompressor(algorithm_id)
+
+        out = data if self._stored else self._decompressor.decompress(data)
+        if out:
+            self.fdst.write(out)
+            if self.job:
+                self.job.advance(len(out))
+
+    def close(self):
+        if self._decompressor is not None and hasattr(self._decompressor, "flush"):
+            out = self._decompressor.flush()
+            if out:
+                self.fdst.write(out)
+        elif not self._stored and self._decompressor is None:
+            raise ValueError("Sıkıştırılmış dosya başlığı eksik")
+
+class VaultCodec:
+    """Klasör kaydına göre dosyaları sıkıştırıp şifreleyen ve geri çözen dosya işlevleri
+
+    encode_file/decode_file, ParallelCopier ve FolderMover için dosya işlevi
+    olarak kullanılır. Sıra: sıkıştırma, ardından şifreleme.
+    """
+
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, cipher=None, compressor=None):
+        self.cipher = cipher
+        self.compressor = compressor
+
+    @classmethod
+    def from_record(cls, folder_info, compressor=None):
+        """Kayda göre codec oluşturur; dönüştürme gerekmiyorsa None döndürür"""
+        cipher = ContentCipher.from_record(folder_info)
+        if compressor is None and folder_info and folder_info.get("compression"):
+            compressor = ContentCompressor(folder_info["compression"]["algo"])
+        if cipher is None and compressor is None:
+            return None
+        return cls(cipher, compressor)
+
+    def is_encoded(self, path):
+        """Dosyanın bu codec'in biçiminde saklanıp saklanmadığını başlığından anlar"""
+        if self.cipher:
+            return ContentCipher.is_encrypted(path)
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(ContentCompressor.MAGIC)) == ContentCompressor.MAGIC
+        except OSError:
+            return False
+
+    def encode_file(self, src, dst, job=None):
+        if job:
+            job.check_cancelled()
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            self._encode_stream(fsrc, fdst, src, job)
+        shutil.copystat(src, dst)
+        if job:
+            job.advance(0, 1)
+
+    def transcode_file(self, src, dst, source=None, job=None):
+        """source codec'iyle saklanan dosyayı bu codec'e çevirir
+
+        Çözülen içerik bellekte parça parça doğrudan yeniden kodlanır;
+        düz içerik hiçbir zaman diske (geçici dosyaya) yazılmaz.
+        """
+        if job:
+            job.check_cancelled()
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            if source is not None and source.is_encoded(src):
+                reader = source.decoding_reader(fsrc)
+                self._encode_stream(reader, fdst, src, job, size=os.fstat(fsrc.fileno()).st_size)
+            else:
+                self._encode_stream(fsrc, fdst, src, job)
+        shutil.copystat(src, dst)
+        if job:
+            job.advance(0, 1)
+
+    def _encode_stream(self, fsrc, fdst, path, job=None, size=None):
+        reader = fsrc
+        if self.compressor:
+            reader = self.compressor.compressing_reader(fsrc, path, job, size)
+        if self.cipher:
+            # İlerleme sıkıştırma varsa ham bayt üzerinden orada sayılır
+            self.cipher.encrypt_stream(reader, fdst, None if self.compressor else job)
+        else:
+            shutil.copyfileobj(reader, fdst, self.BUFFER_SIZE)
+
+    def decoding_chunks(self, fsrc):
+        """Saklanan akışın çözülmüş içeriğini parça parça üretir"""
+        if self.cipher:
+            chunks = self.cipher.decrypt_chunks(fsrc)
+        else:
+            chunks = iter(lambda: fsrc.read(self.BUFFER_SIZE), b"")
+        if not self.compressor:
+            yield from chunks
+            return
+
+        sink = io.BytesIO()
+        writer = self.compressor.decompressing_writer(sink)
+        for chunk in chunks:
+            writer.write(chunk)
+            if sink.tell():
+                yield sink.getvalue()
+                sink.seek(0)
+                sink.truncate()
+        writer.close()
+        if sink.tell():
+            yield sink.getvalue()
+
+    def decoding_reader(self, fsrc):
+        """decoding_chunks çıktısını read(n) ile okunabilir akışa sarar"""
+        return io.BufferedReader(_ChunkReader(self.decoding_chunks(fsrc)), buffer_size=self.BUFFER_SIZE)
+
+    def decode_file(self, src, dst, job=None):
+        if job:
+            job.check_cancelled()
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            writer = fdst
+            if self.compressor:
+                writer = self.compressor.decompressing_writer(fdst, job)
+            if self.cipher:
+                self.cipher.decrypt_stream(fsrc, writer, None if self.compressor else job)
+            else:
+                while True:
+                    chunk = fsrc.read(self.BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    writer.write(chunk)
+            if self.compressor:
+                writer.close()
+        shutil.copystat(src, dst)
+        if job:
+            job.advance(0, 1)
+
+class FolderStats:
+    """Klasör ağacı için tek geçişte toplanan boyut, sayı ve önizleme bilgisi"""
+
+    PREVIEW_LIMIT = 20  # Önizlemede gösterilecek en fazla dosya/klasör sayısı
+    PREVIEW_SCAN_LIMIT = 500  # Önizleme için en fazla bu kadar öğe okunur
+
+    def __init__(self, keep_entries=False, keep_index=False):
+        self.size = 0
+        self.file_count = 0
+        self.dir_count = 0
+        self.preview = []  # [tür, göreli yol] çiftleri, dolaşım sırasıyla
+        self.entries = {} if keep_entries else None  # göreli yol -> boyut (klasörler için None)
+        self.index = {} if keep_index else None  # göreli yol -> manifest alanları (bkz. FolderManifest)
+        self.details = {}  # Sonraki aşamaların kayda eklediği alanlar
+        self._preview_files = 0
+        self._preview_dirs = 0
+
+    @staticmethod
+    def walk(folder_path):
+        """Ağacı scandir ile yukarıdan aşağı dolaşır; ("d"|"l"|"f", göreli yol, DirEntry) üretir"""
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            subdirs = []
+            with os.scandir(os.path.join(folder_path, rel_dir)) as it:
+                for entry in it:
+                    rel_path = os.path.join(rel_dir, entry.name)
+                    if entry.is_symlink():
+                        yield "l", rel_path, entry
+                    elif entry.is_dir():
+                        yield "d", rel_path, entry
+                        subdirs.append(rel_path)
+                    else:
+                        yield "f", rel_path, entry
+            stack.extend(reversed(subdirs))
+
+    @classmethod
+    def scan(cls, folder_path, keep_entries=False, keep_index=False):
+        """Var olan bir klasör ağacının istatistiklerini çıkarır"""
+        stats = cls(keep_entries, keep_index)
+        for kind, rel_path, entry in cls.walk(folder_path):
+            stats.add(kind, rel_path, entry)
+        return stats
+
+    @classmethod
+    def preview_of(cls, folder_path):
+        """Önizleme listesini çıkarır; liste dolunca dolaşımı bırakır
+
+        Sayılar ve boyut toplanmaz (bkz. FolderStatsEngine). Dolaşım
+        okunan öğe sayısıyla da sınırlıdır: çok sayıda klasör ama az dosya
+        içeren ağaçlarda liste hiç dolmasa bile tüm ağaç gezilmez (her
+        açılan dizin okunan bir klasör öğesine karşılık gelir).
+        """
+        stats = cls()
+        for visited, (kind, rel_path, entry) in enumerate(cls.walk(folder_path), 1):
+            if kind == "d":
+                stats.add_dir(rel_path)
+            else:
+                stats.add_file(rel_path, 0)
+            if (stats._preview_files >= cls.PREVIEW_LIMIT
+                    or len(stats.preview) >= 2 * cls.PREVIEW_LIMIT
+                    or visited >= cls.PREVIEW_SCAN_LIMIT):
+                break
+        return stats.preview
+
+    @classmethod
+    def from_index(cls, index):
+        """Manifest girdilerinden (diske gitmeden) istatistik çıkarır"""
+        stats = cls()
+        for rel_path, fields in index.items():
+            if fields["t"] == "d":
+                stats.add_dir(rel_path)
+            else:
+                stats.add_file(rel_path, fields["s"])
+        return stats
+
+    def add(self, kind, rel_path, entry):
+        """walk() tarafından üretilen bir öğeyi istatistiklere ekler"""
+        st = entry.stat(follow_symlinks=False)
+        if self.index is not None:
+            self.index[rel_path] = {
+                "t": kind,
+                "s": 0 if kind == "d" else st.st_size,
+                "m": int(st.st_mtime)
+            }
+        if kind == "d":
+            self.add_dir(rel_path)
+        else:
+            self.add_file(rel_path, st.st_size)
+
+    def add_dir(self, rel_path):
+        self.dir_count += 1
+        if self.entries is not None:
+            self.entries[rel_path] = None
+        if self._preview_dirs < self.PREVIEW_LIMIT:
+            self._preview_dirs += 1
+            self.preview.append(["d", rel_path])
+
+    def add_file(self, rel_path, size):
+        self.file_count += 1
+        self.size += size
+        if self.entries is not None:
+            self.entries[rel_path] = size
+        if self._preview_files < self.PREVIEW_LIMIT:
+            self._preview_files += 1
+            self.preview.append(["f", rel_path])
+
+    def to_record(self):
+        """Klasör kaydında saklanacak alanlar"""
+        record = {
+            "size": self.size,
+            "file_count": self.file_count,
+            "dir_count": self.dir_count,
+            "preview": self.preview
+        }
+        record.update(self.details)
+        return record
+
+class ListingCache:
+    """Gezginin dizin listelerini anahtar başına LRU olarak saklar
+
+    Her kayıt bir damgayla doğrulanır: disk dizinlerinde dizinin
+    st_mtime_ns değeri, manifestli dizinlerde manifestin sürümü. Damga
+    değişince eski liste geçersiz olur, isabette dizin yeniden okunmaz.
+    Bütçe hem kayıt sayısı hem de yaklaşık bellek boyu ile sınırlanır;
+    aşılınca en uzun süredir kullanılmayan listeler atılır.
+    """
+
+    # Girdi başına yaklaşık bellek (demet, sayılar ve ad nesnesi)
+    ENTRY_OVERHEAD = 160
+    # Zamanı bu kadar yeni olan dizin saklanmaz: aynı zaman dilimi içindeki
+    # bir değişiklik st_mtime_ns'yi değiştirmeyebilir
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items = OrderedDict()  # anahtar -> (damga, girdiler, boyut)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def settled(cls, mtime_ns):
+        """Dizin zamanı damga olarak kullanılabilecek kadar eski mi"""
+        return time.time_ns() - mtime_ns >= cls.RACY_NS
+
+    def get(self, key, stamp):
+        """Damgası tutan listeyi döndürür, yoksa ya da eskimişse None"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] != stamp:
+                self._drop(key)
+                return None
+            self._items.move_to_end(key)
+            return item[1]
+
+    def put(self, key, stamp, entries):
+        cost = len(entries) * self.ENTRY_OVERHEAD + sum(len(entry[0]) for entry in entries)
+        with self._lock:
+            self._drop(key)
+            if cost > self.max_bytes or self.max_entries <= 0:
+                return
+            self._items[key] = (stamp, entries, cost)
+            self.bytes += cost
+            while len(self._items) > self.max_entries or self.bytes > self.max_bytes:
+                self._drop(next(iter(self._items)))
+
+    def discard(self, key):
+        with self._lock:
+            self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.bytes = 0
+
+    def _drop(self, key):
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.bytes -= item[2]
+
+class DirectoryWatcher:
+    """Linux'ta inotify ile tek bir dizinin doğrudan öğelerini izler
+
+    ctypes üzerinden inotify_init1 ile bloklamayan bir tanımlayıcı açılır;
+    olaylar gezginin after() döngüsünde okunur. Her olay yalnızca değişen
+    öğenin adını bildirir, öğenin son hali çağıran tarafından stat edilir.
+    Diğer platformlarda supported() False döner ve gezgin elle yenilenir.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+            IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    EVENT = struct.Struct("iIII")  # wd, mask, cookie, ad uzunluğu
+    READ_SIZE = 64 * 1024
+
+    _libc = None
+
+    @classmethod
+    def supported(cls):
+        if cls._libc is None:
+            cls._libc = False
+            if sys.platform.startswith("linux"):
+                try:
+                    libc = ctypes.CDLL(None, use_errno=True)
+                    libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+                    cls._libc = libc
+                except (OSError, AttributeError):
+                    pass
+        return cls._libc is not False
+
+    def __init__(self):
+        if not self.supported():
+            raise OSError(errno.ENOSYS, "inotify desteklenmiyor")
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify başlatılamadı")
+        self.wd = None
+        self.path = None
+
+    def watch(self, path):
+        """İzlenen dizini değiştirir (önceki dizinin izi bırakılır)"""
+        if path == self.path and self.wd is not None:
+            return
+        self.unwatch()
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "Dizin izlenemiyor", path)
+        self.wd = wd
+        self.path = path
+
+    def unwatch(self):
+        if self.wd is not None:
+            self._libc.inotify_rm_watch(self.fd, self.wd)
+        self.wd = None
+        self.path = None
+
+    def read(self):
+        """Bekleyen olayları (değişen adlar kümesi, durum) olarak döndürür
+
+        Durum None, taşma için "overflow" ya da dizin silinip taşındıysa
+        "gone" olur. Önceki dizinden kalan olaylar atlanır.
+        """
+        names = set()
+        status = None
+        while True:
+            try:
+                data = os.read(self.fd, self.READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                offset += self.EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    status = status or "overflow"
+                elif wd != self.wd:
+                    continue
+                elif mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF | self.IN_IGNORED):
+                    status = "gone"
+                elif name:
+                    names.add(os.fsdecode(name))
+        if status == "gone":
+            # Silinen dizinin izi çekirdekçe zaten kaldırılmıştır; hata yok sayılır
+            self.unwatch()
+        return names, status
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            self.wd = None
+            self.path = None
+
+class FolderStatsEngine:
+    """Klasör ağaçlarının boyut ve sayılarını paralel scandir ile toplar
+
+    Her dizin ayrı bir görev olarak iş parçacığı havuzunda taranır; dosya
+    boyutları DirEntry.stat() ile (Unix'te dizin okumasından, Windows'ta
+    önbellekten) alınır. Sonuçlar klasör ID'si başına dizin bazında
+    saklanır: değişiklik zamanı (st_mtime_ns) aynı kalan bir dizin yeniden
+    okunmaz, yalnızca bir kez stat edilir. Dizin zamanı yalnızca öğe
+    eklenince/silinince değiştiğinden yerinde büyüyen dosyalar bir sonraki
+    tam taramaya (forget) kadar eski boyutla sayılır.
+    """
+
+    def __init__(self, workers=8):
+        self.workers = workers
+        self.cache = {}  # klasör id -> {göreli dizin: (mtime_ns, boyut, dosya sayısı, alt dizinler)}
+        self._lock = threading.Lock()
+
+    def scan(self, folder_path, key=None, job=None):
+        """Boyut, dosya ve klasör sayısı ile okunamayan yolların listesini döndürür"""
+        with self._lock:
+            cached = self.cache.get(key, {}) if key is not None else {}
+        dirs = {}
+        result = {"size": 0, "file_count": 0, "dir_count": 0, "errors": []}
+
+        def visit(rel_dir):
+            path = os.path.join(folder_path, rel_dir)
+            try:
+                # Zaman taramadan önce alınır: tarama sırasında değişen dizin
+                # bir sonraki seferde yeniden okunur
+                mtime = os.stat(path).st_mtime_ns
+                entry = cached.get(rel_dir)
+                if entry and entry[0] == mtime:
+                    return rel_dir, entry, []
+
+                size = files = 0
+                subdirs = []
+                errors = []
+                with os.scandir(path) as it:
+                    for item in it:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.name)
+                            else:
+                                size += item.stat(follow_symlinks=False).st_size
+                                files += 1
+                        except OSError as e:
+                            errors.append((os.path.join(rel_dir, item.name), str(e)))
+                # Hatalı dizinler önbelleğe alınmaz, her seferinde yeniden denenir
+                return rel_dir, (None if errors else mtime, size, files, subdirs), errors
+            except OSError as e:
+                return rel_dir, None, [(rel_dir, str(e))]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(visit, "")}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        rel_dir, entry, errors = future.result()
+                        result["errors"] += errors
+                        if entry is None:
+                            continue
+                        dirs[rel_dir] = entry
+                        result["size"] += entry[1]
+                        result["file_count"] += entry[2]
+                        result["dir_count"] += len(entry[3])
+                        for name in entry[3]:
+                            pending.add(pool.submit(visit, os.path.join(rel_dir, name)))
+                    if job:
+                        job.check_cancelled()
+            except JobCancelled:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        if key is not None:
+            with self._lock:
+                self.cache[key] = dirs
+        return result
+
+    def forget(self, key):
+        """Klasörün önbelleğini siler (klasör gösterildi/silindi)"""
+        with self._lock:
+            self.cache.pop(key, None)
+
+class ParallelCopier:
+    """Birçok dosyayı aynı anda, mümkünse çekirdek içinde kopyalayan motor"""
+
+    # Depolama türüne göre eşzamanlı kopyalanacak dosya sayısı
+    DEFAULT_WORKERS = {"nvme": 16, "ssd": 8, "hdd": 2, "network": 4}
+    BUFFER_SIZE = 8 * 1024 * 1024  # 8 MB
+    FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+    def __init__(self, worker_profiles=None, workers=None):
+        self.worker_profiles = dict(self.DEFAULT_WORKERS)
+        if worker_profiles:
+            self.worker_profiles.update(worker_profiles)
+        self.workers = workers  # Verilirse profil algılamayı geçersiz kılar
+
+        # (kaynak cihazı, hedef cihazı) -> klonlama destekleniyor mu
+        self._reflink = {}
+
+    def supports_reflink(self, path):
+        """Dizinin dosya sistemi FICLONE ile klonlamayı destekliyor mu (btrfs, XFS)
+
+        Dizinde küçük bir deneme dosyası klonlanarak anlaşılır, sonuç cihaz
+        başına saklanır.
+        """
+        if fcntl is None:
+            return False
+
+        dev = os.stat(path).st_dev
+        if (dev, dev) not in self._reflink:
+            try:
+                with tempfile.TemporaryDirectory(prefix=".reflink-", dir=path) as probe:
+                    probe_src = os.path.join(probe, "a")
+                    with open(probe_src, 'wb') as f:
+                        f.write(b"\0" * 4096)
+                    with open(probe_src, 'rb') as fsrc, open(os.path.join(probe, "b"), 'wb') as fdst:
+                        self._try_clone(fsrc.fileno(), fdst.fileno())
+            except OSError:
+                self._reflink[(dev, dev)] = False
+        return self._reflink[(dev, dev)]
+
+    def storage_type(self, path):
+        """Yolun bulunduğu diskin türünü tahmin eder (nvme, ssd, hdd, network)"""
+        if not sys.platform.startswith("linux"):
+            return "ssd"
+
+        try:
+            dev = os.stat(path).st_dev
+            sys_path = os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+        except OSError:
+            return "ssd"
+
+        if not os.path.exists(sys_path):
+            # Blok cihazı olmayan dosya sistemleri (NFS, SMB, FUSE)
+            return "network"
+
+        # Bölümler için üst diskin kuyruk bilgisine bak
+        if not os.path.exists(os.path.join(sys_path, "queue")):
+            sys_path = os.path.dirname(sys_path)
+
+        if os.path.basename(sys_path).startswith("nvme"):
+            return "nvme"
+
+        try:
+            with open(os.path.join(sys_path, "queue", "rotational")) as f:
+                return "hdd" if f.read().strip() == "1" else "ssd"
+        except OSError:
+            return "ssd"
+
+    def workers_for(self, src, dst):
+        """Kaynak ve hedef için kullanılacak iş parçacığı sayısı"""
+        if self.workers:
+            return self.workers
+
+        dst_parent = os.path.dirname(os.path.abspath(dst))
+        counts = [
+            self.worker_profiles.get(self.storage_type(p), 4)
+            for p in (src, dst_parent)
+        ]
+        return max(1, min(counts))
+
+    def copy_tree(self, src, dst, job=None, file_func=None, journal=None):
+        """Klasör ağacını kopyalar; dosyalar sınırlı bir iş parçacığı havuzunda işlenir
+
+        file_func verilirse her dosya copy_file yerine onunla yazılır
+        (ör. şifreleme). journal verilirse biten her dosya günlüğe yazılır ve
+        günlükte tamamlanmış görünen dosyalar atlanarak yarım kalan kopya
+        sürdürülür. Aynı dolaşımda toplanan FolderStats nesnesini (girdi
+        listesiyle) döndürür.
+        """
+        file_func = file_func or self.copy_file
+        resuming = journal is not None
+        done_files = journal.done_files if journal else set()
+        stats = FolderStats(keep_entries=True, keep_index=True)
+        dirs = [""]
+        files = []
+        skipped_bytes = 0
+
+        # Önce klasör yapısını ve sembolik bağlantıları oluştur
+        os.makedirs(dst, exist_ok=resuming)
+        for kind, rel_path, entry in FolderStats.walk(src):
+            stats.add(kind, rel_path, entry)
+            target = os.path.join(dst, rel_path)
+            if kind == "d":
+                os.makedirs(target, exist_ok=resuming)
+                dirs.append(rel_path)
+            elif kind == "l":
+                if not (resuming and os.path.lexists(target)):
+                    os.symlink(os.readlink(entry.path), target)
+                skipped_bytes += stats.entries[rel_path]
+            elif rel_path in done_files and self._already_copied(entry, target, file_func):
+                skipped_bytes += stats.entries[rel_path]
+            else:
+                files.append(rel_path)
+
+        if job:
+            job.set_total(stats.size, stats.file_count)
+            # Sembolik bağlantılar ve önceki denemede kopyalanmış dosyalar
+            job.advance(skipped_bytes, stats.file_count - len(files))
+
+        def copy_one(rel):
+            file_func(os.path.join(src, rel), os.path.join(dst, rel), job)
+            if journal:
+                journal.file_done(rel)
+
+        # Dosyaları eşzamanlı kopyala
+        workers = self.workers_for(src, dst)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(copy_one, rel) for rel in files]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                if future.exception():
+                    if job:
+                        job.cancel()  # Kalan dosyalar hızla dursun
+                    raise future.exception()
+
+        # Klasör zaman damgalarını dosyalar yazıldıktan sonra kopyala
+        for rel_dir in reversed(dirs):
+            shutil.copystat(os.path.join(src, rel_dir), os.path.join(dst, rel_dir))
+
+        return stats
+
+    def _already_copied(self, entry, target, file_func):
+        # Düz kopyalarda boyut da tutmalı; dönüştürülen dosyalarda günlük esas alınır
+        try:
+            target_size = os.lstat(target).st_size
+        except OSError:
+            return False
+        if file_func != self.copy_file:
+            return True
+        return target_size == entry.stat(follow_symlinks=False).st_size
+
+    def copy_file(self, src, dst, job=None):
+        """Tek dosyayı kopyalar: copy_file_range, sendfile, sonra büyük tampon"""
+        if job:
+            job.check_cancelled()
+
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            if size and self._try_clone(fsrc.fileno(), fdst.fileno()):
+                # Veri kopyalanmadı, yalnızca bloklar paylaşıldı
+                if job:
+                    job.advance(size)
+            else:
+                copied = self._copy_kernel(fsrc.fileno(), fdst.fileno(), size, job)
+                if copied < size:
+                    self._copy_buffered(fsrc, fdst, job)
+
+        shutil.copystat(src, dst)
+        if job:
+            job.advance(0, 1)
+
+    def _try_clone(self, src_fd, dst_fd):
+        # Yazma anında kopyalanan (copy-on-write) klon; desteklenmiyorsa
+        # aynı cihaz çifti için bir daha denenmez
+        if fcntl is None:
+            return False
+
+        key = (os.fstat(src_fd).st_dev, os.fstat(dst_fd).st_dev)
+        if self._reflink.get(key) is False:
+            return False
+
+        try:
+            fcntl.ioctl(dst_fd, self.FICLONE, src_fd)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL,
+                               errno.ENOTTY, errno.ENOSYS, errno.EBADF):
+                raise
+            self._reflink[key] = False
+            return False
+
+        self._reflink[key] = True
+        return True
+
+    def _copy_kernel(self, src_fd, dst_fd, size, job):
+        # Linux'ta veriyi kullanıcı alanına almadan kopyala
+        copied = 0
+        for method in ("copy_file_range", "sendfile"):
+            if not hasattr(os, method):
+                continue
+            try:
+                while copied < size:
+                    count = min(self.BUFFER_SIZE, size - copied)
+                    if method == "copy_file_range":
+                        n = os.copy_file_range(src_fd, dst_fd, count)
+                    else:
+                        n = os.sendfile(dst_fd, src_fd, None, count)
+                    if n == 0:
+                        break
+                    copied += n
+                    if job:
+                        job.advance(n)
+                return copied
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                   errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF):
+                    raise
+                # Dosya konumları ilerlemiş olabilir; kalan kısım diğer yöntemle kopyalanır
+        return copied
+
+    def _copy_buffered(self, fsrc, fdst, job):
+        buf = bytearray(self.BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+            if job:
+                job.advance(n)
+
+class JournalCorrupt(ValueError):
+    """İşlem günlüğünün ortasında çözülemeyen (yarım yazılmamış) bir satır var"""
+
+class TransferJournal:
+    """Gizleme/gösterme işlemleri için şifreli, ileri yazımlı işlem günlüğü
+
+    Her satır Fernet ile şifrelenmiş bir JSON olaydır: işlemin başlangıcı,
+    tamamlanan dosyalar ve aşama değişiklikleri ("renamed", "copied",
+    "source_deleted"). Program yarıda kapanırsa bir sonraki girişte günlük
+    okunur ve işlem kaldığı yerden sürdürülür.
+    """
+
+    SYNC_EVERY = 64  # Bu kadar dosyada bir diske zorla yaz
+
+    def __init__(self, path, cipher):
+        self.path = path
+        self.cipher = cipher
+        self.begin = {}
+        self.phase = None
+        self.done_files = set()
+        self._file = None
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, journal_dir, cipher, **begin):
+        """Yeni bir işlem günlüğü açar ve başlangıç kaydını diske yazar"""
+        os.makedirs(journal_dir, exist_ok=True)
+        op_id = datetime.now().strftime('%Y%m%d%H%M%S') + "_" + os.urandom(4).hex()
+        journal = cls(os.path.join(journal_dir, f"{op_id}.jnl"), cipher)
+        journal.begin = dict(begin)
+        journal._append(dict(begin, type="begin"), sync=True)
+        return journal
+
+    @classmethod
+    def pending(cls, journal_dir, cipher):
+        """Tamamlanmamış işlemlerin günlüklerini döndürür"""
+        journals = []
+        if not os.path.isdir(journal_dir):
+            return journals
+
+        for name in sorted(os.listdir(journal_dir)):
+            if name.endswith(".jnl"):
+                journal = cls(os.path.join(journal_dir, name), cipher)
+                journal.load()
+                journals.append(journal)
+        return journals
+
+    def load(self):
+        with open(self.path, 'rb') as f:
+            lines = f.read().split(b"\n")
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(self.cipher.decrypt(line.strip()).decode())
+            except Exception as e:
+                if number == len(lines):
+                    break  # Satır sonu olmayan son satır çökmede yarım kalmıştır
+                # Tam yazılmış satır bozuksa sonraki olaylar atılmaz: işlem
+                # eksik bilgiyle sürdürülmez, günlük olduğu gibi bırakılır
+                raise JournalCorrupt(f"{os.path.basename(self.path)}: {number}. satır çözülemedi") from e
+
+            if event["type"] == "begin":
+                self.begin = event
+            elif event["type"] == "file":
+                self.done_files.add(event["rel"])
+            elif event["type"] == "phase":
+                self.phase = event["phase"]
+
+    def file_done(self, rel_path):
+        """Kopyalanan bir dosyayı günlüğe işler (iş parçacıklarından çağrılabilir)"""
+        self._append({"type": "file", "rel": rel_path})
+
+    def set_phase(self, phase):
+        self.phase = phase
+        self._append({"type": "phase", "phase": phase}, sync=True)
+
+    def _append(self, event, sync=False):
+        token = self.cipher.encrypt(json.dumps(event).encode())
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab')
+            self._file.write(token + b"\n")
+            self._file.flush()
+
+            self._unsynced += 1
+            if sync or self._unsynced >= self.SYNC_EVERY:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def close(self, remove=True):
+        """Günlüğü kapatır; işlem tamamlandıysa dosyayı siler"""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+        if remove and os.path.exists(self.path):
+            os.remove(self.path)
+
+class FolderManifest:
+    """Gizli bir klasörün şifreli dosya listesi (hidden/.manifests/<id>)
+
+    Girdiler göreli yol -> alan sözlüğü biçimindedir: "t" türü ("d", "f",
+    "l"), "s" orijinal boyutu, "m" değiştirilme zamanını tutar. Gezgin ve
+    önizleme diske gitmeden bu listeyi kullanır. Tekilleştirilmiş
+    klasörlerde "h" alanı dosyanın depodaki blobunun özetidir.
+
+    version her listelenen değişiklikte artar; gezginin liste önbelleği
+    manifestli dizinleri bu sayıyla doğrular.
+    """
+
+    # Sayaç tüm manifestlerde ortaktır: yeniden yüklenen manifest eski
+    # bir nesnenin sürümüyle karışmaz
+    _versions = itertools.count(1)
+
+    # Şifre değişirken yeni anahtarla hazırlanan kopyanın uzantısı
+    REKEY_SUFFIX = ".rekey"
+
+    def __init__(self, path, cipher):
+        self.path = path
+        self.cipher = cipher
+        self.entries = {}
+        self._children = None  # üst dizin -> {ad: alanlar}, ilk ihtiyaçta kurulur
+        self._changed()
+
+    def _changed(self):
+        self.version = next(FolderManifest._versions)
+
+    @classmethod
+    def for_folder(cls, hidden_dir, folder_id, cipher):
+        return cls(os.path.join(hidden_dir, ".manifests", folder_id), cipher)
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                self.entries = json.loads(self.cipher.decrypt(f.read()).decode())
+        self._children = None
+        self._changed()
+        return self
+
+    def is_indexed(self):
+        """Manifest dizin listesi için yeterli mi (eski manifestlerde yalnızca "h" vardır)"""
+        return os.path.exists(self.path) and all("t" in fields for fields in self.entries.values())
+
+    def set_index(self, index):
+        """Gizleme sırasında toplanan tür/boyut/zaman bilgisini girdilere işler"""
+        for rel_path, fields in index.items():
+            self.entries.setdefault(rel_path, {}).update(fields)
+        self._children = None
+        self._changed()
+
+    def children(self, rel_dir):
+        """Bir dizinin doğrudan alt öğelerini {ad: alanlar} olarak döndürür"""
+        if self._children is None:
+            self._children = {}
+            for rel_path, fields in self.entries.items():
+                parent, name = os.path.split(rel_path)
+                self._children.setdefault(parent, {})[name] = fields
+        return self._children.get(rel_dir, {})
+
+    def put(self, rel_path, fields):
+        """Tek bir öğeyi ekler ya da günceller"""
+        self.entries[rel_path] = fields
+        if self._children is not None:
+            parent, name = os.path.split(rel_path)
+            self._children.setdefault(parent, {})[name] = fields
+        self._changed()
+
+    def remove_tree(self, rel_path):
+        """Öğeyi ve (klasörse) altındaki her şeyi çıkarır"""
+        prefix = rel_path + os.sep
+        for key in [k for k in self.entries if k == rel_path or k.startswith(prefix)]:
+            del self.entries[key]
+        self._children = None
+        self._changed()
+
+    def rename_tree(self, old_rel, new_rel):
+        """Öğeyi ve altındakileri yeni göreli yola taşır"""
+        prefix = old_rel + os.sep
+        for key in [k for k in self.entries if k == old_rel or k.startswith(prefix)]:
+            self.entries[new_rel + key[len(old_rel):]] = self.entries.pop(key)
+        self._children = None
+        self._changed()
+
+    def subtree(self, rel_path):
+        """Öğenin ve altındakilerin girdileri (anahtarlar öğeye göre göreli, kökü "")"""
+        prefix = rel_path + os.sep
+        return {
+            key[len(prefix):] if key != rel_path else "": dict(fields)
+            for key, fields in self.entries.items()
+            if key == rel_path or key.startswith(prefix)
+        }
+
+    def put_tree(self, rel_path, subtree):
+        """subtree() ile alınmış girdileri yeni göreli yola ekler"""
+        for suffix, fields in subtree.items():
+            self.entries[os.path.join(rel_path, suffix) if suffix else rel_path] = fields
+        self._children = None
+        self._changed()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        AtomicWriter.write(self.path, self.cipher.encrypt(json.dumps(self.entries).encode()))
+
+    def delete(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class KeyDerivation:
+    """Ana şifreden oturum anahtarını türeten, ayarlanabilir KDF
+
+    Parametreler (algoritma, maliyet, tuz) kasa başlığında saklanır; böylece
+    maliyet makineye göre ayarlanabilir ve eski kasalar açılmaya devam eder.
+    """
+
+    LEGACY = {"kdf": "pbkdf2", "iterations": 100000}  # Başlıksız eski kasalar
+    MIN_ITERATIONS = 100000
+    MIN_SCRYPT_N = 2 ** 14
+    MAX_SCRYPT_N = 2 ** 20  # 128 * r * n = 1 GB bellek sınırı
+    TARGET_SECONDS = 0.5
+
+    def __init__(self, params, salt):
+        self.params = dict(params)
+        self.salt = salt
+
+    @classmethod
+    def from_header(cls, header, legacy_salt):
+        """Kasa başlığındaki parametrelerle, başlık yoksa eski ayarlarla oluşturur"""
+        if not header or "kdf" not in header:
+            return cls(cls.LEGACY, legacy_salt)
+        params = {k: v for k, v in header.items() if k != "salt"}
+        return cls(params, base64.b64decode(header["salt"]))
+
+    def to_header(self):
+        return dict(self.params, salt=base64.b64encode(self.salt).decode())
+
+    @classmethod
+    def calibrate(cls, kdf="pbkdf2", target_seconds=None):
+        """Bu makinede kilit açmanın yaklaşık target_seconds süreceği maliyeti seçer
+
+        Küçük bir maliyetle ölçülen süre hedefe oranlanır; maliyet eski
+        varsayılanın altına inmez. Her çağrıda yeni, rastgele bir tuz üretilir.
+        """
+        target_seconds = target_seconds or cls.TARGET_SECONDS
+        salt = os.urandom(16)
+
+        if kdf == "scrypt":
+            probe = cls({"kdf": "scrypt", "n": cls.MIN_SCRYPT_N, "r": 8, "p": 1}, salt)
+            elapsed = probe._measure()
+            n = cls.MIN_SCRYPT_N
+            # Süre n ile doğrusal artar; hedefi aşmayan en büyük 2'nin kuvveti
+            while n < cls.MAX_SCRYPT_N and elapsed * (n * 2 / cls.MIN_SCRYPT_N) <= target_seconds:
+                n *= 2
+            return cls({"kdf": "scrypt", "n": n, "r": 8, "p": 1}, salt)
+
+        if kdf != "pbkdf2":
+            raise ValueError(f"Bilinmeyen KDF: {kdf}")
+
+        probe_iterations = 20000
+        probe = cls({"kdf": "pbkdf2", "iterations": probe_iterations}, salt)
+        elapsed = max(probe._measure(), 1e-6)
+        iterations = int(probe_iterations * target_seconds / elapsed)
+        iterations = max(cls.MIN_ITERATIONS, iterations // 1000 * 1000)
+        return cls({"kdf": "pbkdf2", "iterations": iterations}, salt)
+
+    def _measure(self):
+        started = time.perf_counter()
+        self.derive("kalibrasyon")
+        return time.perf_counter() - started
+
+    def derive(self, password):
+        """Fernet anahtarı olarak kullanılabilecek urlsafe base64 anahtar döndürür"""
+        if self.params["kdf"] == "scrypt":
+            kdf = Scrypt(
+                salt=self.salt,
+                length=32,
+                n=self.params["n"],
+                r=self.params["r"],
+                p=self.params["p"],
+            )
+        else:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=self.salt,
+                iterations=self.params["iterations"],
+            )
+        return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+class AtomicWriter:
+    """Dosyaları çökmeye dayanıklı yazar: geçici dosya + fsync + rename
+
+    Yazma yarıda kesilirse eski dosya olduğu gibi kalır; os.replace sonrası
+    dizin de fsync'lenir ki yeni ad bir çökmede kaybolmasın.
+    """
+
+    @staticmethod
+    def write(path, data):
+        # Her yazma kendi geçici dosyasını kullanır: aynı dosyaya eşzamanlı
+        # iki yazma (ör. toplu iş ve gezgin manifesti) birbirine karışmaz
+        fd, partial_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or "."
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(partial_path, path)
+        except BaseException:
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
+            raise
+        AtomicWriter.sync_dir(os.path.dirname(path))
+
+    @staticmethod
+    def sync_dir(path):
+        # Windows'ta dizinler açılamaz; orada rename zaten kalıcıdır
+        try:
+            fd = os.open(path or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+class GroupCommit:
+    """Art arda gelen kaydetme isteklerini tek bir diske yazmada birleştirir
+
+    request() yazmayı Tk ana döngüsünde delay_ms sonrasına erteler; bu
+    sürede gelen diğer istekler aynı yazmaya katılır. flush() bekleyen
+    yazmayı hemen yapar (kapanış, çıkış, şifre değişimi öncesi).
+    """
+
+    def __init__(self, root, commit, delay_ms=250):
+        self.root = root
+        self.commit = commit
+        self.delay_ms = delay_ms
+        self.dirty = False
+        self._after_id = None
+
+    def request(self):
+        self.dirty = True
+        if self._after_id is None:
+            self._after_id = self.root.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self.dirty:
+            self.dirty = False
+            self.commit()
+
+    def discard(self):
+        """Bekleyen yazmayı yapmadan bırakır"""
+        self.dirty = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+class CatalogCorrupt(ValueError):
+    """Katalogda tam yazılmış ama çözülemeyen bir kayıt var; dosyaya dokunulmaz"""
+
+class CatalogEntries(MutableMapping):
+    """Klasör ID'si -> kayıt eşlemesi; tam kayıtlar ilk erişimde çözülür
+
+    Katalog girişte yalnızca özet katmanını (ID, görünen ad, gizleme
+    tarihi) çözer. Tam kayıt (yol, istatistikler, sıkıştırma...) ilk kez
+    istendiğinde loader ile çözülür ve önbellekte tutulur; kaydetme
+    yalnızca bu yüklenmiş kayıtları karşılaştırır.
+    """
+
+    def __init__(self, summaries=None, loader=None, records=None):
+        self._summaries = summaries or {}
+        self._records = records or {}
+        self._loader = loader
+
+    @staticmethod
+    def summarize(record):
+        return {"name": str(record.get("name") or ""), "hide_date": str(record.get("hide_date") or "")}
+
+    def __getitem__(self, folder_id):
+        if folder_id not in self._records:
+            if folder_id not in self._summaries:
+                raise KeyError(folder_id)
+            self._records[folder_id] = self._loader(folder_id)
+        return self._records[folder_id]
+
+    def __setitem__(self, folder_id, record):
+        self._records[folder_id] = record
+        self._summaries[folder_id] = self.summarize(record)
+
+    def __delitem__(self, folder_id):
+        del self._summaries[folder_id]
+        self._records.pop(folder_id, None)
+
+    def __contains__(self, folder_id):
+        return folder_id in self._summaries
+
+    def __iter__(self):
+        return iter(list(self._summaries))
+
+    def __len__(self):
+        return len(self._summaries)
+
+    def summary(self, folder_id):
+        """Kaydı çözmeden görünen ad ve tarih"""
+        if folder_id in self._records:
+            return self.summarize(self._records[folder_id])
+        return self._summaries[folder_id]
+
+    def loaded(self):
+        """Şimdiye kadar çözülmüş (değişmiş olabilecek) kayıtlar"""
+        return dict(self._records)
+
+class CatalogBackend:
+    """Katalog saklama arka uçlarının ortak kısmı
+
+    Arka uç diske yazılmış her kaydın JSON'unu hatırlar; save() yalnızca
+    değişen ya da silinen klasörleri _write() ile diske iletir. Çözülmemiş
+    kayıtlar değişmiş olamayacağından karşılaştırılmaz. Sorgular (yol, ad
+    öneki, tarih sırası) alt sınıflarca yanıtlanır.
+    """
+
+    FILE_NAME = None
+
+    def __init__(self, path, cipher, header=None):
+        self.path = path
+        self.cipher = cipher
+        self.header = header  # Şifrelenmeyen kasa başlığı (KDF parametreleri)
+        self._persisted = {}  # klasör id -> diske yazılmış kaydın JSON'u (çözülmediyse None)
+
+    @classmethod
+    def create(cls, path, cipher, entries=None, header=None):
+        """Yeni bir katalog dosyası oluşturur"""
+        catalog = cls(path, cipher, header)
+        catalog.compact(entries or {})
+        return catalog
+
+    def save(self, entries):
+        """Diskteki hâlden farklı olan klasörlerin kayıtlarını yazar"""
+        loaded = entries.loaded() if isinstance(entries, CatalogEntries) else entries
+        puts = {}
+        for folder_id, record in loaded.items():
+            dumped = self._dump(record)
+            if self._persisted.get(folder_id) != dumped:
+                puts[folder_id] = (record, dumped)
+        deletes = list(self._persisted.keys() - entries.keys())
+
+        if not puts and not deletes:
+            return
+
+        self._write(puts, deletes, entries)
+        for folder_id, (record, dumped) in puts.items():
+            self._persisted[folder_id] = dumped
+        for folder_id in deletes:
+            self._persisted.pop(folder_id, None)
+
+    def rekey(self, cipher, entries, header=None):
+        """Şifre değişince kataloğu yeni anahtar ve başlıkla yeniden yazar"""
+        # Çözülmemiş kayıtlar eski anahtarla okunabilirken yüklenir
+        records = dict(entries)
+        # Yazma başarısız olursa nesne eski anahtara döner: sonraki kayıtlar
+        # diskteki kataloğun anahtarıyla yazılmaya devam eder
+        state = dict(self.__dict__)
+        try:
+            self.cipher = cipher
+            if header is not None:
+                self.header = header
+            self.compact(records)
+        except BaseException:
+            self.__dict__.clear()
+            self.__dict__.update(state)
+            raise
+
+    def _loaded(self, folder_id, record):
+        # Tembel yüklenen kaydı karşılaştırma için hatırla
+        self._persisted[folder_id] = self._dump(record)
+        return record
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _dump(record):
+        return json.dumps(record, sort_keys=True)
+
+    @staticmethod
+    def sortable_date(hide_date):
+        """'gg.aa.yyyy ss:dd' biçimindeki gizleme tarihini sıralanabilir hâle çevirir"""
+        try:
+            return datetime.strptime(hide_date, '%d.%m.%Y %H:%M').strftime('%Y-%m-%d %H:%M')
+        except (TypeError, ValueError):
+            return ""
+
+class CatalogCodec:
+    """Katalog kayıtları için sürümlü, sıkı ikili kodlama ve AES-GCM
+
+    Özet: uzunluk önekli ID, ad, tarih ve orijinal yolun anahtarlı HMAC
+    etiketi (yol sorguları kayıt çözülmeden yanıtlansın diye). Kayıt: sabit alanlar (sürüm,
+    bayraklar, boyut, dosya/klasör sayısı) struct ile paketlenir; içerik
+    anahtarı ham 32 bayt, orijinal yol "dizin dizgisi numarası + ad"
+    olarak saklanır. Sabit alana uymayan her şey (önizleme, ayrıntılar,
+    bilinmeyen alanlar) sondaki sıkı JSON'a kalır, böylece kayıt birebir
+    geri elde edilir. Dizin önekleri ortak bir dizgi tablosundadır.
+    Her parça rastgele nonce ile AES-GCM şifrelenir (base64 yok).
+    """
+
+    VERSION = 1
+    NONCE_SIZE = 12
+    FIXED = struct.Struct(">BHQII")  # sürüm, bayraklar, boyut, dosya, klasör
+    SHORT = struct.Struct(">H")
+    LONG = struct.Struct(">I")
+
+    HAS_NAME = 1
+    HAS_DATE = 2
+    HAS_SIZE = 4
+    HAS_FILES = 8
+    HAS_DIRS = 16
+    SNAPSHOT = 32
+    DEDUP = 64
+    HAS_KEY = 128
+    HAS_PATH = 256
+
+    TAG_SIZE = 16  # Özetteki yol etiketinin boyu
+
+    def __init__(self, key):
+        self.key = key
+        self.aead = AESGCM(key)
+        # Yol etiketleri şifreleme anahtarından ayrı bir alt anahtarla üretilir
+        self._tag_key = hmac.new(key, b"catalog-path-tag", hashlib.sha256).digest()
+        self.strings = []  # Dizgi tablosu: numara -> dizin öneki
+        self._string_ids = {}
+
+    def seal(self, plain, aad):
+        nonce = os.urandom(self.NONCE_SIZE)
+        return nonce + self.aead.encrypt(nonce, plain, aad)
+
+    def open(self, blob, aad):
+        return self.aead.decrypt(blob[:self.NONCE_SIZE], blob[self.NONCE_SIZE:], aad)
+
+    def intern(self, text, new_strings):
+        """Dizginin tablo numarası; tabloda yoksa eklenir ve new_strings'e yazılır"""
+        index = self._string_ids.get(text)
+        if index is None:
+            index = len(self.strings)
+            self.add_string(index, text)
+            new_strings.append(index)
+        return index
+
+    def add_string(self, index, text):
+        while len(self.strings) <= index:
+            self.strings.append(None)
+        self.strings[index] = text
+        self._string_ids[text] = index
+
+    def _pack_str(self, text):
+        data = text.encode('utf-8')
+        return self.SHORT.pack(len(data)) + data
+
+    def _unpack_str(self, data, offset):
+        (length,) = self.SHORT.unpack_from(data, offset)
+        offset += self.SHORT.size
+        return data[offset:offset + length].decode('utf-8'), offset + length
+
+    def path_tag(self, path):
+        """Orijinal yolun körleştirilmiş etiketi (yol yoksa boş)"""
+        if not isinstance(path, str):
+            return b""
+        return hmac.new(self._tag_key, path.encode('utf-8'), hashlib.sha256).digest()[:self.TAG_SIZE]
+
+    def encode_summary(self, folder_id, summary, tag=b""):
+        # Etiket bir bayt uzunlukla eklenir; eski özetlerde bu alan hiç yoktur
+        return (self._pack_str(folder_id) + self._pack_str(summary["name"])
+                + self._pack_str(summary["hide_date"]) + bytes([len(tag)]) + tag)
+
+    def decode_summary(self, data):
+        """(ID, özet, yol etiketi); etiketsiz eski özetlerde etiket None"""
+        folder_id, offset = self._unpack_str(data, 0)
+        name, offset = self._unpack_str(data, offset)
+        hide_date, offset = self._unpack_str(data, offset)
+        tag = None
+        if offset < len(data):
+            tag = data[offset + 1:offset + 1 + data[offset]]
+        return folder_id, {"name": name, "hide_date": hide_date}, tag
+
+    def encode_record(self, record, new_strings):
+        flags = 0
+        size = file_count = dir_count = 0
+        key = b""
+        path = b""
+        extra = {}
+
+        for field, value in record.items():
+            if field == "name" and isinstance(value, str):
+                flags |= self.HAS_NAME
+            elif field == "hide_date" and isinstance(value, str):
+                flags |= self.HAS_DATE
+            elif field == "size" and type(value) is int and 0 <= value < 2 ** 64:
+                flags |= self.HAS_SIZE
+                size = value
+            elif field == "file_count" and type(value) is int and 0 <= value < 2 ** 32:
+                flags |= self.HAS_FILES
+                file_count = value
+            elif field == "dir_count" and type(value) is int and 0 <= value < 2 ** 32:
+                flags |= self.HAS_DIRS
+                dir_count = value
+            elif field == "snapshot" and value is True:
+                flags |= self.SNAPSHOT
+            elif field == "dedup" and value is True:
+                flags |= self.DEDUP
+            elif field == "content_key" and self._raw_key(value):
+                flags |= self.HAS_KEY
+                key = self._raw_key(value)
+            elif (field == "original_path" and isinstance(value, str)
+                  and os.path.join(*os.path.split(value)) == value):
+                flags |= self.HAS_PATH
+                head, tail = os.path.split(value)
+                path = self.LONG.pack(self.intern(head, new_strings)) + self._pack_str(tail)
+            else:
+                extra[field] = value
+
+        body = self.FIXED.pack(self.VERSION, flags, size, file_count, dir_count) + key + path
+        if extra:
+            body += json.dumps(extra, separators=(',', ':')).encode('utf-8')
+        return body
+
+    def decode_record(self, data, summary):
+        version, flags, size, file_count, dir_count = self.FIXED.unpack_from(data, 0)
+        if version != self.VERSION:
+            raise ValueError("Desteklenmeyen katalog kaydı sürümü")
+        offset = self.FIXED.size
+
+        record = {}
+        if flags & self.HAS_NAME:
+            record["name"] = summary["name"]
+        if flags & self.HAS_DATE:
+            record["hide_date"] = summary["hide_date"]
+        if flags & self.HAS_SIZE:
+            record["size"] = size
+        if flags & self.HAS_FILES:
+            record["file_count"] = file_count
+        if flags & self.HAS_DIRS:
+            record["dir_count"] = dir_count
+        if flags & self.SNAPSHOT:
+            record["snapshot"] = True
+        if flags & self.DEDUP:
+            record["dedup"] = True
+        if flags & self.HAS_KEY:
+            record["content_key"] = base64.urlsafe_b64encode(data[offset:offset + 32]).decode()
+            offset += 32
+        if flags & self.HAS_PATH:
+            (index,) = self.LONG.unpack_from(data, offset)
+            tail, offset = self._unpack_str(data, offset + self.LONG.size)
+            record["original_path"] = os.path.join(self.strings[index], tail)
+        if offset < len(data):
+            record.update(json.loads(data[offset:].decode('utf-8')))
+        return record
+
+    @staticmethod
+    def _raw_key(value):
+        # Yalnızca birebir geri üretilebilen 32 baytlık anahtarlar ham saklanır
+        if not isinstance(value, str):
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(value)
+        except (ValueError, TypeError):
+            return None
+        if len(raw) == 32 and base64.urlsafe_b64encode(raw).decode() == value:
+            return raw
+        return None
+
+class CatalogLog(CatalogBackend):
+    """Gizli klasör kataloğu için yalnızca sona eklenen şifreli ikili günlük
+
+    Dosya MAGIC satırıyla, KDF parametrelerini taşıyan düz JSON başlık
+    satırıyla ve oturum anahtarıyla (Fernet) sarılmış rastgele katalog
+    anahtarı satırıyla başlar; bu satır çözülemiyorsa şifre yanlıştır.
+    Ardından çerçeveler gelir: tür (1 bayt), uzunluk (4 bayt), bu ikisinin
+    CRC32'si (4 bayt) ve katalog anahtarıyla AES-GCM şifreli içerik
+    (CatalogCodec). CRC, çökmede yarım kalan son çerçeveyi dosyanın
+    ortasındaki bozuk bir uzunluktan ayırır. Çerçeveler bir
+    klasörün eklenmesi/güncellenmesi ("put"), silinmesi ("del") ya da
+    dizgi tablosuna yeni bir dizin öneki eklenmesidir ("string"). "put"
+    iki katmanlıdır: küçük özet (ID, ad, tarih) ve tam kayıt; girişte
+    yalnızca özetler çözülür, kayıt istendiğinde bellekteki çerçeveden
+    çözülür. Bir değişiklik yalnızca ilgili çerçeveleri sona ekler.
+    Geçersiz çerçeveler çoğalınca dosya sıkıştırılır (değişmemiş
+    çerçeveler çözülmeden kopyalanır). Eski Fernet/JSON biçimleri (tek
+    parça, FHCATLOG1, FHCATLOG2) ilk yüklemede bu biçime dönüştürülür.
+    Yol sorguları özetlerdeki yol etiketlerinden kurulan indeksle, ad ve
+    tarih sorguları bellekteki özetler üzerinde doğrusal çalışır; büyük
+    kasalar için SqliteCatalog kullanılır.
+    """
+
+    FILE_NAME = "hidden_folders.dat"
+    MAGIC = b"FHCATLOG3\n"
+    TEXT_MAGICS = (b"FHCATLOG2\n", b"FHCATLOG1\n")  # Fernet/JSON satırlı eski sürümler
+    COMPACT_MIN = 64  # Bu kadar geçersiz kayıt birikmeden sıkıştırma yapılmaz
+
+    FRAME = struct.Struct(">BII")  # tür, uzunluk, ilk iki alanın CRC32'si
+    FRAME_HEAD = struct.Struct(">BI")
+    PUT = 1
+    DEL = 2
+    STRING = 3
+
+    def __init__(self, path, cipher, header=None):
+        super().__init__(path, cipher, header)
+        self.records = 0  # Dosyadaki put/del çerçevesi sayısı
+        self.codec = None
+        self._entries = CatalogEntries()  # Son yüklenen/kaydedilen katalog (sorgular için)
+        self._frames = {}  # klasör id -> diskteki "put" çerçevesi
+        self._string_frames = []  # Dizgi tablosu çerçeveleri
+        self._path_tags = {}  # klasör id -> özetteki yol etiketi
+        self._tag_ids = {}  # yol etiketi -> klasör id'leri
+        self._untagged = set()  # Etiketsiz eski çerçeveler (yolu kayıttan okunur)
+
+    @classmethod
+    def read_header(cls, path):
+        """Şifre gerekmeden kasa başlığını okur; eski dosyalarda None döndürür"""
+        with open(path, 'rb') as f:
+            if f.read(len(cls.MAGIC)) not in (cls.MAGIC,) + cls.TEXT_MAGICS:
+                return None
+            line = f.readline()
+        if line.startswith(b"{"):
+            return json.loads(line.decode())
+        return None
+
+    def load(self):
+        """Kataloğu okur; yanlış şifrede InvalidToken fırlatır"""
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        if not data.startswith(self.MAGIC):
+            # Eski biçimler bir kez tamamen çözülüp ikili biçime dönüştürülür
+            self.compact(self._load_text(data))
+            return self._entries
+
+        offset = len(self.MAGIC)
+        if data.startswith(b"{", offset):
+            end = data.index(b"\n", offset)
+            self.header = json.loads(data[offset:end].decode())
+            offset = end + 1
+
+        # Katalog anahtarı çözülemiyorsa şifre yanlış
+        end = data.index(b"\n", offset)
+        self.codec = CatalogCodec(self.cipher.decrypt(data[offset:end]))
+        offset = end + 1
+
+        entries = CatalogEntries(loader=self._load_record)
+        self._entries = entries
+        self._persisted = {}
+        self._frames = {}
+        self._string_frames = []
+        self._reset_path_index()
+        self.records = 0
+
+        while offset < len(data):
+            end = offset + self.FRAME.size
+            if end <= len(data):
+                kind, length, check = self.FRAME.unpack_from(data, offset)
+                if check != zlib.crc32(self.FRAME_HEAD.pack(kind, length)):
+                    # Çökmeden sonra sıfırla dolu kalan kuyruk da yarım yazmadır;
+                    # bunun dışında başlığı bozuk çerçeve dosyanın bozulduğunu gösterir
+                    if data[offset:].strip(b"\0"):
+                        raise CatalogCorrupt(f"{offset}. baytta bozuk katalog çerçevesi başlığı")
+                    end = len(data) + 1
+                else:
+                    end += length
+            if end > len(data):
+                # Çökme sırasında yarım yazılmış son çerçeve: sonraki eklemeler
+                # ona yapışmasın diye dosyadan kesilir. Uzunluk CRC ile doğrulandığı
+                # için ortadaki bir bozulma buraya düşüp sonrakileri sildiremez.
+                with open(self.path, 'r+b') as f:
+                    f.truncate(offset)
+                break
+
+            # Tam yazılmış bir çerçeve çözülemiyorsa dosya bozulmuştur; kesilirse
+            # sonraki tüm kayıtlar kaybolur, bu yüzden dosyaya dokunulmaz
+            try:
+                self._read_frame(entries, kind, data[offset:end])
+            except Exception as e:
+                raise CatalogCorrupt(f"{offset}. baytta çözülemeyen katalog çerçevesi") from e
+            offset = end
+
+        return entries
+
+    def _read_frame(self, entries, kind, frame):
+        payload = frame[self.FRAME.size:]
+        aad = bytes([kind])
+
+        if kind == self.STRING:
+            plain = self.codec.open(payload, aad)
+            (index,) = CatalogCodec.LONG.unpack_from(plain, 0)
+            self.codec.add_string(index, plain[CatalogCodec.LONG.size:].decode('utf-8'))
+            self._string_frames.append(frame)
+        elif kind == self.PUT:
+            (length,) = CatalogCodec.SHORT.unpack_from(payload, 0)
+            summary_blob = payload[CatalogCodec.SHORT.size:CatalogCodec.SHORT.size + length]
+            folder_id, summary, tag = self.codec.decode_summary(self.codec.open(summary_blob, aad))
+            entries._summaries[folder_id] = summary
+            entries._records.pop(folder_id, None)
+            self._persisted[folder_id] = None
+            self._frames[folder_id] = frame
+            self._index_path(folder_id, tag)
+            self.records += 1
+        elif kind == self.DEL:
+            folder_id = self.codec.open(payload, aad).decode('utf-8')
+            entries.pop(folder_id, None)
+            self._persisted.pop(folder_id, None)
+            self._frames.pop(folder_id, None)
+            self._index_path(folder_id, b"", remove=True)
+            self.records += 1
+        else:
+            raise ValueError("Bilinmeyen çerçeve türü")
+
+    def _load_text(self, data):
+        """Eski Fernet/JSON biçimli kataloğu tamamen çözer"""
+        magic = next((m for m in self.TEXT_MAGICS if data.startswith(m)), None)
+        if magic is None:
+            # Tüm katalog tek bir Fernet bloğu
+            return json.loads(self.cipher.decrypt(data).decode())
+
+        entries = {}
+        offset = len(magic)
+        if data.startswith(b"{", offset):
+            end = data.index(b"\n", offset)
+            self.header = json.loads(data[offset:end].decode())
+            offset = end + 1
+        start = offset
+
+        while offset < len(data):
+            end = data.find(b"\n", offset)
+            if end < 0:
+                break  # Satır sonu olmayan son kayıt çökmede yarım kalmıştır; alınmaz
+            try:
+                head, _, body = data[offset:end].partition(b" ")
+                event = json.loads(self.cipher.decrypt(head).decode())
+                if body:
+                    event["record"] = json.loads(self.cipher.decrypt(body).decode())
+            except Exception as e:
+                if offset == start:
+                    raise  # Doğrulama kaydı çözülemiyorsa şifre yanlış
+                # Tam yazılmış satır bozuksa sonrakiler atılmaz, dönüştürme yapılmaz
+                raise CatalogCorrupt(f"{offset}. baytta çözülemeyen katalog kaydı") from e
+            offset = end + 1
+
+            if event["type"] == "put":
+                entries[event["id"]] = event["record"]
+            elif event["type"] == "del":
+                entries.pop(event["id"], None)
+        return entries
+
+    def _load_record(self, folder_id):
+        payload = self._frames[folder_id][self.FRAME.size:]
+        (length,) = CatalogCodec.SHORT.unpack_from(payload, 0)
+        record_blob = payload[CatalogCodec.SHORT.size + length:]
+        plain = self.codec.open(record_blob, b"r" + folder_id.encode('utf-8'))
+        record = self.codec.decode_record(plain, self._entries._summaries[folder_id])
+        if folder_id in self._untagged:
+            # Eski çerçevenin yolu bir kez çözüldü; bu oturumda indekse alınır
+            self._index_path(folder_id, self.codec.path_tag(record.get("original_path")))
+        return self._loaded(folder_id, record)
+
+    def _reset_path_index(self):
+        self._path_tags = {}
+        self._tag_ids = {}
+        self._untagged = set()
+
+    def _index_path(self, folder_id, tag, remove=False):
+        """Klasörün yol etiketini indekste günceller (None: etiketsiz eski çerçeve)"""
+        old = self._path_tags.pop(folder_id, None)
+        if old:
+            ids = self._tag_ids.get(old)
+            if ids is not None:
+                ids.discard(folder_id)
+                if not ids:
+                    del self._tag_ids[old]
+        self._untagged.discard(folder_id)
+        if remove:
+            return
+        if tag is None:
+            self._untagged.add(folder_id)
+            return
+        self._path_tags[folder_id] = tag
+        if tag:
+            self._tag_ids.setdefault(tag, set()).add(folder_id)
+
+    def _frame(self, kind, payload):
+        head = self.FRAME_HEAD.pack(kind, len(payload))
+        return self.FRAME.pack(kind, len(payload), zlib.crc32(head)) + payload
+
+    def _put_frames(self, folder_id, record):
+        """Kaydın "put" çerçevesi ve önünde yazılması gereken yeni dizgi çerçeveleri"""
+        new_strings = []
+        body = self.codec.encode_record(record, new_strings)
+        aad = bytes([self.PUT])
+        tag = self.codec.path_tag(record.get("original_path"))
+        summary = self.codec.seal(
+            self.codec.encode_summary(folder_id, CatalogEntries.summarize(record), tag), aad
+        )
+        self._index_path(folder_id, tag)
+        payload = (CatalogCodec.SHORT.pack(len(summary)) + summary
+                   + self.codec.seal(body, b"r" + folder_id.encode('utf-8')))
+
+        strings = []
+        for index in new_strings:
+            plain = CatalogCodec.LONG.pack(index) + self.codec.strings[index].encode('utf-8')
+            strings.append(self._frame(self.STRING, self.codec.seal(plain, bytes([self.STRING]))))
+        self._string_frames += strings
+        return strings, self._frame(self.PUT, payload)
+
+    def _write(self, puts, deletes, entries):
+        self._entries = entries
+
+        # Geçersiz kayıtlar canlı olanları geçtiyse baştan yaz
+        written = len(puts) + len(deletes)
+        if self.records + written - len(entries) > max(self.COMPACT_MIN, len(entries)):
+            self.compact(entries, puts)
+            return
+
+        frames = []
+        for folder_id, (record, dumped) in puts.items():
+            strings, frame = self._put_frames(folder_id, record)
+            self._frames[folder_id] = frame
+            frames += strings + [frame]
+        for folder_id in deletes:
+            self._frames.pop(folder_id, None)
+            self._index_path(folder_id, b"", remove=True)
+            plain = folder_id.encode('utf-8')
+            frames.append(self._frame(self.DEL, self.codec.seal(plain, bytes([self.DEL]))))
+
+        # Tüm değişiklikler tek yazma ve tek fsync ile eklenir
+        with open(self.path, 'ab') as f:
+            f.write(b"".join(frames))
+            f.flush()
+            os.fsync(f.fileno())
+        self.records += written
+
+    def compact(self, entries, puts=None):
+        """Kataloğu her klasör için tek çerçeveyle yeniden yazar
+
+        puts verildiğinde (sıkıştırma) değişmemiş klasörlerin çerçeveleri
+        çözülmeden olduğu gibi kopyalanır; aksi hâlde (oluşturma, yeni
+        anahtar, dönüştürme) yeni katalog anahtarıyla tümü yeniden kodlanır.
+        """
+        frames = {}
+        if puts is None:
+            records = {folder_id: entries[folder_id] for folder_id in entries}
+            self.codec = CatalogCodec(AESGCM.generate_key(bit_length=256))
+            self._string_frames = []
+            self._frames = {}
+            self._reset_path_index()
+            puts = records
+        for folder_id in entries:
+            if folder_id not in puts and folder_id in self._frames:
+                frames[folder_id] = self._frames[folder_id]
+            else:
+                frames[folder_id] = self._put_frames(folder_id, entries[folder_id])[1]
+
+        header = json.dumps(self.header).encode() + b"\n" if self.header else b""
+        key_line = self.cipher.encrypt(self.codec.key) + b"\n"
+        AtomicWriter.write(
+            self.path,
+            self.MAGIC + header + key_line + b"".join(self._string_frames) + b"".join(frames.values())
+        )
+
+        self.records = len(frames)
+        self._frames = frames
+        for folder_id in set(self._path_tags) | self._untagged:
+            if folder_id not in frames:
+                self._index_path(folder_id, b"", remove=True)
+        if not isinstance(entries, CatalogEntries):
+            entries = CatalogEntries(
+                {folder_id: CatalogEntries.summarize(record) for folder_id, record in entries.items()},
+                self._load_record,
+                dict(entries)
+            )
+        self._entries = entries
+        loaded = entries.loaded()
+        self._persisted = {
+            folder_id: self._dump(loaded[folder_id]) if folder_id in loaded else None
+            for folder_id in entries
+        }
+
+    def find_original_path(self, path):
+        """Orijinal yolu verilen klasörlerin ID'leri
+
+        Adaylar özetlerdeki yol etiketi indeksinden gelir; yalnızca onlar,
+        etiketsiz eski çerçeveler ve bellekte değişmiş olabilecek yüklü
+        kayıtlar çözülüp gerçek yolla karşılaştırılır.
+        """
+        candidates = set(self._untagged) | set(self._entries.loaded())
+        if self.codec is not None:
+            candidates |= self._tag_ids.get(self.codec.path_tag(path), set())
+        return [folder_id for folder_id in candidates
+                if folder_id in self._entries
+                and self._entries[folder_id].get("original_path") == path]
+
+    def search_names(self, prefix):
+        """Adı verilen önekle başlayan klasörlerin ID'leri"""
+        prefix = prefix.casefold()
+        return [folder_id for folder_id in self._entries
+                if self._entries.summary(folder_id)["name"].casefold().startswith(prefix)]
+
+    def ids_by_date(self, descending=True):
+        """Klasör ID'leri gizleme tarihine göre sıralı"""
+        return sorted(
+            self._entries,
+            key=lambda folder_id: self.sortable_date(self._entries.summary(folder_id)["hide_date"]),
+            reverse=descending
+        )
+
+class SqliteCatalog(CatalogBackend):
+    """Büyük kasalar için sqlite3 üzerinde indeksli katalog
+
+    Her klasör bir satırdır; kaydın kendisi Fernet ile şifreli "payload"
+    sütunundadır, görünen ad ve tarih ayrıca küçük bir şifreli "summary"
+    sütununda tutulur (girişte yalnızca bu çözülür, kayıt istenince). Ad ve orijinal yol düz metin saklanmaz: aramalar için
+    gizli bir indeks anahtarıyla HMAC'lenmiş körleştirilmiş indeksler
+    tutulur (eşitlik ve ad önekleri için O(log n) arama). Gizleme tarihi
+    sıralama için düz (ISO) saklanır. İndeks anahtarı ve KDF başlığı "meta"
+    tablosundadır; indeks anahtarı oturum anahtarıyla şifrelidir.
+    """
+
+    FILE_NAME = "hidden_folders.db"
+    PREFIX_MAX = 12  # Bu uzunluğa kadar ad önekleri indekslenir
+    COLUMNS = "(id, name_idx, path_idx, hide_date, payload, summary) VALUES (?, ?, ?, ?, ?, ?)"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS folders (
+            id TEXT PRIMARY KEY,
+            name_idx BLOB NOT NULL,
+            path_idx BLOB NOT NULL,
+            hide_date TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            summary BLOB
+        );
+        CREATE INDEX IF NOT EXISTS folders_name ON folders (name_idx);
+        CREATE INDEX IF NOT EXISTS folders_path ON folders (path_idx);
+        CREATE INDEX IF NOT EXISTS folders_date ON folders (hide_date);
+        CREATE TABLE IF NOT EXISTS name_prefixes (
+            prefix_idx BLOB NOT NULL,
+            id TEXT NOT NULL,
+            PRIMARY KEY (prefix_idx, id)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path, cipher, header=None):
+        super().__init__(path, cipher, header)
+        self._conn = None
+        self._index_key = None
+        self._entries = CatalogEntries()  # Son yüklenen/kaydedilen katalog (kaydedilmemiş değişiklikler için)
+
+    @classmethod
+    def read_header(cls, path):
+        """Şifre gerekmeden kasa başlığını okur"""
+        conn = sqlite3.connect(path)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'header'").fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA synchronous = FULL")
+            self._conn.executescript(self.SCHEMA)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(folders)")]
+            if "summary" not in columns:
+                # Özet sütunu olmayan eski veritabanı; load() doldurur
+                self._conn.execute("ALTER TABLE folders ADD COLUMN summary BLOB")
+        return self._conn
+
+    def _meta(self, key):
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def load(self):
+        """Kataloğu okur; yanlış şifrede InvalidToken fırlatır"""
+        conn = self._connect()
+        header = self._meta("header")
+        if header:
+            self.header = json.loads(header)
+
+        # Doğrulama kaydı ve indeks anahtarı oturum anahtarıyla çözülür
+        self.cipher.decrypt(self._meta("check").encode())
+        self._index_key = self.cipher.decrypt(self._meta("index_key").encode())
+
+        # Yalnızca özetler çözülür; tam kayıtlar _load_record ile istenince
+        entries = CatalogEntries(loader=self._load_record)
+        self._persisted = {}
+        missing = []
+        for folder_id, summary in conn.execute("SELECT id, summary FROM folders"):
+            if summary is None:
+                missing.append(folder_id)
+                continue
+            entries._summaries[folder_id] = json.loads(self.cipher.decrypt(summary).decode())
+            self._persisted[folder_id] = None
+
+        # Eski satırların özetleri bir kez kayıttan üretilir
+        updates = []
+        for folder_id in missing:
+            entries[folder_id] = self._load_record(folder_id)
+            updates.append((self._encrypt_summary(entries[folder_id]), folder_id))
+        if updates:
+            with conn:
+                conn.executemany("UPDATE folders SET summary = ? WHERE id = ?", updates)
+        self._entries = entries
+        return entries
+
+    def _load_record(self, folder_id):
+        row = self._connect().execute(
+            "SELECT payload FROM folders WHERE id = ?", (folder_id,)
+        ).fetchone()
+        return self._loaded(folder_id, json.loads(self.cipher.decrypt(row[0]).decode()))
+
+    def _encrypt_summary(self, record):
+        return self.cipher.encrypt(json.dumps(CatalogEntries.summarize(record)).encode())
+
+    def _blind(self, kind, value):
+        h = hmac.new(self._index_key, digestmod=hashlib.sha256)
+        h.update(kind + value.encode())
+        return h.digest()
+
+    def _rows(self, puts):
+        rows = []
+        prefixes = []
+        for folder_id, (record, dumped) in puts.items():
+            name = record.get("name", "").casefold()
+            rows.append((
+                folder_id,
+                self._blind(b"n", name),
+                self._blind(b"p", record.get("original_path", "")),
+                self.sortable_date(record.get("hide_date")),
+                self.cipher.encrypt(dumped.encode()),
+                self._encrypt_summary(record)
+            ))
+            for length in range(1, min(len(name), self.PREFIX_MAX) + 1):
+                prefixes.append((self._blind(b"x", name[:length]), folder_id))
+        return rows, prefixes
+
+    def _write(self, puts, deletes, entries):
+        self._entries = entries
+        conn = self._connect()
+        rows, prefixes = self._rows(puts)
+        changed = [(folder_id,) for folder_id in list(puts) + deletes]
+
+        # Tek işlemde yaz: ya hepsi ya hiçbiri
+        with conn:
+            conn.executemany("DELETE FROM name_prefixes WHERE id = ?", changed)
+            conn.executemany("DELETE FROM folders WHERE id = ?", [(f,) for f in deletes])
+            conn.executemany(f"INSERT OR REPLACE INTO folders {self.COLUMNS}", rows)
+            conn.executemany("INSERT OR IGNORE INTO name_prefixes VALUES (?, ?)", prefixes)
+
+    def compact(self, entries):
+        """Tüm kataloğu (ör. yeni anahtarla) baştan yazar"""
+        self._entries = entries
+        conn = self._connect()
+        if self._index_key is None:
+            self._index_key = os.urandom(32)
+
+        puts = {folder_id: (record, self._dump(record)) for folder_id, record in entries.items()}
+        rows, prefixes = self._rows(puts)
+        meta = [
+            ("check", self.cipher.encrypt(b"check").decode()),
+            ("index_key", self.cipher.encrypt(self._index_key).decode()),
+        ]
+        if self.header:
+            meta.append(("header", json.dumps(self.header)))
+
+        with conn:
+            conn.execute("DELETE FROM folders")
+            conn.execute("DELETE FROM name_prefixes")
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta)
+            conn.executemany(f"INSERT INTO folders {self.COLUMNS}", rows)
+            conn.executemany("INSERT OR IGNORE INTO name_prefixes VALUES (?, ?)", prefixes)
+
+        self._persisted = {folder_id: dumped for folder_id, (record, dumped) in puts.items()}
+
+    def find_original_path(self, path):
+        """Orijinal yolu verilen klasörlerin ID'leri (indeksli)
+
+        Grup kaydını bekleyen değişiklikler henüz veritabanında değildir:
+        bellekte yüklü (değişmiş olabilecek) kayıtlar gerçek yolla,
+        silinmiş olanlar katalogdan karşılaştırılır.
+        """
+        rows = self._connect().execute(
+            "SELECT id FROM folders WHERE path_idx = ?", (self._blind(b"p", path),)
+        )
+        entries = self._entries
+        loaded = entries.loaded() if isinstance(entries, CatalogEntries) else entries
+        ids = [row[0] for row in rows if row[0] in entries and row[0] not in loaded]
+        return ids + [folder_id for folder_id, record in loaded.items()
+                      if record.get("original_path") == path]
+
+    def search_names(self, prefix):
+        """Adı verilen önekle başlayan klasörlerin ID'leri (indeksli)"""
+        prefix = prefix.casefold()
+        ids = [row[0] for row in self._connect().execute(
+            "SELECT id FROM name_prefixes WHERE prefix_idx = ?",
+            (self._blind(b"x", prefix[:self.PREFIX_MAX]),)
+        )]
+        if len(prefix) <= self.PREFIX_MAX:
+            return ids
+
+        # Uzun öneklerde adayların özetleri çözülüp tam önekle süzülür
+        result = []
+        for folder_id in ids:
+            row = self._connect().execute(
+                "SELECT summary FROM folders WHERE id = ?", (folder_id,)
+            ).fetchone()
+            summary = json.loads(self.cipher.decrypt(row[0]).decode())
+            if summary["name"].casefold().startswith(prefix):
+                result.append(folder_id)
+        return result
+
+    def ids_by_date(self, descending=True):
+        """Klasör ID'leri gizleme tarihine göre sıralı (indeksli)"""
+        order = "DESC" if descending else "ASC"
+        return [row[0] for row in self._connect().execute(
+            f"SELECT id FROM folders ORDER BY hide_date {order}"
+        )]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+class DedupStore:
+    """Dosya içeriklerini özetlerine göre bir kez saklayan ortak depo
+
+    Bloblar hidden/.store/<ilk iki karakter>/<sha256> altında durur; gizli
+    klasör ağaçlarındaki dosyalar bu bloblara sabit bağlantıdır (hard link).
+    Böylece gezgin ve taşıma motoru olağan dosyalarla çalışır, aynı içerik
+    diskte bir kez yer kaplar. Bağlantı sayısı 1'e düşen blob artık hiçbir
+    klasörde kullanılmıyordur ve silinebilir. Aynı blobu paylaşan dosyalar
+    izinleri ve değiştirilme zamanını da paylaşır.
+    """
+
+    HASH_CHUNK = 1024 * 1024
+
+    def __init__(self, root):
+        self.root = root
+        self._supported = None
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def supported(self):
+        """Depo dizininin dosya sistemi sabit bağlantıları destekliyor mu"""
+        if self._supported is None:
+            os.makedirs(self.root, exist_ok=True)
+            probe = os.path.join(self.root, ".probe")
+            try:
+                with open(probe, 'wb'):
+                    pass
+                os.link(probe, probe + ".link")
+                os.remove(probe + ".link")
+                self._supported = True
+            except OSError:
+                self._supported = False
+            finally:
+                if os.path.exists(probe):
+                    os.remove(probe)
+        return self._supported
+
+    def hash_file(self, path, job=None):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(self.HASH_CHUNK)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                if job:
+                    job.advance(len(chunk))
+        return digest.hexdigest()
+
+    def ingest_tree(self, tree_path, manifest, job=None):
+        """Ağaçtaki dosyaları depoya alır, kopyaları bloblara bağlar
+
+        Manifest girdilerini doldurur ve kazanılan bayt miktarını döndürür.
+        Zaten bağlanmış dosyalar atlandığı için yarıda kalırsa yeniden
+        çalıştırılabilir.
+        """
+        saved = 0
+        files = [(rel, entry) for kind, rel, entry in FolderStats.walk(tree_path) if kind == "f"]
+        if job:
+            job.set_total(sum(entry.stat().st_size for rel, entry in files), len(files))
+
+        for rel_path, entry in files:
+            file_path = entry.path
+            digest = self.hash_file(file_path, job)
+            blob = self.blob_path(digest)
+
+            # Önce blob olarak bağlanmayı dener: toplu gizlemede aynı içeriği
+            # alan iki iş parçacığından yalnızca biri blobu oluşturabilir
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.link(file_path, blob)
+            except FileExistsError:
+                if not os.path.samefile(blob, file_path):
+                    # Aynı içerik zaten depoda: dosyayı bloba bağla
+                    link_path = file_path + ".dedup"
+                    os.link(blob, link_path)
+                    os.replace(link_path, file_path)
+                    saved += entry.stat().st_size
+
+            manifest.entries.setdefault(rel_path, {})["h"] = digest
+            if job:
+                job.advance(0, 1)
+
+        return saved
+
+    def materialize_tree(self, tree_path, manifest, job=None):
+        """Ağaçtaki dosyaların depoyla bağını koparır (klasör gösterilirken)
+
+        Blobu yalnızca bu dosya kullanıyorsa blob depodan çıkarılır ve veri
+        kopyalanmaz; paylaşılan bloblar için dosyanın kendi kopyası yazılır.
+        """
+        for rel_path, fields in manifest.entries.items():
+            if "h" not in fields:
+                continue
+            file_path = os.path.join(tree_path, rel_path)
+            blob = self.blob_path(fields["h"])
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+
+            if st.st_nlink > 1 and os.path.exists(blob) and os.path.samefile(blob, file_path):
+                if st.st_nlink == 2:
+                    os.remove(blob)
+                else:
+                    copy_path = file_path + ".dedup"
+                    shutil.copy2(blob, copy_path)
+                    os.replace(copy_path, file_path)
+            if job:
+                job.advance(0, 1)
+
+    def release(self, manifest):
+        """Manifestteki bloblardan artık kullanılmayanları siler"""
+        freed = 0
+        for fields in manifest.entries.values():
+            if "h" in fields:
+                freed += self._remove_if_unused(self.blob_path(fields["h"]))
+        return freed
+
+    def collect_garbage(self, job=None):
+        """Tüm depoyu tarayıp hiçbir klasörün kullanmadığı blobları siler"""
+        freed = 0
+        if not os.path.isdir(self.root):
+            return freed
+
+        for prefix in os.listdir(self.root):
+            prefix_dir = os.path.join(self.root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                freed += self._remove_if_unused(os.path.join(prefix_dir, name))
+                if job:
+                    job.check_cancelled()
+        return freed
+
+    def _remove_if_unused(self, blob):
+        try:
+            st = os.stat(blob)
+        except FileNotFoundError:
+            return 0
+        if st.st_nlink == 1:
+            os.remove(blob)
+            return st.st_size
+        return 0
+
+class FolderMover:
+    """Klasörleri gizli dizine ve geri taşıyan motor"""
+
+    def __init__(self, copier=None):
+        self.copier = copier or ParallelCopier()
+
+    def same_device(self, src, dst):
+        """Kaynak ile hedefin üst dizini aynı dosya sisteminde mi"""
+        dst_parent = os.path.dirname(os.path.abspath(dst))
+        try:
+            return os.stat(src).st_dev == os.stat(dst_parent).st_dev
+        except OSError:
+            return False
+
+    def move(self, src, dst, job=None, collect_stats=False, transform=None, journal=None,
+             keep_source=False):
+        """Klasörü taşır; mümkünse atomik rename, değilse doğrulamalı kopyala-sil
+
+        (yöntem, istatistik) döndürür; yöntem "rename" veya "copy" olur.
+        İstatistikler kopyalama sırasında toplanır, rename yolunda yalnızca
+        collect_stats istenirse hedef bir kez taranır. transform verilirse
+        (ör. şifreleme) her dosya onunla yeniden yazılır, rename yapılmaz.
+        journal verilirse aşamalar ve biten dosyalar günlüğe işlenir.
+        keep_source verilirse kaynak silinmez (anlık görüntü); destekleyen
+        dosya sistemlerinde dosyalar klonlandığı için veri çoğaltılmaz.
+        İş iptal edilir ya da kopya başarısız olursa kaynak olduğu gibi kalır;
+        günlüksüz yarım kopya silinir, günlüklü yarım kopya ise sürdürülebilsin
+        diye bırakılır (geri alıp almamaya günlüğün sahibi karar verir).
+        """
+        if os.path.exists(dst):
+            raise FileExistsError(f"Hedef zaten mevcut: {dst}")
+
+        dst_parent = os.path.dirname(os.path.abspath(dst))
+        if not os.path.exists(dst_parent):
+            os.makedirs(dst_parent)
+
+        # Aynı dosya sisteminde veri kopyalamadan taşı
+        if transform is None and not keep_source and self.same_device(src, dst):
+            try:
+                os.rename(src, dst)
+                if journal:
+                    journal.set_phase("renamed")
+                stats = FolderStats.scan(dst, keep_index=True) if collect_stats else None
+                return "rename", stats
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+
+        return "copy", self._copy_and_delete(src, dst, job, transform, journal, keep_source)
+
+    def resume(self, src, dst, journal, job=None, collect_stats=False, transform=None,
+               keep_source=False):
+        """Günlüğe göre yarıda kalmış bir taşımayı kaldığı yerden tamamlar"""
+        phase = journal.phase
+
+        if phase == "copied" and os.path.exists(src) and not keep_source:
+            # Kopya doğrulanmış, yalnızca kaynağın silinmesi kalmış
+            shutil.rmtree(src)
+            journal.set_phase("source_deleted")
+        elif phase is None:
+            if not os.path.exists(src):
+                if keep_source:
+                    # Anlık görüntüde kaynak hiç silinmez; yarım kopya tamamlanamaz
+                    shutil.rmtree(dst, ignore_errors=True)
+                    raise FileNotFoundError(f"Kaynak bulunamadı: {src}")
+                if not os.path.exists(dst):
+                    raise FileNotFoundError(f"Kaynak ve hedef bulunamadı: {src}")
+                # Rename tamamlanmış fakat günlüğe yazılamamış
+                journal.set_phase("renamed")
+            elif not os.path.exists(dst):
+                # İşlem hiç başlamamış
+                return self.move(src, dst, job, collect_stats, transform, journal, keep_source)
+            else:
+                # Yarım kopya: kopyalanmış dosyaları atlayarak devam et
+                stats = self._copy_and_delete(src, dst, job, transform, journal, keep_source)
+                return "copy", stats
+
+        stats = FolderStats.scan(dst, keep_index=True) if collect_stats else None
+        return "resume", stats
+
+    def _copy_and_delete(self, src, dst, job, transform, journal, keep_source=False):
+        # Farklı cihazlar: önce kopyala, doğrula, sonra kaynağı sil
+        try:
+            stats = self.copier.copy_tree(src, dst, job=job, file_func=transform, journal=journal)
+            # Dönüştürülen dosyaların boyutu değişir; yalnızca liste karşılaştırılır
+            self.verify_copy(stats.entries, dst, check_sizes=transform is None)
+        except BaseException:
+            # Günlüklü kopyanın ilerlemesi silinmez: aşama değişmeden kalır ve
+            # resume kopyalanmış dosyaları atlayarak devam eder
+            if journal is None:
+                shutil.rmtree(dst, ignore_errors=True)
+            raise
+
+        if journal:
+            journal.set_phase("copied")
+        if keep_source:
+            stats.entries = None
+            return stats
+        if job:
+            # Kaynak silinmeye başlandıktan sonra geri dönüş yok
+            job.check_cancelled()
+        shutil.rmtree(src)
+        if journal:
+            journal.set_phase("source_deleted")
+        stats.entries = None
+        return stats
+
+    def remove(self, folder_path, job=None):
+        """Klasörü dosya dosya siler, ilerlemeyi işe bildirir"""
+        for dirpath, dirnames, filenames in os.walk(folder_path, topdown=False):
+            for f in filenames:
+                os.remove(os.path.join(dirpath, f))
+                if job:
+                    job.advance(0, 1)
+            for d in dirnames:
+                dp = os.path.join(dirpath, d)
+                if os.path.islink(dp):
+                    os.remove(dp)
+                else:
+                    os.rmdir(dp)
+        os.rmdir(folder_path)
+
+    def verify_copy(self, src_entries, dst, check_sizes=True):
+        """Kopyanın dosya listesi ve boyutlarının kaynakla aynı olduğunu doğrular"""
+        dst_entries = self._snapshot(dst)
+
+        if check_sizes:
+            mismatch = src_entries != dst_entries
+        else:
+            mismatch = src_entries.keys() != dst_entries.keys()
+
+        if mismatch:
+            missing = set(src_entries) - set(dst_entries)
+            raise IOError(
+                f"Kopya doğrulanamadı ({len(missing)} eksik veya farklı öğe)"
+            )
+
+    def _snapshot(self, folder_path):
+        """Göreli yol -> boyut (klasörler için None) eşlemesi çıkarır"""
+        return FolderStats.scan(folder_path, keep_entries=True).entries
+
+class FolderHiderApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Klasör Gizleme Uygulaması")
+        self.root.geometry("1000x700")
+        self.root.minsize(800, 600)
+        
+        # Tema seçimi
+        self.themes = {
+            "Açık": ModernTheme.Light,
+            "Koyu": ModernTheme.Dark,
+            "Neon Koyu": ModernTheme.NeonDark,
+            "Orman": ModernTheme.Forest,
+            "Okyanus": ModernTheme.Ocean
+        }
+        
+        # Varsayılan temayı ayarla
+        self.current_theme = "Koyu"
+        self.theme = self.themes[self.current_theme]
+        
+        # CustomTkinter ayarları
+        ctk.set_appearance_mode("dark" if "Dark" in self.current_theme else "light")
+        ctk.set_default_color_theme("blue")
+        
+        # Uygulama verilerinin saklanacağı dizin
+        self.app_data_dir = os.path.join(os.getenv('APPDATA') or os.path.expanduser('~/.config'), 'FolderHider')
+        if not os.path.exists(self.app_data_dir):
+            os.makedirs(self.app_data_dir)
+            
+        self.settings_file = os.path.join(self.app_data_dir, "settings.json")
+        self.hidden_dir = os.path.join(self.app_data_dir, "hidden")
+        if not os.path.exists(self.hidden_dir):
+            os.makedirs(self.hidden_dir)
+        self.journal_dir = os.path.join(self.app_data_dir, "journal")
+        
+        # Gezginlerin çözdüğü geçici dosyalar pencere kapanınca silinir;
+        # çökmeden kalan düz içerikli dosyalar açılışta temizlenir
+        shutil.rmtree(os.path.join(self.app_data_dir, "tmp"), ignore_errors=True)
+            
+        self.salt = b'klasorgizle_salt_456789'  # Daha güçlü salt değeri
+        self.hidden_folders = CatalogEntries()
+        self.catalog = None  # Giriş yapılınca açılan şifreli katalog (CatalogLog ya da SqliteCatalog)
+
+        self.current_password = None
+        self.is_authenticated = False
+        
+        # Oturum boyunca bir kez türetilen anahtar (bkz. _open_session)
+        self.session_cipher = None
+        self.kdf = KeyDerivation.from_header(None, self.salt)
+        
+        # Ayarları yükle
+        self.settings = self._load_settings()
+        
+        # Katalog arka ucu: varsayılan şifreli günlük, büyük kasalar için SQLite
+        if self.settings.get("catalog_backend") == "sqlite":
+            self.catalog_class = SqliteCatalog
+        else:
+            self.catalog_class = CatalogLog
+        self.config_file = os.path.join(self.app_data_dir, self.catalog_class.FILE_NAME)
+        
+        # Kopyalama/taşıma motoru (depolama türüne göre ayarlanabilir)
+        self.copier = ParallelCopier(worker_profiles=self.settings.get("copy_workers"))
+        self.mover = FolderMover(self.copier)
+        self.store = DedupStore(os.path.join(self.hidden_dir, ".store"))
+        
+        # Arka plan işleri
+        self.jobs = JobManager(self.root, on_update=self._on_jobs_update)
+        # Kısa süren arka plan okumaları (ör. boyut yenileme) ağır işleri beklemez
+        self.background_jobs = JobManager(self.root)
+        self.stats_engine = FolderStatsEngine(workers=self.settings.get("stats_workers", 8))
+        self._stats_job = None
+        # Gezginlerin ortak dizin listesi önbelleği (geri/yukarı gezinme)
+        self.listing_cache = ListingCache(
+            max_entries=self.settings.get("listing_cache_entries", 64),
+            max_bytes=self.settings.get("listing_cache_mb", 64) * 1024 * 1024
+        )
+        self.catalog_commit = GroupCommit(self.root, self._commit_catalog)
+        self.busy_folder_ids = set()
+        self.pending_hide_paths = set()
+        
+        # Gezginler arası kopyala/kes/yapıştır panosu ve açık gezginler (klasör id -> pencere)
+        self.explorer_clipboard = None
+        self.explorers = {}
+        
+        # Tema ayarını uygula
+        if "theme" in self.settings:
+            self.current_theme = self.settings["theme"]
+            self.theme = self.themes[self.current_theme]
+        
+        # UI kurulumu
+        self.setup_ui()
+        self.check_first_run()
+        
+        # Pencere kapatılırken devam eden işleri kontrol et
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+    def _load_settings(self):
+        """Kullanıcı ayarlarını yükle"""
+        if os.path.exists(self.settings_file):
+            try:
+                with open(self.settings_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                return {"theme": "Koyu"}
+        return {"theme": "Koyu"}
+    
+    def _save_settings(self):
+        """Kullanıcı ayarlarını kaydet"""
+        try:
+            AtomicWriter.write(self.settings_file, json.dumps(self.settings).encode('utf-8'))
+        except Exception as e:
+            print(f"Ayarlar kaydedilemedi: {str(e)}")
+    
+    def setup_ui(self):
+        # Ana çerçeveler
+        self.login_frame = ctk.CTkFrame(self.root)
+        self.main_frame = ctk.CTkFrame(self.root)
+        
+        # Login çerçevesi
+        login_header = ctk.CTkLabel(
+            self.login_frame, 
+            text="Klasör Gizleme Uygulaması", 
+            font=ctk.CTkFont(size=24, weight="bold")
+        )
+        login_header.pack(pady=(40, 20))
+        
+        # Logo veya ikon (burada bir metin olarak temsil edildi)
+        logo_frame = ctk.CTkFrame(self.login_frame, fg_color="transparent")
+        logo_frame.pack(pady=(0, 30))
+        
+        logo_text = ctk.CTkLabel(
             logo_frame, 
             text="🔒", 
             font=ctk.CTkFont(size=64)
@@ -1170,6 +5006,16 @@ class FolderHiderApp:
         )
         list_header.pack(pady=(10, 5), anchor=tk.W, padx=10)
         
+        # Ada göre arama (katalog indeksinden)
+        self.folder_search_var = tk.StringVar()
+        self.folder_search_var.trace_add("write", lambda *args: self.update_folder_list())
+        folder_search = ctk.CTkEntry(
+            left_panel,
+            textvariable=self.folder_search_var,
+            placeholder_text="Klasör ara..."
+        )
+        folder_search.pack(fill=tk.X, padx=5)
+        
         # Klasör listesi
         self.folder_list_frame = ctk.CTkScrollableFrame(left_panel)
         self.folder_list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -1194,6 +5040,29 @@ class FolderHiderApp:
         )
         self.hide_btn.pack(side=tk.LEFT, padx=5)
         
+        self.batch_hide_btn = ctk.CTkButton(
+            button_panel, 
+            text="🗂 Toplu Gizle", 
+            command=self.show_batch_hide_dialog,
+            width=130,
+            height=35,
+            border_width=0,
+            corner_radius=8
+        )
+        self.batch_hide_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Kaynağı yerinde bırakıp gizli bir kopya al
+        self.snapshot_btn = ctk.CTkButton(
+            button_panel, 
+            text="📸 Anlık Görüntü", 
+            command=self.snapshot_folder,
+            width=140,
+            height=35,
+            border_width=0,
+            corner_radius=8
+        )
+        self.snapshot_btn.pack(side=tk.LEFT, padx=5)
+        
         self.unhide_btn = ctk.CTkButton(
             button_panel, 
             text="🔓 Seçili Klasörü Göster", 
@@ -1237,7 +5106,7 @@ class FolderHiderApp:
         self.browser_btn = ctk.CTkButton(
             special_buttons_panel, 
             text="🌐 Gizli Tarayıcı", 
-            command=self.open_browser,
+            command=self.open_private_browser,
             width=150,
             height=35,
             fg_color="#7986CB",
@@ -1261,6 +5130,37 @@ class FolderHiderApp:
         )
         self.change_pw_btn.pack(side=tk.LEFT, padx=5)
         
+        # İçerik şifreleme anahtarı (yeni gizlenen klasörler için)
+        self.encrypt_var = tk.BooleanVar(value=self.settings.get("encrypt_contents", False))
+        self.encrypt_switch = ctk.CTkSwitch(
+            special_buttons_panel,
+            text="İçerikleri Şifrele",
+            variable=self.encrypt_var,
+            command=self.toggle_content_encryption
+        )
+        self.encrypt_switch.pack(side=tk.LEFT, padx=10)
+        
+        # Aynı içerikli dosyaları bir kez saklama
+        self.dedup_var = tk.BooleanVar(value=self.settings.get("dedup_store", False))
+        self.dedup_switch = ctk.CTkSwitch(
+            special_buttons_panel,
+            text="Tekilleştir",
+            variable=self.dedup_var,
+            command=self.toggle_dedup_store
+        )
+        self.dedup_switch.pack(side=tk.LEFT, padx=10)
+        
+        # Sıkıştırma algoritması (resim, video, ses ve arşivler atlanır)
+        self.compression_var = tk.StringVar(value=self.settings.get("compression", "yok"))
+        self.compression_menu = ctk.CTkOptionMenu(
+            special_buttons_panel,
+            values=["yok"] + ContentCompressor.available(),
+            variable=self.compression_var,
+            command=self.change_compression,
+            width=90
+        )
+        self.compression_menu.pack(side=tk.LEFT, padx=5)
+        
         # Çıkış butonu
         self.logout_btn = ctk.CTkButton(
             special_buttons_panel, 
@@ -1342,6 +5242,21 @@ class FolderHiderApp:
         )
         self.status_label.pack(side=tk.LEFT, padx=10)
         
+        # İş ilerleme çubuğu ve iptal butonu (yalnızca iş varken görünür)
+        self.job_cancel_btn = ctk.CTkButton(
+            status_bar,
+            text="✖ İptal",
+            command=self.cancel_current_job,
+            width=70,
+            height=22,
+            fg_color="#F44336",
+            hover_color="#D32F2F",
+            border_width=0,
+            corner_radius=8
+        )
+        self.job_progress = ctk.CTkProgressBar(status_bar, width=200)
+        self.job_progress.set(0)
+        
         self.version_label = ctk.CTkLabel(
             status_bar, 
             text="v1.0.0", 
@@ -1357,7 +5272,7 @@ class FolderHiderApp:
     
     def check_first_run(self):
         """İlk çalıştırma kontrolü ve şifre oluşturma"""
-        if not os.path.exists(self.config_file):
+        if not os.path.exists(self._catalog_source()[1]):
             self.login_frame.pack_forget()
             self.setup_password()
         
@@ -1438,21 +5353,12 @@ class FolderHiderApp:
             messagebox.showerror("Hata", "Şifre en az 6 karakter olmalıdır.")
             return
         
-        # Şifreyi kaydet
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        
-        # Boş hidden_folders sözlüğünü şifrele ve kaydet
-        cipher_suite = Fernet(key)
-        encrypted_data = cipher_suite.encrypt(json.dumps({}).encode())
+        # KDF maliyetini bu makineye göre ayarla ve anahtarı türet
+        kdf = self._calibrated_kdf()
+        key = kdf.derive(password)
         
-        with open(self.config_file, 'wb') as f:
-            f.write(encrypted_data)
+        # Boş kataloğu seçili arka uçla oluştur (KDF parametreleri başlıkta)
+        self.catalog_class.create(self.config_file, Fernet(key), header=kdf.to_header()).close()
         
         # Kurulum ekranını kapat, login ekranını göster
         self.setup_frame.pack_forget()
@@ -1468,21 +5374,21 @@ class FolderHiderApp:
             return
         
         try:
-            # Şifreyi doğrula
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=self.salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-            
-            with open(self.config_file, 'rb') as f:
-                encrypted_data = f.read()
+            # Şifreyi kasa başlığındaki KDF parametreleriyle doğrula
+            catalog_class, catalog_file = self._catalog_source()
+            kdf = KeyDerivation.from_header(catalog_class.read_header(catalog_file), self.salt)
+            cipher = Fernet(kdf.derive(password))
             
-            cipher_suite = Fernet(key)
-            decrypted_data = cipher_suite.decrypt(encrypted_data).decode()
-            self.hidden_folders = json.loads(decrypted_data)
+            # Kataloğun yalnızca özetlerini oku; kayıtlar seçilince çözülür
+            # (eski biçimli dosyalar ilk girişte dönüştürülür)
+            catalog = catalog_class(catalog_file, cipher, header=kdf.to_header())
+            self.hidden_folders = catalog.load()
+            if catalog_class is not self.catalog_class:
+                catalog = self._migrate_catalog(catalog, self.hidden_folders)
+                self.hidden_folders = catalog.load()
+            self.catalog = catalog
+            self.kdf = kdf
+            self.session_cipher = cipher
             
             # Başarılı giriş
             self.current_password = password
@@ -1496,15 +5402,58 @@ class FolderHiderApp:
             # Durum çubuğunu güncelle
             self.status_label.configure(text="Giriş başarılı")
             
+            # Yarıda kalmış işlemleri sürdür
+            try:
+                self.resume_pending_operations()
+            except Exception as e:
+                self.status_label.configure(text=f"Yarım kalan işlemler sürdürülemedi: {str(e)}")
+            
+        except CatalogCorrupt as e:
+            messagebox.showerror("Hata", f"Katalog dosyası bozuk, değiştirilmeden bırakıldı: {str(e)}")
+            self.password_entry.delete(0, tk.END)
         except Exception as e:
             messagebox.showerror("Hata", "Yanlış şifre veya bozuk veri.")
             self.password_entry.delete(0, tk.END)
     
+    def _catalog_source(self):
+        """Girişte okunacak katalog (arka uç sınıfı, dosya yolu)
+
+        Ayarlarda arka uç değiştirildiyse ve yeni dosya henüz yoksa eski
+        arka ucun dosyası okunur; giriş sonrası _migrate_catalog aktarır.
+        """
+        if not os.path.exists(self.config_file):
+            for catalog_class in (CatalogLog, SqliteCatalog):
+                path = os.path.join(self.app_data_dir, catalog_class.FILE_NAME)
+                if catalog_class is not self.catalog_class and os.path.exists(path):
+                    return catalog_class, path
+        return self.catalog_class, self.config_file
+    
+    def _migrate_catalog(self, old_catalog, entries):
+        """Kataloğu seçili arka uca aktarır, eski dosyayı .bak olarak saklar"""
+        catalog = self.catalog_class.create(
+            self.config_file, old_catalog.cipher, entries, header=old_catalog.header
+        )
+        old_catalog.close()
+        os.replace(old_catalog.path, old_catalog.path + ".bak")
+        return catalog
+    
     def logout(self):
         """Oturumu kapat"""
+        if self.jobs.is_busy():
+            messagebox.showwarning("Uyarı", "Devam eden işlemler bitmeden çıkış yapılamaz.")
+            return
+        
         self.is_authenticated = False
         self.current_password = None
-        self.hidden_folders = {}
+        # Bekleyen katalog değişikliklerini yazıp kataloğu kapat
+        self.flush_hidden_folders()
+        self.hidden_folders = CatalogEntries()
+        self.explorer_clipboard = None
+        self.listing_cache.clear()
+        if self.catalog:
+            self.catalog.close()
+        self.catalog = None
+        self.session_cipher = None
         
         # UI sıfırla
         self.main_frame.pack_forget()
@@ -1515,6 +5464,15 @@ class FolderHiderApp:
         """Şifre değiştirme penceresi"""
         if not self.is_authenticated:
             return
+        
+        # Günlükler ve manifestler oturum anahtarıyla şifrelidir
+        if self.jobs.is_busy():
+            messagebox.showwarning("Uyarı", "Devam eden işlemler bitmeden şifre değiştirilemez.")
+            return
+        if os.path.isdir(self.journal_dir) and any(name.endswith(".jnl") for name in os.listdir(self.journal_dir)):
+            # Sürdürülemeyen günlükler yeni anahtarla açılamazdı
+            messagebox.showwarning("Uyarı", "Yarım kalan işlemler tamamlanmadan şifre değiştirilemez.")
+            return
             
         password_window = ctk.CTkToplevel(self.root)
         password_window.title("Şifre Değiştir")
@@ -1580,27 +5538,36 @@ class FolderHiderApp:
                 
             # Şifre değiştirme
             try:
-                # Yeni şifre ile veriyi şifrele
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    length=32,
-                    salt=self.salt,
-                    iterations=100000,
-                )
-                key = base64.urlsafe_b64encode(kdf.derive(new_pw.encode()))
-                
-                cipher_suite = Fernet(key)
-                encrypted_data = cipher_suite.encrypt(json.dumps(self.hidden_folders).encode())
-                
-                with open(self.config_file, 'wb') as f:
-                    f.write(encrypted_data)
-                
-                self.current_password = new_pw
-                messagebox.showinfo("Başarılı", "Şifreniz başarıyla değiştirildi.")
-                password_window.destroy()
+                # Yeni şifre ile veriyi şifrele (yeni tuz, güncel maliyet)
+                kdf = self._calibrated_kdf()
+                new_cipher = Fernet(kdf.derive(new_pw))
                 
+                self.flush_hidden_folders()
+                # Manifestler önce yanlarına yeni anahtarla yazılır; katalog
+                # kaydedilmeden eski dosyalara dokunulmaz. Burada kalan hazırlık
+                # dosyalarını sonraki giriş kataloğun anahtarına göre bitirir.
+                self._stage_manifest_rekey(new_cipher)
+                self.catalog.rekey(new_cipher, self.hidden_folders, header=kdf.to_header())
             except Exception as e:
                 messagebox.showerror("Hata", f"Şifre değiştirilemedi: {str(e)}")
+                return
+            
+            self.current_password = new_pw
+            self.kdf = kdf
+            self.session_cipher = new_cipher
+            
+            # Katalog yeni anahtarda: hazırlanan manifestler yerlerine geçer,
+            # açık gezginler de bundan sonra yeni anahtarla kaydeder
+            try:
+                self._finish_manifest_rekey(new_cipher)
+            except Exception as e:
+                messagebox.showwarning("Uyarı", f"Bazı klasör manifestleri bir sonraki girişte güncellenecek: {str(e)}")
+            for explorer in self.explorers.values():
+                if explorer.manifest is not None:
+                    explorer.manifest.cipher = new_cipher
+            
+            messagebox.showinfo("Başarılı", "Şifreniz başarıyla değiştirildi.")
+            password_window.destroy()
         
         save_button = ctk.CTkButton(
             button_frame,
@@ -1648,6 +5615,21 @@ class FolderHiderApp:
         if self.is_authenticated:
             self.update_folder_list()
     
+    def toggle_content_encryption(self):
+        """Yeni gizlenen klasörlerin içeriğinin şifrelenip şifrelenmeyeceğini ayarla"""
+        self.settings["encrypt_contents"] = self.encrypt_var.get()
+        self._save_settings()
+    
+    def toggle_dedup_store(self):
+        """Yeni gizlenen klasörlerin ortak içerik deposunu kullanıp kullanmayacağını ayarla"""
+        self.settings["dedup_store"] = self.dedup_var.get()
+        self._save_settings()
+    
+    def change_compression(self, algorithm):
+        """Yeni gizlenen klasörler için sıkıştırma algoritmasını ayarla"""
+        self.settings["compression"] = algorithm
+        self._save_settings()
+    
     def change_theme(self, theme_name):
         """Temayı değiştir"""
         self.current_theme = theme_name
@@ -1668,9 +5650,9 @@ class FolderHiderApp:
             no_folders_label.pack(pady=50)
             return
         
-        # Her gizli klasör için bir buton oluştur
-        for folder_id, folder_info in self.hidden_folders.items():
-            folder_name = folder_info.get("name", "Bilinmeyen Klasör")
+        # Her gizli klasör için bir buton oluştur (en yeni en üstte)
+        for folder_id in self._listed_folder_ids():
+            folder_name = self.hidden_folders.summary(folder_id)["name"] or "Bilinmeyen Klasör"
             
             frame = ctk.CTkFrame(self.folder_list_frame, fg_color="transparent")
             frame.pack(fill=tk.X, pady=2)
@@ -1692,6 +5674,15 @@ class FolderHiderApp:
         # Seçili klasör bilgilerini güncelle
         self.clear_selection()
     
+    def _listed_folder_ids(self):
+        """Listede gösterilecek klasör ID'leri: aramaya uyanlar, tarihe göre sıralı"""
+        query = self.folder_search_var.get().strip()
+        ordered = self.catalog.ids_by_date()
+        if query:
+            matches = set(self.catalog.search_names(query))
+            ordered = [folder_id for folder_id in ordered if folder_id in matches]
+        return [folder_id for folder_id in ordered if folder_id in self.hidden_folders]
+    
     def select_folder(self, folder_id):
         """Bir klasörü seç ve bilgilerini göster"""
         if folder_id in self.hidden_folders:
@@ -1704,15 +5695,20 @@ class FolderHiderApp:
             hide_date = folder_info.get("hide_date", "")
             self.selected_date_var.set(hide_date)
             
+            # Önizleme metni (eski kayıtlarda boyut bilgisini de tamamlar)
+            hidden_path = os.path.join(self.hidden_dir, folder_id)
+            preview_text = self.get_folder_preview(hidden_path, folder_info)
+            
             size = folder_info.get("size", 0)
             size_str = self.format_size(size)
             self.selected_size_var.set(size_str)
             
             self.selected_status_var.set("Gizli")
             
+            # Kayıttaki boyutu arka planda diskle karşılaştır
+            self._refresh_folder_stats(folder_id)
+            
             # Önizleme içeriğini güncelle
-            hidden_path = os.path.join(self.hidden_dir, folder_id)
-            preview_text = self.get_folder_preview(hidden_path)
             self.preview_content.delete("1.0", tk.END)
             self.preview_content.insert("1.0", preview_text)
             
@@ -1741,35 +5737,107 @@ class FolderHiderApp:
         
         self.selected_folder_id = None
     
-    def get_folder_preview(self, folder_path):
-        """Klasör içeriğinin önizlemesini oluşturur"""
-        preview_text = "Klasör İçeriği:\n\n"
+    def _refresh_folder_stats(self, folder_id):
+        """Gizli klasörün boyut ve sayılarını arka planda yeniden hesaplar
+
+        Değişmemiş dizinler FolderStatsEngine önbelleğinden gelir. Şifreli
+        ya da sıkıştırılmış klasörlerde diskteki boyut orijinal boyut
+        olmadığından kayıttaki (manifestten güncellenen) değerler kullanılır;
+        bunlarda yalnızca eski kayıtların eksik sayıları tamamlanır.
+        Sayılar gelince önizlemedeki toplamlar da güncellenir.
+        """
+        folder_info = self.hidden_folders.get(folder_id)
+        if not folder_info or folder_id in self.busy_folder_ids:
+            return
+        
+        encoded = VaultCodec.from_record(folder_info) is not None
+        if encoded and "file_count" in folder_info:
+            return
+        
+        if self._stats_job:
+            self._stats_job.cancel()
+        
+        hidden_path = os.path.join(self.hidden_dir, folder_id)
         
+        def work(job):
+            return self.stats_engine.scan(hidden_path, key=folder_id, job=job)
+        
+        def done(job):
+            stats = job.result
+            info = self.hidden_folders.get(folder_id)
+            if info is None or folder_id in self.busy_folder_ids:
+                return
+            
+            changed = False
+            fields = ("file_count", "dir_count") if encoded else ("size", "file_count", "dir_count")
+            for field in fields:
+                if info.get(field) != stats[field]:
+                    info[field] = stats[field]
+                    changed = True
+            if changed:
+                self.save_hidden_folders()
+            
+            if self.selected_folder_id == folder_id:
+                self.selected_size_var.set(self.format_size(info.get("size", 0)))
+                if changed:
+                    self.preview_content.delete("1.0", tk.END)
+                    self.preview_content.insert("1.0", self.get_folder_preview(hidden_path, info))
+                if stats["errors"]:
+                    self.status_label.configure(
+                        text=f"{len(stats['errors'])} öğe okunamadı, boyut eksik olabilir"
+                    )
+        
+        self._stats_job = self.background_jobs.submit(
+            Job("Boyut hesaplanıyor", work, on_done=done)
+        )
+    
+    def get_folder_preview(self, folder_path, folder_info=None):
+        """Klasör içeriğinin önizlemesini oluşturur
+
+        Gizlenirken kayda yazılan önizleme ve sayılar kullanılır. Eski
+        kayıtlarda önizleme sınırlı bir dolaşımla çıkarılıp kayda eklenir;
+        eksik sayılar _refresh_folder_stats ile arka planda tamamlanır.
+        """
         try:
-            file_count = 0
-            dir_count = 0
-            
-            for root, dirs, files in os.walk(folder_path):
-                rel_path = os.path.relpath(root, folder_path)
-                if rel_path != ".":
-                    preview_text += f"📁 {rel_path}\n"
-                    dir_count += 1
-                
-                for file in files:
-                    if file_count < 20:  # Çok fazla dosya göstermeyelim
-                        file_path = os.path.join(rel_path, file)
-                        if rel_path == ".":
-                            preview_text += f"📄 {file}\n"
-                        else:
-                            preview_text += f"  📄 {file_path}\n"
-                    file_count += 1
+            if folder_info is not None and "preview" in folder_info:
+                preview = folder_info["preview"]
+            else:
+                preview = FolderStats.preview_of(folder_path)
+                if folder_info is not None:
+                    folder_info["preview"] = preview
+                    self.save_hidden_folders()
+            
+            lines = ["Klasör İçeriği:\n"]
+            
+            for kind, rel_path in preview:
+                if kind == "d":
+                    lines.append(f"📁 {rel_path}")
+                elif os.path.dirname(rel_path):
+                    lines.append(f"  📄 {rel_path}")
+                else:
+                    lines.append(f"📄 {rel_path}")
             
-            total_count = file_count + dir_count
+            if folder_info is None or "file_count" not in folder_info:
+                lines.append("\nToplam: hesaplanıyor...")
+                return "\n".join(lines)
             
-            if file_count > 20:
-                preview_text += f"\n... ve {file_count - 20} dosya daha\n"
+            file_count = folder_info["file_count"]
+            dir_count = folder_info["dir_count"]
             
-            preview_text += f"\nToplam: {dir_count} klasör, {file_count} dosya"
+            if file_count > FolderStats.PREVIEW_LIMIT:
+                lines.append(f"\n... ve {file_count - FolderStats.PREVIEW_LIMIT} dosya daha")
+            
+            lines.append(f"\nToplam: {dir_count} klasör, {file_count} dosya")
+            
+            compression = folder_info.get("compression")
+            if compression and compression.get("raw"):
+                ratio = compression["stored"] / compression["raw"]
+                speed = compression["raw"] / max(compression["seconds"], 0.001)
+                lines.append(
+                    f"Sıkıştırma ({compression['algo']}): %{ratio * 100:.0f} oran, "
+                    f"{self.format_size(speed)}/s"
+                )
+            preview_text = "\n".join(lines)
             
         except Exception as e:
             preview_text = f"Önizleme yüklenemedi: {str(e)}"
@@ -1788,19 +5856,8 @@ class FolderHiderApp:
             return f"{size_bytes/(1024*1024*1024):.1f} GB"
     
     def get_folder_size(self, folder_path):
-        """Klasör boyutunu hesaplar"""
-        total_size = 0
-        
-        try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    if os.path.exists(fp):
-                        total_size += os.path.getsize(fp)
-        except:
-            pass
-            
-        return total_size
+        """Klasör boyutunu hesaplar (okunamayan öğeler atlanır, bkz. FolderStatsEngine)"""
+        return self.stats_engine.scan(folder_path)["size"]
     
     def hide_folder(self):
         """Yeni bir klasörü gizle"""
@@ -1816,46 +5873,229 @@ class FolderHiderApp:
         # Klasör adını al
         folder_name = os.path.basename(folder_path)
         
-        # Klasör zaten gizli mi kontrol et
-        for folder_id, info in self.hidden_folders.items():
-            if info.get("original_path") == folder_path:
-                messagebox.showerror("Hata", "Bu klasör zaten gizlenmiş.")
-                return
+        error = self._check_hide_path(folder_path)
+        if error:
+            messagebox.showerror("Hata", error)
+            return
         
-        try:
-            # Yeni benzersiz ID oluştur
-            folder_id = self.generate_id()
+        folder_id, target_path, record = self._new_hide_record(folder_path)
+        
+        def done(job):
+            self.pending_hide_paths.discard(folder_path)
             
-            # Gizli klasör için hedef yol
-            target_path = os.path.join(self.hidden_dir, folder_id)
+            # UI güncelle
+            self.update_folder_list()
+            self.status_label.configure(text=f"{folder_name} klasörü başarıyla gizlendi")
+            messagebox.showinfo("Başarılı", f"{folder_name} klasörü başarıyla gizlendi.")
+        
+        def failed(job):
+            self.pending_hide_paths.discard(folder_path)
+        
+        self.pending_hide_paths.add(folder_path)
+        self._start_transfer(
+            f"{folder_name} gizleniyor", "hide", folder_id, folder_path, target_path,
+            done, error_text="Klasör gizlenemedi", record=record, on_failed=failed
+        )
+    
+    def _check_hide_path(self, folder_path, snapshot=False):
+        """Klasör gizlenemiyorsa nedenini, gizlenebiliyorsa None döndürür"""
+        # Klasör zaten gizli mi kontrol et (anlık görüntüler kaynağı yerinde bırakır)
+        if not snapshot:
+            for folder_id in self.catalog.find_original_path(folder_path):
+                info = self.hidden_folders.get(folder_id)
+                if info and not info.get("snapshot"):
+                    return "Bu klasör zaten gizlenmiş."
+        
+        if folder_path in self.pending_hide_paths:
+            return "Bu klasör zaten gizleniyor."
+        
+        if not os.path.isdir(folder_path):
+            return "Klasör bulunamadı."
+        
+        return None
+    
+    def _new_hide_record(self, folder_path, snapshot=False):
+        """Gizlenecek klasör için (id, hedef yol, kayıt) üretir"""
+        # Yeni benzersiz ID oluştur
+        folder_id = self.generate_unique_id()
+        
+        # Gizli klasör için hedef yol
+        target_path = os.path.join(self.hidden_dir, folder_id)
+        
+        # Klasör kaydı, işlem tamamlanınca istatistiklerle birlikte kataloğa eklenir
+        record = {
+            "name": os.path.basename(folder_path),
+            "original_path": folder_path,
+            "hide_date": datetime.now().strftime('%d.%m.%Y %H:%M')
+        }
+        if snapshot:
+            record["name"] += " (anlık görüntü)"
+            record["snapshot"] = True
+        
+        # İçerik şifrelemesi açıksa klasöre özel anahtar üret
+        if self.settings.get("encrypt_contents", False):
+            record["content_key"] = ContentCipher.generate_key()
+        elif self.settings.get("dedup_store", False) and self.store.supported():
+            # Şifreli dosyalar rastgele tuz içerdiğinden yalnızca şifresiz klasörler tekilleştirilir
+            record["dedup"] = True
+        
+        # Sıkıştırma seçiliyse algoritma kayda yazılır (oran iş bitince eklenir)
+        compression = self.settings.get("compression", "yok")
+        if compression in ContentCompressor.available():
+            record["compression"] = {"algo": compression}
+        
+        return folder_id, target_path, record
+    
+    def snapshot_folder(self):
+        """Klasörün gizli bir kopyasını al, kaynağı yerinde bırak
+
+        Gizli dizin btrfs/XFS gibi reflink destekleyen bir dosya sistemindeyse
+        dosyalar veri kopyalanmadan anında klonlanır.
+        """
+        if not self.is_authenticated:
+            return
+        
+        folder_path = filedialog.askdirectory(title="Anlık Görüntüsü Alınacak Klasörü Seçin")
+        
+        if not folder_path:
+            return
+        
+        folder_name = os.path.basename(folder_path)
+        
+        error = self._check_hide_path(folder_path, snapshot=True)
+        if error:
+            messagebox.showerror("Hata", error)
+            return
+        
+        folder_id, target_path, record = self._new_hide_record(folder_path, snapshot=True)
+        cloned = (ContentCipher.from_record(record) is None and "compression" not in record
+                  and self.copier.supports_reflink(self.hidden_dir))
+        
+        def done(job):
+            self.pending_hide_paths.discard(folder_path)
             
-            # Klasörü kopyala
-            shutil.copytree(folder_path, target_path)
+            # UI güncelle
+            self.update_folder_list()
+            method = "klonlanarak " if cloned else ""
+            self.status_label.configure(text=f"{folder_name} klasörünün anlık görüntüsü {method}alındı")
+            messagebox.showinfo("Başarılı", f"{folder_name} klasörünün anlık görüntüsü alındı.")
+        
+        def failed(job):
+            self.pending_hide_paths.discard(folder_path)
+        
+        self.pending_hide_paths.add(folder_path)
+        self._start_transfer(
+            f"{folder_name} anlık görüntüsü alınıyor", "hide", folder_id, folder_path, target_path,
+            done, error_text="Anlık görüntü alınamadı", record=record, on_failed=failed
+        )
+    
+    def show_batch_hide_dialog(self):
+        """Birden çok klasörü gizlemek için seçim penceresini aç"""
+        if not self.is_authenticated:
+            return
+        BatchHideDialog(self.root, self.theme, on_confirm=self.hide_folders)
+    
+    def hide_folders(self, folder_paths):
+        """Birden çok klasörü tek bir işte, eşzamanlı taşıyarak gizler
+
+        Her klasör kendi günlüğüyle taşınır; katalog tüm klasörler bittikten
+        sonra bir kez kaydedilir ve liste bir kez yenilenir.
+        """
+        if not self.is_authenticated:
+            return
+        
+        transfers = []
+        skipped = []
+        
+        # Sıralama üst klasörleri alt klasörlerinden önce getirir
+        for folder_path in sorted(set(os.path.normpath(p) for p in folder_paths)):
+            error = self._check_hide_path(folder_path)
+            if error is None and any(folder_path.startswith(src + os.sep) for _, src, _, _ in transfers):
+                error = "Seçili başka bir klasörün içinde."
+            if error:
+                skipped.append(f"{os.path.basename(folder_path)}: {error}")
+                continue
             
-            # Klasör bilgilerini kaydet
-            size = self.get_folder_size(folder_path)
-            hide_date = datetime.now().strftime('%d.%m.%Y %H:%M')
+            folder_id, target_path, record = self._new_hide_record(folder_path)
+            journal, work = self._transfer_work("hide", folder_id, folder_path, target_path, record)
+            transfers.append((folder_id, folder_path, journal, work))
+            self.pending_hide_paths.add(folder_path)
+        
+        if not transfers:
+            messagebox.showerror("Hata", "Gizlenecek klasör yok.\n\n" + "\n".join(skipped))
+            return
+        
+        def work(job):
+            job.set_total(0, len(transfers))
+            results = {}
             
-            self.hidden_folders[folder_id] = {
-                "name": folder_name,
-                "original_path": folder_path,
-                "hide_date": hide_date,
-                "size": size
-            }
+            def run(transfer):
+                folder_id, folder_path, journal, transfer_work = transfer
+                child = job.child(os.path.basename(folder_path))
+                child.state = "çalışıyor"
+                try:
+                    child.check_cancelled()
+                    results[folder_id] = transfer_work(child)
+                    child.state = "tamamlandı"
+                except JobCancelled as e:
+                    results[folder_id] = e
+                    child.state = "iptal"
+                except Exception as e:
+                    # Bir klasörün hatası diğerlerini durdurmaz
+                    results[folder_id] = e
+                    child.state = "hata"
             
-            # Orijinal klasörü sil
-            shutil.rmtree(folder_path)
+            workers = self.settings.get("batch_workers", 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(run, transfers))
+            return results
+        
+        def finish(results):
+            committed = []
+            errors = list(skipped)
             
-            # Değişiklikleri kaydet
-            self.save_hidden_folders()
+            for folder_id, folder_path, journal, transfer_work in transfers:
+                self.pending_hide_paths.discard(folder_path)
+                result = results.get(folder_id, JobCancelled())
+                
+                if not isinstance(result, Exception):
+                    self._finish_transfer(journal, result, save=False)
+                    committed.append(journal)
+                elif self._abort_transfer(journal, save=False):
+                    committed.append(journal)
+                    errors.append(f"{os.path.basename(folder_path)}: kaynak tamamen silinemedi")
+                elif not isinstance(result, JobCancelled):
+                    errors.append(f"{os.path.basename(folder_path)}: {str(result)}")
+            hidden = len(committed)
             
-            # UI güncelle
+            # Katalog ve liste tüm klasörler için bir kez güncellenir; geri alınan
+            # işlemlerin günlüklerini _abort_transfer zaten kapatmıştır
+            if hidden:
+                self.save_hidden_folders()
+                self.flush_hidden_folders()
+            for journal in committed:
+                journal.close()
             self.update_folder_list()
-            self.status_label.configure(text=f"{folder_name} klasörü başarıyla gizlendi")
-            messagebox.showinfo("Başarılı", f"{folder_name} klasörü başarıyla gizlendi.")
             
-        except Exception as e:
-            messagebox.showerror("Hata", f"Klasör gizlenemedi: {str(e)}")
+            self.status_label.configure(text=f"{hidden}/{len(transfers)} klasör gizlendi")
+            if errors:
+                messagebox.showwarning(
+                    "Uyarı", f"{hidden} klasör gizlendi. Gizlenemeyenler:\n\n" + "\n".join(errors)
+                )
+            else:
+                messagebox.showinfo("Başarılı", f"{hidden} klasör başarıyla gizlendi.")
+        
+        def done(job):
+            finish(job.result)
+        
+        def failed(job):
+            finish({})
+            return True
+        
+        self._start_job(
+            f"{len(transfers)} klasör gizleniyor", work, done,
+            error_text="Klasörler gizlenemedi", on_failed=failed
+        )
     
     def unhide_folder(self):
         """Seçili klasörü göster (orijinal konumuna geri yükle)"""
@@ -1863,11 +6103,23 @@ class FolderHiderApp:
             return
             
         folder_id = self.selected_folder_id
+        if not self._check_not_busy(folder_id):
+            return
+        
         folder_info = self.hidden_folders[folder_id]
         
         folder_name = folder_info.get("name", "")
         original_path = folder_info.get("original_path", "")
         
+        # Anlık görüntünün kaynağı genelde yerindedir; yanına geri yüklenir
+        if folder_info.get("snapshot") and os.path.exists(original_path):
+            base_path = f"{original_path} (anlık görüntü)"
+            original_path = base_path
+            counter = 2
+            while os.path.exists(original_path):
+                original_path = f"{base_path} {counter}"
+                counter += 1
+        
         # Orijinal klasör yolu hala mevcut mu?
         if os.path.exists(original_path):
             answer = messagebox.askyesno(
@@ -1877,43 +6129,20 @@ class FolderHiderApp:
             if not answer:
                 return
         
-        try:
-            # Gizli klasör yolu
-            hidden_path = os.path.join(self.hidden_dir, folder_id)
-            
-            # Klasörü orijinal konumuna kopyala
-            shutil.copytree(hidden_path, original_path)
-            
-            # Gizli klasörü sil
-            shutil.rmtree(hidden_path)
-            
-            # Bilgileri listeden kaldır
-            del self.hidden_folders[folder_id]
-            
-            # Değişiklikleri kaydet
-            self.save_hidden_folders()
-            
+        # Gizli klasör yolu
+        hidden_path = os.path.join(self.hidden_dir, folder_id)
+        
+        def done(job):
             # UI güncelle
             self.update_folder_list()
             self.status_label.configure(text=f"{folder_name} klasörü orijinal konumuna geri yüklendi")
             messagebox.showinfo("Başarılı", f"{folder_name} klasörü orijinal konumuna geri yüklendi.")
-            
-        except Exception as e:
-            messagebox.showerror("Hata", f"Klasör gösterilemedi: {str(e)}")
-    
-    def open_folder(self):
-        """Seçili gizli klasörü aç"""
-        if not self.is_authenticated or not self.selected_folder_id:
-            return
-            
-        folder_id = self.selected_folder_id
-        hidden_path = os.path.join(self.hidden_dir, folder_id)
         
-        if os.path.exists(hidden_path):
-            # Klasör gezgini aç
-            FileExplorer(self, hidden_path, folder_id)
-        else:
-            messagebox.showerror("Hata", "Klasör açılamadı.")
+        # Klasörü orijinal konumuna taşı; kayıt iş bitince listeden kaldırılır
+        self._start_transfer(
+            f"{folder_name} gösteriliyor", "unhide", folder_id, hidden_path, original_path,
+            done, error_text="Klasör gösterilemedi"
+        )
     
     def remove_folder(self):
         """Seçili gizli klasörü kalıcı olarak sil"""
@@ -1921,6 +6150,9 @@ class FolderHiderApp:
             return
             
         folder_id = self.selected_folder_id
+        if not self._check_not_busy(folder_id):
+            return
+        
         folder_info = self.hidden_folders[folder_id]
         folder_name = folder_info.get("name", "")
         
@@ -1938,23 +6170,47 @@ class FolderHiderApp:
             # Gizli klasör yolu
             hidden_path = os.path.join(self.hidden_dir, folder_id)
             
-            # Klasörü sil
+            # Tekilleştirilmiş klasörün blobları silme sonrası serbest bırakılır
+            manifest = FolderManifest.for_folder(self.hidden_dir, folder_id, self._session_cipher())
+            if folder_info.get("dedup"):
+                manifest.load()
+            
+            # Klasörü önce çöp dizinine taşı (anında), silme arka planda yapılır
+            trash_dir = os.path.join(self.hidden_dir, ".trash")
+            if not os.path.exists(trash_dir):
+                os.makedirs(trash_dir)
             if os.path.exists(hidden_path):
-                shutil.rmtree(hidden_path)
+                os.rename(hidden_path, os.path.join(trash_dir, folder_id))
             
             # Bilgileri listeden kaldır
             del self.hidden_folders[folder_id]
+            self.stats_engine.forget(folder_id)
             
             # Değişiklikleri kaydet
             self.save_hidden_folders()
             
             # UI güncelle
             self.update_folder_list()
-            self.status_label.configure(text=f"{folder_name} klasörü kalıcı olarak silindi")
-            messagebox.showinfo("Başarılı", f"{folder_name} klasörü kalıcı olarak silindi.")
             
         except Exception as e:
             messagebox.showerror("Hata", f"Klasör silinemedi: {str(e)}")
+            return
+        
+        def work(job):
+            # Önceki iptal edilmiş silmelerden kalanlar da temizlenir
+            for name in os.listdir(trash_dir):
+                self.mover.remove(os.path.join(trash_dir, name), job=job)
+            self.store.release(manifest)
+            manifest.delete()
+        
+        def done(job):
+            self.status_label.configure(text=f"{folder_name} klasörü kalıcı olarak silindi")
+            messagebox.showinfo("Başarılı", f"{folder_name} klasörü kalıcı olarak silindi.")
+        
+        self._start_job(
+            f"{folder_name} siliniyor", work, done,
+            error_text="Klasör silinemedi"
+        )
             
     def open_folder(self):
         """Seçili gizli klasörü aç"""
@@ -1964,8 +6220,17 @@ class FolderHiderApp:
         folder_id = self.selected_folder_id
         folder_path = os.path.join(self.hidden_dir, folder_id)
         
+        # Klasör zaten açıksa aynı pencere öne getirilir: iki pencere aynı
+        # manifestin ayrı kopyalarını tutup birbirinin kaydını ezmesin
+        explorer = self.explorers.get(folder_id)
+        if explorer is not None and explorer.winfo_exists():
+            explorer.deiconify()
+            explorer.lift()
+            explorer.focus_force()
+            return
+        
         # Dosya gezginini aç
-        FileExplorer(self.root, folder_path, hidden_id=folder_id)
+        FileExplorer(self.root, folder_path, hidden_id=folder_id, app=self)
 
     def restore_folder(self):
         """Seçili gizli klasörü geri yükle"""
@@ -1974,6 +6239,9 @@ class FolderHiderApp:
             return
 
         folder_id = self.selected_folder_id
+        if not self._check_not_busy(folder_id):
+            return
+
         folder_info = self.hidden_folders[folder_id]
         folder_name = folder_info.get("name", "")
         original_path = folder_info.get("original_path", "")
@@ -1992,297 +6260,404 @@ class FolderHiderApp:
         if not answer:
             return
 
-        try:
-            # Gizli klasör yolu
-            hidden_path = os.path.join(self.hidden_dir, folder_id)
-
-            # Orijinal yola taşı
-            shutil.move(hidden_path, original_path)
-
-            # Bilgileri listeden kaldır
-            del self.hidden_folders[folder_id]
-
-            # Değişiklikleri kaydet
-            self.save_hidden_folders()
+        # Gizli klasör yolu
+        hidden_path = os.path.join(self.hidden_dir, folder_id)
 
+        def done(job):
             # UI güncelle
             self.update_folder_list()
             self.status_label.configure(text=f"'{folder_name}' klasörü geri yüklendi.")
             messagebox.showinfo("Başarılı", f"'{folder_name}' klasörü başarıyla geri yüklendi.")
 
-        except Exception as e:
-            messagebox.showerror("Hata", f"Klasör geri yüklenemedi: {str(e)}")
-
-    def change_password(self):
-        """Şifre değiştirme"""
-
-        new_password = simpledialog.askstring("Şifre Değiştir", "Yeni şifre:", show="•")
-        if new_password:
-            self.current_password = self.hash_password(new_password)
-            self.save_password()
-            messagebox.showinfo("Başarılı", "Şifre başarıyla değiştirildi.")
-
-    def setup_main_ui(self):
-        """Ana uygulama arayüzünü kur"""
-
-        # Buton stilleri
-        button_font = ctk.CTkFont(size=14, weight="bold")
-        button_fg_color = self.theme.accent
-        button_hover_color = self.theme.accent_hover
-        button_text_color = "#FFFFFF"
-
-        # Sol çerçeve (klasör listesi)
-        left_frame = ctk.CTkFrame(self.main_frame, fg_color=self.theme.bg_secondary)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 5), pady=10)
-
-        # Sağ çerçeve (işlemler)
-        right_frame = ctk.CTkFrame(self.main_frame, fg_color=self.theme.bg_secondary)
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 10), pady=10)
-
-        # Klasör Listesi
-        folder_list_label = ctk.CTkLabel(left_frame, text="Gizli Klasörler", font=ctk.CTkFont(size=18, weight="bold"), text_color=self.theme.text_primary)
-        folder_list_label.pack(pady=(10, 0))
-
-        self.folder_listbox = tk.Listbox(
-            left_frame,
-            bg=self.theme.bg_primary,
-            fg=self.theme.text_primary,
-            selectbackground=self.theme.accent,
-            selectforeground="#FFFFFF",
-            font=("Segoe UI" if platform.system() == "Windows" else "Helvetica", 12),
-            borderwidth=0,
-            highlightthickness=0
+        # Orijinal yola taşı; kayıt iş bitince listeden kaldırılır
+        self._start_transfer(
+            f"{folder_name} geri yükleniyor", "unhide", folder_id, hidden_path, original_path,
+            done, error_text="Klasör geri yüklenemedi"
         )
-        self.folder_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.folder_listbox.bind('<<ListboxSelect>>', self.on_folder_select)
 
-        # İşlem Butonları
-        button_frame = ctk.CTkFrame(right_frame, fg_color=self.theme.bg_secondary)
-        button_frame.pack(pady=10, padx=10, fill=tk.X)
+    def _start_job(self, title, work, on_done, error_text, folder_id=None, on_failed=None):
+        """Ağır bir klasör işlemini arka plan kuyruğuna ekler
 
-        self.add_folder_button = ctk.CTkButton(
-            button_frame, text="Klasör Ekle", command=self.add_folder,
-            font=button_font, fg_color=button_fg_color, hover_color=button_hover_color, text_color=button_text_color
-        )
-        self.add_folder_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        on_failed True döndürürse varsayılan hata mesajı gösterilmez.
+        """
+        if folder_id:
+            self.busy_folder_ids.add(folder_id)
 
-        self.open_folder_button = ctk.CTkButton(
-            button_frame, text="Klasörü Aç", command=self.open_folder,
-            font=button_font, fg_color=button_fg_color, hover_color=button_hover_color, text_color=button_text_color
-        )
-        self.open_folder_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        def done(job):
+            self.busy_folder_ids.discard(folder_id)
+            on_done(job)
 
-        self.restore_folder_button = ctk.CTkButton(
-            button_frame, text="Klasörü Geri Yükle", command=self.restore_folder,
-            font=button_font, fg_color=button_fg_color, hover_color=button_hover_color, text_color=button_text_color
-        )
-        self.restore_folder_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        def failed(job):
+            self.busy_folder_ids.discard(folder_id)
+            if on_failed and on_failed(job):
+                return
+            if job.state == "iptal":
+                self.status_label.configure(text=f"{title}: iptal edildi")
+            else:
+                messagebox.showerror("Hata", f"{error_text}: {str(job.error)}")
 
-        self.remove_folder_button = ctk.CTkButton(
-            button_frame, text="Klasörü Sil", command=self.remove_folder,
-            font=button_font, fg_color=self.theme.error, hover_color="#D32F2F", text_color=button_text_color
-        )
-        self.remove_folder_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.jobs.submit(Job(title, work, on_done=done, on_error=failed))
+        self.status_label.configure(text=f"{title} (sıraya alındı)")
 
-        self.change_password_button = ctk.CTkButton(
-            button_frame, text="Şifreyi Değiştir", command=self.change_password,
-            font=button_font, fg_color=button_fg_color, hover_color=button_hover_color, text_color=button_text_color
-        )
-        self.change_password_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+    def _start_transfer(self, title, op, folder_id, src, dst, on_done, error_text,
+                        record=None, on_failed=None, journal=None):
+        """Günlüklü bir gizleme ("hide") veya gösterme ("unhide") işi başlatır
 
-        self.browse_button = ctk.CTkButton(
-            button_frame, text="Gizli Tarayıcı", command=self.open_private_browser,
-            font=button_font, fg_color=button_fg_color, hover_color=button_hover_color, text_color=button_text_color
-        )
-        self.browse_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        Katalog yalnızca veri hedefe ulaştıktan sonra güncellenir. journal
+        verilirse (yarıda kalmış işlem) taşıma kaldığı yerden sürdürülür.
+        """
+        resumed = journal is not None
+        journal, work = self._transfer_work(op, folder_id, src, dst, record, journal)
 
-        # Durum çubuğu
-        self.status_label = ctk.CTkLabel(
-            self.main_frame, text="Hazır",
-            text_color=self.theme.text_secondary,
-            anchor="w"
-        )
-        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 10))
+        def done(job):
+            self._finish_transfer(journal, job.result)
+            on_done(job)
 
-        # Klasör listesini doldur
-        self.update_folder_list()
+        def failed(job):
+            if on_failed:
+                on_failed(job)
 
-    def on_folder_select(self, event):
-        """Klasör seçildiğinde bilgileri göster"""
-        try:
-            selection = self.folder_listbox.curselection()
-            if selection:
-                index = selection[0]
-                folder_id = list(self.hidden_folders.keys())[index]
-                self.selected_folder_id = folder_id
-                folder_name = self.hidden_folders[folder_id]["name"]
-                self.status_label.configure(text=f"Seçili: {folder_name}")
-            else:
-                self.selected_folder_id = None
-                self.status_label.configure(text="Hazır")
-        except Exception as e:
-            print(f"Klasör seçme hatası: {e}")
+            if not self._abort_transfer(journal, resumed=resumed):
+                return False
 
-    def update_folder_list(self):
-        """Klasör listesini güncelle"""
+            self.update_folder_list()
+            messagebox.showwarning(
+                "Uyarı",
+                f"{title}: klasör taşındı ancak kaynak tamamen silinemedi: {str(job.error)}"
+            )
+            return True
+
+        self._start_job(title, work, done, error_text, folder_id=folder_id, on_failed=failed)
 
-        self.folder_listbox.delete(0, tk.END)
-        for folder_id, folder_info in self.hidden_folders.items():
-            self.folder_listbox.insert(tk.END, folder_info["name"])
+    def _transfer_work(self, op, folder_id, src, dst, record=None, journal=None):
+        """Günlüğü açar ve taşımayı yapacak iş işlevini hazırlar
 
-        if self.hidden_folders:
-            self.status_label.configure(text=f"{len(self.hidden_folders)} klasör kayıtlı")
+        (journal, work) döndürür; work(job) arka plan iş parçacığında çalışır.
+        """
+        session_cipher = self._session_cipher()
+        if journal is None:
+            journal = TransferJournal.create(
+                self.journal_dir, session_cipher,
+                op=op, folder_id=folder_id, src=src, dst=dst, record=record
+            )
+            resume = False
         else:
-            self.status_label.configure(text="Hiç klasör kayıtlı değil")
+            resume = True
 
-    def open_private_browser(self):
-        """Gizli tarayıcıyı aç"""
-        PrivateBrowser(self.root)
+        # Şifreli/sıkıştırılmış klasörlerde dosyalar taşınırken kodlanır/çözülür
+        folder_info = record if op == "hide" else self.hidden_folders[folder_id]
+        codec = VaultCodec.from_record(folder_info)
+        if codec:
+            transform = codec.encode_file if op == "hide" else codec.decode_file
+        else:
+            transform = None
 
-    def check_first_run(self):
-        """Uygulamanın ilk kez çalışıp çalışmadığını kontrol et"""
+        # Anlık görüntüde kaynak yerinde kalır, dosyalar mümkünse klonlanır
+        keep_source = op == "hide" and folder_info.get("snapshot", False)
 
-        if not os.path.exists(self.config_file):
-            self.show_first_run_dialog()
-        else:
-            self.load_hidden_folders()
-            self.show_login_screen()
+        # Her gizli klasörün dosya listesi manifesti vardır; gösterilince silinir
+        dedup = folder_info.get("dedup", False)
+        manifest = FolderManifest.for_folder(self.hidden_dir, folder_id, session_cipher)
+        if dedup:
+            manifest.load()
 
-    def show_first_run_dialog(self):
-        """İlk çalıştırma ekranını göster"""
+        def work(job):
+            started = time.monotonic()
+            if resume:
+                method, stats = self.mover.resume(
+                    src, dst, journal, job=job, collect_stats=op == "hide",
+                    transform=transform, keep_source=keep_source
+                )
+            else:
+                method, stats = self.mover.move(
+                    src, dst, job=job, collect_stats=op == "hide",
+                    transform=transform, journal=journal, keep_source=keep_source
+                )
 
-        dialog = ctk.CTkToplevel(self.root)
-        dialog.title("Hoş Geldiniz")
-        dialog.geometry("400x300")
-        dialog.resizable(False, False)
+            if codec and codec.compressor and op == "hide":
+                # Sıkıştırma oranı ve hızı klasör kaydında saklanır
+                stats.details["compression"] = codec.compressor.summary(time.monotonic() - started)
 
-        frame = ctk.CTkFrame(dialog, fg_color=self.theme.bg_primary)
-        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            if op == "hide":
+                # Gezgin ve önizleme için tür/boyut/zaman listesi
+                manifest.set_index(stats.index)
+                stats.index = None
+                try:
+                    if dedup:
+                        # Aynı içerikleri ortak depodaki bloblara bağla
+                        stats.details["dedup_saved"] = self.store.ingest_tree(dst, manifest, job)
+                finally:
+                    manifest.save()
+            else:
+                if dedup:
+                    # Gösterilen klasörün depoyla bağını kopar
+                    self.store.materialize_tree(dst, manifest, job)
+                    self.store.release(manifest)
+                manifest.delete()
+            return stats
 
-        label = ctk.CTkLabel(
-            frame,
-            text="Bu uygulama ilk kez çalıştırılıyor.\nLütfen bir şifre belirleyin:",
-            font=ctk.CTkFont(size=16),
-            text_color=self.theme.text_primary
-        )
-        label.pack(pady=(20, 10))
+        return journal, work
 
-        password_entry = ctk.CTkEntry(
-            frame,
-            show="•",
-            width=200,
-            font=ctk.CTkFont(size=14),
-            fg_color=self.theme.bg_secondary,
-            text_color=self.theme.text_primary
-        )
-        password_entry.pack(pady=10)
+    def _abort_transfer(self, journal, save=True, resumed=False):
+        """Başarısız taşımayı kapatır; veri hedefe ulaştıysa yine de işler
 
-        confirm_button = ctk.CTkButton(
-            frame,
-            text="Onayla",
-            command=lambda: self.on_first_run_confirm(dialog, password_entry.get()),
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=self.theme.accent,
-            hover_color=self.theme.accent_hover,
-            text_color="#FFFFFF"
-        )
-        confirm_button.pack(pady=20)
+        Bu oturumda başlamış bir taşımanın yarım kopyası silinir (kaynak
+        yerindedir). Sürdürülen bir taşımanın ilerlemesi korunur: günlük
+        diskte kalır ve sonraki girişte yeniden sürdürülür. Veri hedefe
+        ulaşmışsa (kaynak tamamen silinememiş) True döndürür.
+        """
+        if journal.phase is None:
+            begin = journal.begin
+            if not resumed and os.path.exists(begin["src"]):
+                # Geri al: kaynak yerinde, yarım kopya silinir
+                shutil.rmtree(begin["dst"], ignore_errors=True)
+                journal.close()
+            else:
+                journal.close(remove=False)
+            return False
+
+        # Veri hedefe ulaşmış fakat kaynak tamamen silinememiş
+        self._finish_transfer(journal, save=save)
+        return True
 
-        dialog.wait_window()  # Diyalog penceresini bekle
+    def _finish_transfer(self, journal, stats=None, save=True):
+        """Günlükteki tamamlanmış işlemi kataloğa işler ve günlüğü kapatır
 
-    def on_first_run_confirm(self, dialog, password):
-        """İlk çalıştırma şifre onaylama"""
+        Toplu işlemlerde save=False verilir; katalog sonunda bir kez kaydedilir
+        ve günlük, katalog diske yazılana dek açık kalır (çağıran kapatır).
+        """
+        begin = journal.begin
+        folder_id = begin["folder_id"]
 
-        if password:
-            self.current_password = self.hash_password(password)
-            self.save_password()
-            dialog.destroy()
-            self.show_login_screen()
+        if begin["op"] == "hide":
+            record = dict(begin["record"])
+            if stats is None:
+                stats = FolderStats.scan(begin["dst"])
+            record.update(stats.to_record())
+            self.hidden_folders[folder_id] = record
         else:
-            messagebox.showerror("Hata", "Lütfen bir şifre girin.")
+            self.hidden_folders.pop(folder_id, None)
+            self.stats_engine.forget(folder_id)
+
+        if save:
+            # Günlük silinmeden önce katalog kalıcı olarak yazılmalı
+            self.save_hidden_folders()
+            self.flush_hidden_folders()
+            journal.close()
 
-    def show_login_screen(self):
-        """Giriş ekranını göster"""
+    def resume_pending_operations(self):
+        """Yarıda kalmış gizleme/gösterme işlemlerini bulup kaldığı yerden sürdürür"""
+        self._finish_manifest_rekey(self._session_cipher())
+        journals = TransferJournal.pending(self.journal_dir, self._session_cipher())
+        referenced = set()
 
-        self.main_frame.pack_forget()  # Ana ekranı gizle
-        self.login_frame.pack(fill=tk.BOTH, expand=True)
+        for journal in journals:
+            begin = journal.begin
+            if not begin:
+                journal.close()
+                continue
 
-        def on_login():
-            password = self.password_entry.get()
-            if self.verify_password(password):
-                self.is_authenticated = True
-                self.login_frame.pack_forget()
-                self.setup_main_ui()
-                self.main_frame.pack(fill=tk.BOTH, expand=True)
+            op = begin["op"]
+            folder_id = begin["folder_id"]
+            referenced.add(folder_id)
+
+            # Katalog kaydedilmiş ama günlük silinememişse işlem zaten bitmiştir
+            if (op == "hide") == (folder_id in self.hidden_folders):
+                journal.close()
+                continue
+
+            if op == "hide":
+                name = begin["record"].get("name", "")
+                title = f"{name} gizleme işlemi sürdürülüyor"
+                self.pending_hide_paths.add(begin["src"])
+                on_done = partial(self._on_resumed, begin["src"])
             else:
-                messagebox.showerror("Hata", "Yanlış şifre.")
+                name = self.hidden_folders[folder_id].get("name", "")
+                title = f"{name} gösterme işlemi sürdürülüyor"
+                on_done = partial(self._on_resumed, None)
 
-        # Mevcut giriş butonunu kaldır
-        for widget in self.login_frame.winfo_children():
-            if isinstance(widget, ctk.CTkButton) and widget.cget("text") == "Giriş":
-                widget.destroy()
-                break
+            self._start_transfer(
+                title, op, folder_id, begin["src"], begin["dst"], on_done,
+                error_text="Yarım kalan işlem tamamlanamadı",
+                record=begin.get("record"), on_failed=on_done, journal=journal
+            )
 
-        # Yeni giriş butonu oluştur ve yerleştir
-        login_button = ctk.CTkButton(
-            self.login_frame,
-            text="Giriş",
-            command=on_login,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=self.theme.accent,
-            hover_color=self.theme.accent_hover,
-            text_color="#FFFFFF"
-        )
-        login_button.pack(pady=(20, 40))
+        # Günlüğü olmayan ve katalogda bulunmayan gizli klasörleri sahiplen
+        recovered = 0
+        for name in os.listdir(self.hidden_dir):
+            if (len(name) == 16 and name.isalnum() and name not in self.hidden_folders
+                    and name not in referenced):
+                stats = FolderStats.scan(os.path.join(self.hidden_dir, name))
+                record = {
+                    "name": f"Kurtarılan klasör {name[:6]}",
+                    "original_path": "",
+                    "hide_date": datetime.now().strftime('%d.%m.%Y %H:%M')
+                }
+                record.update(stats.to_record())
+                self.hidden_folders[name] = record
+                recovered += 1
+
+        if recovered:
+            self.save_hidden_folders()
+            self.update_folder_list()
+            self.status_label.configure(text=f"{recovered} sahipsiz gizli klasör kurtarıldı")
 
-    def hash_password(self, password):
-        """Şifreyi hash'le"""
+        # Gezginde silinen dosyaların artık kullanılmayan bloblarını temizle
+        if os.path.isdir(self.store.root):
+            self.jobs.submit(Job("Depo temizleniyor", self.store.collect_garbage))
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            iterations=100000,
-            salt=self.salt,
-            length=32
+    def _stage_manifest_rekey(self, new_cipher):
+        """Klasör manifestlerini yeni anahtarla yanlarına (.rekey) yazar
+
+        Asıl dosyalar değişmez; katalog yeni anahtarla kaydedildikten sonra
+        _finish_manifest_rekey bunları yerine geçirir.
+        """
+        for folder_id in self.hidden_folders:
+            manifest = FolderManifest.for_folder(self.hidden_dir, folder_id, self.session_cipher)
+            if os.path.exists(manifest.path):
+                manifest.load()
+                AtomicWriter.write(manifest.path + FolderManifest.REKEY_SUFFIX,
+                                   new_cipher.encrypt(json.dumps(manifest.entries).encode()))
+
+    def _finish_manifest_rekey(self, cipher):
+        """Yarım kalan manifest yeniden şifrelemesini oturum anahtarına göre bitirir
+
+        Hazırlanan dosya oturum anahtarıyla açılıyorsa katalog da o anahtara
+        geçmiştir ve dosya manifestin yerine konur; açılmıyorsa şifre
+        değişmemiştir ve dosya silinir.
+        """
+        manifest_dir = os.path.join(self.hidden_dir, ".manifests")
+        if not os.path.isdir(manifest_dir):
+            return
+        for name in os.listdir(manifest_dir):
+            if not name.endswith(FolderManifest.REKEY_SUFFIX):
+                continue
+            staged = os.path.join(manifest_dir, name)
+            try:
+                with open(staged, 'rb') as f:
+                    cipher.decrypt(f.read())
+            except InvalidToken:
+                os.remove(staged)
+                continue
+            os.replace(staged, staged[:-len(FolderManifest.REKEY_SUFFIX)])
+
+    def _on_resumed(self, src, job):
+        if src:
+            self.pending_hide_paths.discard(src)
+        if job.state == "tamamlandı":
+            self.update_folder_list()
+            self.status_label.configure(text="Yarım kalan işlem tamamlandı")
+
+    def _session_cipher(self):
+        """Oturum şifresinden girişte bir kez türetilen Fernet nesnesi"""
+        return self.session_cipher
+
+    def _calibrated_kdf(self):
+        """Ayarlardaki algoritma ve hedef süreyle kalibre edilmiş yeni KDF"""
+        return KeyDerivation.calibrate(
+            self.settings.get("kdf", "pbkdf2"),
+            self.settings.get("kdf_target_seconds", KeyDerivation.TARGET_SECONDS)
         )
-        return base64.urlsafe_b64encode(kdf.derive(password.encode())).decode()
 
-    def verify_password(self, password):
-        """Şifreyi doğrula"""
+    def _check_not_busy(self, folder_id):
+        """Klasör üzerinde devam eden bir iş varsa kullanıcıyı uyarır"""
+        if folder_id in self.busy_folder_ids:
+            messagebox.showwarning("Uyarı", "Bu klasör üzerinde devam eden bir işlem var.")
+            return False
+        return True
 
-        hashed_password = self.hash_password(password)
-        return hashed_password == self.current_password
+    def _on_jobs_update(self, manager):
+        """İş kuyruğu durumunu durum çubuğuna yansıtır"""
+        job = manager.current
+        if job is None:
+            if self.job_progress.winfo_ismapped():
+                self.job_progress.pack_forget()
+                self.job_cancel_btn.pack_forget()
+            return
 
-    def save_password(self):
-        """Şifreyi kaydet"""
+        if not self.job_progress.winfo_ismapped():
+            self.job_cancel_btn.pack(side=tk.RIGHT, padx=5)
+            self.job_progress.pack(side=tk.RIGHT, padx=5)
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            f.write(self.current_password)
+        self.job_progress.set(job.fraction())
 
-    def load_password(self):
-        """Şifreyi yükle"""
+        text = job.title
+        if job.children:
+            # Toplu iş: klasör bazında ilerleme
+            text += f" ({job.finished_children()}/{job.files_total} klasör)"
+        else:
+            if job.bytes_total:
+                text += f" - {self.format_size(job.bytes_done)} / {self.format_size(job.bytes_total)}"
+            if job.files_total:
+                text += f" ({job.files_done}/{job.files_total} dosya)"
+        if manager.pending:
+            text += f" | sırada {len(manager.pending)} iş"
+        self.status_label.configure(text=text)
 
-        try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.current_password = f.read().strip()
-        except FileNotFoundError:
-            self.current_password = None
+    def cancel_current_job(self):
+        """Çalışan işi iptal et"""
+        self.jobs.cancel()
+
+    def on_close(self):
+        """Pencere kapatılırken devam eden işleri iptal et"""
+        if self.jobs.is_busy():
+            answer = messagebox.askyesno(
+                "Dikkat",
+                "Devam eden işlemler var. İptal edip çıkmak istiyor musunuz?"
+            )
+            if not answer:
+                return
+            self.jobs.cancel_all()
+            self._close_when_idle()
+            return
+
+        self.flush_hidden_folders()
+        self.root.destroy()
+
+    def _close_when_idle(self):
+        # İptal edilen işlerin geri alma adımlarının bitmesini bekle
+        if self.jobs.is_busy():
+            self.root.after(100, self._close_when_idle)
+        else:
+            self.flush_hidden_folders()
+            self.root.destroy()
+
+    def open_private_browser(self):
+        """Gizli tarayıcıyı aç"""
+        PrivateBrowser(self.root)
 
     def load_hidden_folders(self):
         """Gizli klasör bilgilerini yükle"""
 
+        # Katalog şifrelidir; giriş yapılmadan okunamaz
+        if self.catalog is None:
+            self.hidden_folders = CatalogEntries()
+            return
+
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.hidden_folders = json.load(f)
+            self.hidden_folders = self.catalog.load()
         except FileNotFoundError:
-            self.hidden_folders = {}
-        except json.JSONDecodeError:
-            self.hidden_folders = {}  # Dosya boşsa veya bozuksa sıfırla
+            self.hidden_folders = CatalogEntries()
 
     def save_hidden_folders(self):
-        """Gizli klasör bilgilerini kaydet"""
+        """Gizli klasör bilgilerini kaydet
+
+        Yazma kısa bir süre ertelenir; art arda gelen kayıtlar tek seferde
+        (yalnızca değişen kayıtlar) diske yazılır. Hemen yazmak için
+        flush_hidden_folders kullanılır.
+        """
+
+        if self.catalog is not None:
+            self.catalog_commit.request()
+
+    def flush_hidden_folders(self):
+        """Bekleyen katalog değişikliklerini hemen diske yazar"""
+
+        self.catalog_commit.flush()
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.hidden_folders, f)
+    def _commit_catalog(self):
+        if self.catalog is not None:
+            self.catalog.save(self.hidden_folders)
 
     def generate_unique_id(self, length=16):
         """Eşsiz bir klasör ID'si oluştur"""
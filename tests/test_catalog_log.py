@@ -0,0 +1,284 @@
+import base64
+import json
+import os
+import sys
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import gizlilik  # noqa: E402
+from gizlilik import CatalogCorrupt, CatalogEntries, CatalogLog  # noqa: E402
+
+
+def make_record(i):
+    return {
+        "name": f"klasör {i}",
+        "hide_date": f"{i % 28 + 1:02d}.01.2026 12:00",
+        "original_path": os.path.join(os.sep, "home", "kullanici", f"belgeler{i % 3}", f"klasör{i}"),
+        "size": 1000 * i,
+        "file_count": i,
+        "dir_count": 1,
+        "content_key": base64.urlsafe_b64encode(bytes([i]) * 32).decode(),
+        "preview": [f"dosya{i}.txt"],
+    }
+
+
+@pytest.fixture
+def cipher():
+    return Fernet(Fernet.generate_key())
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / CatalogLog.FILE_NAME)
+
+
+def create(path, cipher, count):
+    records = {f"id{i}": make_record(i) for i in range(count)}
+    CatalogLog.create(path, cipher, records, header={"kdf": "test"}).close()
+    return records
+
+
+def append_updates(path, cipher, start, count):
+    """Mevcut kataloğa ayrı çerçeveler olarak yeni kayıtlar ekler"""
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+    for i in range(start, start + count):
+        entries[f"id{i}"] = make_record(i)
+        catalog.save(entries)
+    return catalog, entries
+
+
+def test_roundtrip_decrypts_only_summaries(path, cipher):
+    records = create(path, cipher, 10)
+    assert open(path, 'rb').read().startswith(CatalogLog.MAGIC)
+    assert CatalogLog.read_header(path) == {"kdf": "test"}
+
+    entries = CatalogLog(path, cipher).load()
+    assert isinstance(entries, CatalogEntries)
+    assert entries.loaded() == {}
+    assert entries.summary("id3") == {"name": "klasör 3", "hide_date": "04.01.2026 12:00"}
+    assert dict(entries) == records
+
+
+def test_save_appends_changes_and_deletes(path, cipher):
+    records = create(path, cipher, 5)
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+    size = os.path.getsize(path)
+
+    entries["id1"]["size"] = 42
+    del entries["id2"]
+    entries["yeni"] = make_record(99)
+    catalog.save(entries)
+    assert os.path.getsize(path) > size
+
+    records["id1"]["size"] = 42
+    del records["id2"]
+    records["yeni"] = make_record(99)
+    assert dict(CatalogLog(path, cipher).load()) == records
+
+
+def test_wrong_password_is_rejected(path, cipher):
+    create(path, cipher, 3)
+    with pytest.raises(InvalidToken):
+        CatalogLog(path, Fernet(Fernet.generate_key())).load()
+
+
+def test_torn_tail_is_cut_off(path, cipher):
+    create(path, cipher, 3)
+    catalog, _ = append_updates(path, cipher, 3, 1)
+    intact = open(path, 'rb').read()
+
+    # Çökmede yarım kalan son ekleme
+    with open(path, 'ab') as f:
+        f.write(catalog._frame(catalog.PUT, b"\1" * 500)[:catalog.FRAME.size + 40])
+
+    entries = CatalogLog(path, cipher).load()
+    assert sorted(entries) == ["id0", "id1", "id2", "id3"]
+    assert open(path, 'rb').read() == intact
+
+
+@pytest.mark.parametrize("tail", [b"\1\0\0", b"\0" * 64], ids=["yarim-baslik", "sifir-dolu"])
+def test_torn_header_is_cut_off(path, cipher, tail):
+    create(path, cipher, 3)
+    intact = open(path, 'rb').read()
+    with open(path, 'ab') as f:
+        f.write(tail)
+
+    assert sorted(CatalogLog(path, cipher).load()) == ["id0", "id1", "id2"]
+    assert open(path, 'rb').read() == intact
+
+
+def frame_offsets(data):
+    offset = len(CatalogLog.MAGIC)
+    if data.startswith(b"{", offset):
+        offset = data.index(b"\n", offset) + 1
+    offset = data.index(b"\n", offset) + 1
+    offsets = []
+    while offset < len(data):
+        offsets.append(offset)
+        _, length, _ = CatalogLog.FRAME.unpack_from(data, offset)
+        offset += CatalogLog.FRAME.size + length
+    return offsets
+
+
+def test_corrupt_middle_length_loses_nothing(path, cipher):
+    create(path, cipher, 3)
+    _, expected = append_updates(path, cipher, 3, 7)
+    data = open(path, 'rb').read()
+    offsets = frame_offsets(data)
+
+    # Ortadaki bir çerçevenin uzunluğu dosya sonunu gösterecek kadar büyür
+    corrupted = bytearray(data)
+    corrupted[offsets[len(offsets) // 2] + 1] ^= 0x10
+    with open(path, 'wb') as f:
+        f.write(corrupted)
+
+    with pytest.raises(CatalogCorrupt):
+        CatalogLog(path, cipher).load()
+    assert open(path, 'rb').read() == bytes(corrupted)
+
+
+def test_corrupt_middle_frame_loses_nothing(path, cipher):
+    create(path, cipher, 3)
+    _, expected = append_updates(path, cipher, 3, 7)
+    expected = dict(expected)
+    data = open(path, 'rb').read()
+
+    # Dosyanın ortasındaki tam bir çerçevede tek bit bozulması
+    middle = len(data) // 2
+    corrupted = bytearray(data)
+    corrupted[middle] ^= 0x01
+    with open(path, 'wb') as f:
+        f.write(corrupted)
+
+    with pytest.raises(CatalogCorrupt):
+        CatalogLog(path, cipher).load()
+    assert open(path, 'rb').read() == bytes(corrupted)
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    assert dict(CatalogLog(path, cipher).load()) == dict(expected)
+
+    # Bozuk bayt düzeltilince bozulmadan sonraki kayıtlar da yerinde
+    with open(path, 'wb') as f:
+        f.write(data)
+    assert dict(CatalogLog(path, cipher).load()) == expected
+
+
+def test_compaction_keeps_every_record(path, cipher, monkeypatch):
+    monkeypatch.setattr(CatalogLog, "COMPACT_MIN", 4)
+    records = create(path, cipher, 5)
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+    for round_ in range(10):
+        entries["id0"]["size"] = round_
+        catalog.save(entries)
+        records["id0"]["size"] = round_
+
+    # Sıkıştırma olmasaydı 5 + 10 çerçeve olurdu
+    assert catalog.records < len(records) + 10
+    assert dict(CatalogLog(path, cipher).load()) == records
+
+
+def test_failed_rekey_keeps_the_old_key(path, cipher, monkeypatch):
+    records = create(path, cipher, 3)
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+
+    def fail(path, data):
+        raise OSError("disk dolu")
+
+    monkeypatch.setattr(gizlilik.AtomicWriter, "write", staticmethod(fail))
+    with pytest.raises(OSError):
+        catalog.rekey(Fernet(Fernet.generate_key()), entries)
+    monkeypatch.undo()
+
+    # Sonraki kayıtlar diskteki kataloğun (eski) anahtarıyla yazılır
+    entries["id0"]["size"] = 7
+    catalog.save(entries)
+    records["id0"]["size"] = 7
+    assert dict(CatalogLog(path, cipher).load()) == records
+
+
+def write_text_log(path, cipher, magic, events, header=None):
+    lines = [cipher.encrypt(json.dumps({"type": "check"}).encode())]
+    lines += [cipher.encrypt(json.dumps(event).encode()) for event in events]
+    head = json.dumps(header).encode() + b"\n" if header else b""
+    with open(path, 'wb') as f:
+        f.write(magic + head + b"\n".join(lines) + b"\n")
+
+
+def test_migrates_text_log(path, cipher):
+    events = [{"type": "put", "id": f"id{i}", "record": make_record(i)} for i in range(4)]
+    events.append({"type": "del", "id": "id1"})
+    write_text_log(path, cipher, b"FHCATLOG1\n", events, header={"kdf": "eski"})
+
+    entries = CatalogLog(path, cipher).load()
+    expected = {f"id{i}": make_record(i) for i in (0, 2, 3)}
+    assert dict(entries) == expected
+    assert open(path, 'rb').read().startswith(CatalogLog.MAGIC)
+    assert CatalogLog.read_header(path) == {"kdf": "eski"}
+    assert dict(CatalogLog(path, cipher).load()) == expected
+
+
+def test_migrates_single_blob(path, cipher):
+    records = {f"id{i}": make_record(i) for i in range(3)}
+    with open(path, 'wb') as f:
+        f.write(cipher.encrypt(json.dumps(records).encode()))
+
+    assert dict(CatalogLog(path, cipher).load()) == records
+    assert dict(CatalogLog(path, cipher).load()) == records
+
+
+def test_corrupt_text_log_is_not_migrated(path, cipher):
+    events = [{"type": "put", "id": f"id{i}", "record": make_record(i)} for i in range(4)]
+    write_text_log(path, cipher, b"FHCATLOG1\n", events)
+    data = bytearray(open(path, 'rb').read())
+    lines = data.split(b"\n")
+    data[len(b"\n".join(lines[:3])) + 20] ^= 0x01
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    with pytest.raises(CatalogCorrupt):
+        CatalogLog(path, cipher).load()
+    assert open(path, 'rb').read() == bytes(data)
+
+
+def test_find_original_path_uses_the_tag_index(path, cipher):
+    records = create(path, cipher, 20)
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+
+    assert catalog.find_original_path(records["id7"]["original_path"]) == ["id7"]
+    assert catalog.find_original_path("/yok/böyle/bir/yol") == []
+    # Yalnızca eşleşen kayıt çözüldü
+    assert set(entries.loaded()) == {"id7"}
+
+    # Kaydedilmemiş değişiklikler de görülür
+    entries["id3"]["original_path"] = "/taşındı"
+    assert catalog.find_original_path("/taşındı") == ["id3"]
+    catalog.save(entries)
+    reloaded = CatalogLog(path, cipher)
+    reloaded.load()
+    assert reloaded.find_original_path("/taşındı") == ["id3"]
+    assert reloaded.find_original_path(records["id3"]["original_path"]) == []
+
+
+def test_untagged_summaries_are_still_found(path, cipher, monkeypatch):
+    # Yol etiketinden önceki özet biçimi
+    def old_summary(self, folder_id, summary, tag=b""):
+        return (self._pack_str(folder_id) + self._pack_str(summary["name"])
+                + self._pack_str(summary["hide_date"]))
+
+    with monkeypatch.context() as patch:
+        patch.setattr("gizlilik.CatalogCodec.encode_summary", old_summary)
+        records = create(path, cipher, 5)
+
+    catalog = CatalogLog(path, cipher)
+    entries = catalog.load()
+    assert entries.summary("id2")["name"] == "klasör 2"
+    assert catalog.find_original_path(records["id2"]["original_path"]) == ["id2"]
+    assert dict(entries) == records
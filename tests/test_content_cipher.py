@@ -0,0 +1,117 @@
+import io
+import os
+import sys
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import ContentCipher  # noqa: E402
+
+
+class SmallSegments(ContentCipher):
+    # Çok parçalı dosyaları küçük verilerle sınamak için
+    SEGMENT_SIZE = 64
+
+
+STORED = SmallSegments.SEGMENT_SIZE + ContentCipher.TAG_SIZE
+
+
+@pytest.fixture
+def cipher():
+    return SmallSegments.from_record({"content_key": ContentCipher.generate_key()})
+
+
+def encrypt(cipher, data):
+    out = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(data), out)
+    return out.getvalue()
+
+
+def decrypt(cipher, blob):
+    out = io.BytesIO()
+    cipher.decrypt_stream(io.BytesIO(blob), out)
+    return out.getvalue()
+
+
+def segments(blob):
+    body = blob[ContentCipher.HEADER.size:]
+    return blob[:ContentCipher.HEADER.size], [body[i:i + STORED] for i in range(0, len(body), STORED)]
+
+
+@pytest.mark.parametrize("size", [0, 1, 63, 64, 65, 64 * 5, 64 * 5 + 7])
+def test_roundtrip(cipher, size):
+    data = os.urandom(size)
+    blob = encrypt(cipher, data)
+
+    assert blob.startswith(ContentCipher.MAGIC)
+    assert decrypt(cipher, blob) == data
+
+
+def test_empty_file_has_one_final_segment(cipher):
+    header, parts = segments(encrypt(cipher, b""))
+
+    assert [len(part) for part in parts] == [ContentCipher.TAG_SIZE]
+    # Başlığı olup parçası olmayan dosya boş sayılmaz
+    with pytest.raises(InvalidTag):
+        decrypt(cipher, header)
+
+
+def test_stream_is_read_from_its_own_header(cipher):
+    blob = encrypt(cipher, b"x" * 200)
+
+    assert decrypt(ContentCipher(cipher.key), blob) == b"x" * 200
+
+
+def test_truncated_file_is_rejected(cipher):
+    header, parts = segments(encrypt(cipher, os.urandom(64 * 3 + 10)))
+
+    # Son parça atılınca öncekinin "son parça" bayrağı tutmaz
+    with pytest.raises(InvalidTag):
+        decrypt(cipher, header + b"".join(parts[:-1]))
+    with pytest.raises(InvalidTag):
+        decrypt(cipher, header + b"".join(parts)[:-1])
+
+
+def test_reordered_segments_are_rejected(cipher):
+    header, parts = segments(encrypt(cipher, os.urandom(64 * 3 + 10)))
+    parts[0], parts[1] = parts[1], parts[0]
+
+    with pytest.raises(InvalidTag):
+        decrypt(cipher, header + b"".join(parts))
+
+
+def test_tampered_header_is_rejected(cipher):
+    blob = bytearray(encrypt(cipher, b"gizli veri"))
+    blob[-ContentCipher.TAG_SIZE - 20] ^= 1  # tuzun içinde
+
+    with pytest.raises(InvalidTag):
+        decrypt(cipher, bytes(blob))
+
+
+def test_wrong_key_is_rejected(cipher):
+    blob = encrypt(cipher, b"gizli veri")
+    other = SmallSegments.from_record({"content_key": ContentCipher.generate_key()})
+
+    with pytest.raises(InvalidTag):
+        decrypt(other, blob)
+
+
+def test_unknown_format_is_rejected(cipher):
+    with pytest.raises(ValueError):
+        decrypt(cipher, b"FHENC")
+    with pytest.raises(ValueError):
+        decrypt(cipher, b"XXXXX" + encrypt(cipher, b"veri")[5:])
+
+
+def test_is_encrypted_and_plain_records(tmp_path, cipher):
+    encrypted = tmp_path / "sifreli"
+    encrypted.write_bytes(encrypt(cipher, b"veri"))
+    plain = tmp_path / "duz.txt"
+    plain.write_bytes(b"veri")
+
+    assert ContentCipher.is_encrypted(str(encrypted))
+    assert not ContentCipher.is_encrypted(str(plain))
+    assert not ContentCipher.is_encrypted(str(tmp_path / "yok"))
+    assert ContentCipher.from_record({"name": "şifresiz"}) is None
+    assert ContentCipher.from_record(None) is None
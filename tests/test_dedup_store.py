@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import DedupStore, FolderManifest  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DedupStore(str(tmp_path / ".store"))
+    if not store.supported():
+        pytest.skip("dosya sistemi sabit bağlantıları desteklemiyor")
+    return store
+
+
+def make_tree(root, files):
+    for rel_path, data in files.items():
+        path = os.path.join(root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+    return root
+
+
+def manifest_for(tmp_path, name):
+    return FolderManifest(str(tmp_path / ".manifests" / name), Fernet(Fernet.generate_key()))
+
+
+def test_ingest_links_duplicates_to_one_blob(tmp_path, store):
+    tree = make_tree(str(tmp_path / "a"), {"x.txt": b"ayni" * 100, "alt/y.txt": b"ayni" * 100, "z.txt": b"farkli"})
+    manifest = manifest_for(tmp_path, "a")
+
+    saved = store.ingest_tree(tree, manifest)
+
+    assert saved == 400
+    assert manifest.entries["x.txt"]["h"] == manifest.entries[os.path.join("alt", "y.txt")]["h"]
+    assert os.path.samefile(os.path.join(tree, "x.txt"), os.path.join(tree, "alt", "y.txt"))
+    assert os.path.samefile(os.path.join(tree, "x.txt"), store.blob_path(manifest.entries["x.txt"]["h"]))
+
+
+def test_ingest_is_rerunnable(tmp_path, store):
+    tree = make_tree(str(tmp_path / "a"), {"x.txt": b"icerik", "y.txt": b"icerik"})
+    store.ingest_tree(tree, manifest_for(tmp_path, "a"))
+
+    assert store.ingest_tree(tree, manifest_for(tmp_path, "a")) == 0
+
+
+def test_concurrent_ingest_of_identical_content(tmp_path, store):
+    # Toplu gizleme aynı anda birkaç klasörü depoya alır
+    contents = {f"d{i}/dosya{i}.bin": bytes([i % 256]) * 512 for i in range(200)}
+    trees = [make_tree(str(tmp_path / f"klasor{n}"), contents) for n in range(4)]
+    manifests = [manifest_for(tmp_path, f"klasor{n}") for n in range(4)]
+    errors = []
+    barrier = threading.Barrier(len(trees))
+
+    def ingest(tree, manifest):
+        barrier.wait()
+        try:
+            store.ingest_tree(tree, manifest)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=ingest, args=pair) for pair in zip(trees, manifests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for tree, manifest in zip(trees, manifests):
+        assert len(manifest.entries) == len(contents)
+        for rel_path, fields in manifest.entries.items():
+            assert os.path.samefile(os.path.join(tree, rel_path), store.blob_path(fields["h"]))
+
+
+def test_release_removes_only_unused_blobs(tmp_path, store):
+    shared = b"ortak" * 50
+    tree_a = make_tree(str(tmp_path / "a"), {"x.txt": shared, "yalniz.txt": b"yalniz a"})
+    tree_b = make_tree(str(tmp_path / "b"), {"x.txt": shared})
+    manifest_a = manifest_for(tmp_path, "a")
+    manifest_b = manifest_for(tmp_path, "b")
+    store.ingest_tree(tree_a, manifest_a)
+    store.ingest_tree(tree_b, manifest_b)
+
+    store.materialize_tree(tree_a, manifest_a)
+    store.release(manifest_a)
+
+    assert not os.path.exists(store.blob_path(manifest_a.entries["yalniz.txt"]["h"]))
+    assert os.path.exists(store.blob_path(manifest_b.entries["x.txt"]["h"]))
+    with open(os.path.join(tree_a, "x.txt"), 'rb') as f:
+        assert f.read() == shared
@@ -0,0 +1,79 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import DirectoryWatcher  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not DirectoryWatcher.supported(), reason="inotify yok")
+
+
+@pytest.fixture
+def watcher():
+    watcher = DirectoryWatcher()
+    yield watcher
+    watcher.close()
+
+
+def test_reports_changed_names(tmp_path, watcher):
+    (tmp_path / "eski.txt").write_text("x")
+    (tmp_path / "alt").mkdir()
+    watcher.watch(str(tmp_path))
+    assert watcher.read() == (set(), None)
+
+    (tmp_path / "yeni.txt").write_text("veri")
+    (tmp_path / "eski.txt").rename(tmp_path / "taşındı.txt")
+    (tmp_path / "alt" / "derin.txt").write_text("alt dizin izlenmez")
+
+    assert watcher.read() == ({"yeni.txt", "eski.txt", "taşındı.txt"}, None)
+    assert watcher.read() == (set(), None)
+
+    os.remove(tmp_path / "yeni.txt")
+    assert watcher.read() == ({"yeni.txt"}, None)
+
+
+def test_removed_directory_is_gone(tmp_path, watcher):
+    folder = tmp_path / "izlenen"
+    folder.mkdir()
+    (folder / "a.txt").write_text("x")
+    watcher.watch(str(folder))
+
+    shutil.rmtree(folder)
+
+    names, status = watcher.read()
+    assert status == "gone"
+    assert names == {"a.txt"}
+    assert watcher.path is None and watcher.wd is None
+
+
+def test_switching_directories_drops_old_events(tmp_path, watcher):
+    first = tmp_path / "ilk"
+    second = tmp_path / "ikinci"
+    first.mkdir()
+    second.mkdir()
+    watcher.watch(str(first))
+    (first / "önce.txt").write_text("x")
+
+    watcher.watch(str(second))
+    (second / "sonra.txt").write_text("x")
+
+    assert watcher.read() == ({"sonra.txt"}, None)
+
+
+def test_unwatch_and_close(tmp_path, watcher):
+    watcher.watch(str(tmp_path))
+    watcher.unwatch()
+    (tmp_path / "a.txt").write_text("x")
+
+    assert watcher.read() == (set(), None)
+
+    watcher.close()
+    watcher.close()
+    assert watcher.fd is None
+
+
+def test_missing_directory_cannot_be_watched(tmp_path, watcher):
+    with pytest.raises(OSError):
+        watcher.watch(str(tmp_path / "yok"))
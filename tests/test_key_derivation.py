@@ -0,0 +1,67 @@
+import base64
+import json
+import os
+import sys
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import KeyDerivation  # noqa: E402
+
+
+def test_calibrate_never_goes_below_the_legacy_cost():
+    kdf = KeyDerivation.calibrate(target_seconds=1e-9)
+
+    assert kdf.params == {"kdf": "pbkdf2", "iterations": KeyDerivation.MIN_ITERATIONS}
+    assert len(kdf.salt) == 16
+    assert KeyDerivation.calibrate(target_seconds=1e-9).salt != kdf.salt
+
+
+def test_calibrate_scales_with_the_target():
+    kdf = KeyDerivation.calibrate(target_seconds=1000)
+
+    assert kdf.params["iterations"] > KeyDerivation.MIN_ITERATIONS
+    assert kdf.params["iterations"] % 1000 == 0
+
+
+def test_calibrate_scrypt():
+    assert KeyDerivation.calibrate("scrypt", target_seconds=1e-9).params == {
+        "kdf": "scrypt", "n": KeyDerivation.MIN_SCRYPT_N, "r": 8, "p": 1
+    }
+    assert KeyDerivation.calibrate("scrypt", target_seconds=1000).params["n"] == KeyDerivation.MAX_SCRYPT_N
+
+
+def test_calibrate_rejects_unknown_kdf():
+    with pytest.raises(ValueError):
+        KeyDerivation.calibrate("md5")
+
+
+@pytest.mark.parametrize("params", [
+    {"kdf": "pbkdf2", "iterations": 1000},
+    {"kdf": "scrypt", "n": 2 ** 10, "r": 8, "p": 1},
+])
+def test_header_roundtrip_derives_the_same_key(params):
+    kdf = KeyDerivation(params, os.urandom(16))
+    # Başlık kasa dosyasında JSON olarak saklanır
+    header = json.loads(json.dumps(kdf.to_header()))
+
+    restored = KeyDerivation.from_header(header, b"kullanilmaz")
+
+    assert restored.params == params
+    assert restored.salt == kdf.salt
+    assert restored.derive("şifre") == kdf.derive("şifre")
+    assert restored.derive("başka") != kdf.derive("şifre")
+    Fernet(kdf.derive("şifre"))
+
+
+def test_missing_header_uses_the_legacy_derivation():
+    legacy_salt = b"eski kasa tuzu"
+    kdf = KeyDerivation.from_header(None, legacy_salt)
+    expected = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=legacy_salt, iterations=100000)
+
+    assert kdf.params == KeyDerivation.LEGACY
+    assert KeyDerivation.from_header({}, legacy_salt).params == KeyDerivation.LEGACY
+    assert kdf.derive("şifre") == base64.urlsafe_b64encode(expected.derive("şifre".encode()))
@@ -0,0 +1,94 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import ListingCache  # noqa: E402
+
+
+def listing(*names):
+    # Gezginin satırları: (ad, tür, boyut, zaman)
+    return [(name, "f", 10, 0) for name in names]
+
+
+def test_hit_needs_the_same_stamp():
+    cache = ListingCache()
+    cache.put("dizin", 1, listing("a", "b"))
+
+    assert cache.get("dizin", 1) == listing("a", "b")
+    assert cache.get("baska", 1) is None
+
+    # Eskimiş kayıt atılır, eski damgayla da geri gelmez
+    assert cache.get("dizin", 2) is None
+    assert cache.get("dizin", 1) is None
+    assert cache.bytes == 0
+
+
+def test_put_replaces_the_previous_listing():
+    cache = ListingCache()
+    cache.put("dizin", 1, listing("a"))
+    cache.put("dizin", 2, listing("a", "b"))
+
+    assert cache.get("dizin", 2) == listing("a", "b")
+    assert cache.bytes == 2 * ListingCache.ENTRY_OVERHEAD + 2
+
+
+def test_evicts_least_recently_used_by_count():
+    cache = ListingCache(max_entries=2)
+    cache.put("a", 1, listing("x"))
+    cache.put("b", 1, listing("x"))
+    cache.get("a", 1)
+    cache.put("c", 1, listing("x"))
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) is not None
+    assert cache.get("c", 1) is not None
+
+
+def test_evicts_by_memory_budget():
+    cost = 10 * ListingCache.ENTRY_OVERHEAD + 10
+    cache = ListingCache(max_bytes=2 * cost)
+    names = [str(i) for i in range(10)]
+    cache.put("a", 1, listing(*names))
+    cache.put("b", 1, listing(*names))
+    assert cache.bytes == 2 * cost
+
+    cache.put("c", 1, listing(*names))
+    assert cache.get("a", 1) is None
+    assert cache.bytes == 2 * cost
+
+    # Bütçeden büyük liste hiç saklanmaz ve başkalarını da atmaz
+    cache.put("dev", 1, listing(*names * 3))
+    assert cache.get("dev", 1) is None
+    assert cache.get("b", 1) is not None
+    assert cache.get("c", 1) is not None
+
+
+def test_disabled_cache_keeps_nothing():
+    cache = ListingCache(max_entries=0)
+    cache.put("a", 1, listing("x"))
+
+    assert cache.get("a", 1) is None
+    assert cache.bytes == 0
+
+
+def test_discard_and_clear():
+    cache = ListingCache()
+    cache.put("a", 1, listing("x"))
+    cache.put("b", 1, listing("y"))
+
+    cache.discard("a")
+    cache.discard("yok")
+    assert cache.get("a", 1) is None
+    assert cache.get("b", 1) is not None
+
+    cache.clear()
+    assert cache.get("b", 1) is None
+    assert cache.bytes == 0
+
+
+def test_recently_modified_directories_are_not_settled():
+    now = time.time_ns()
+
+    assert not ListingCache.settled(now)
+    assert ListingCache.settled(now - ListingCache.RACY_NS)
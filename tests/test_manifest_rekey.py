@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+from cryptography.fernet import Fernet
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import FolderHiderApp, FolderManifest  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    # Arayüz kurulmadan yalnızca şifre değişiminin manifest adımları
+    app = FolderHiderApp.__new__(FolderHiderApp)
+    app.hidden_dir = str(tmp_path)
+    app.hidden_folders = {"a": {}, "b": {}, "manifestsiz": {}}
+    app.session_cipher = Fernet(Fernet.generate_key())
+    for folder_id, entries in (("a", {"x.txt": {"t": "f", "s": 1, "m": 0}}), ("b", {"alt": {"t": "d", "s": 0, "m": 0}})):
+        manifest = FolderManifest.for_folder(app.hidden_dir, folder_id, app.session_cipher)
+        manifest.entries = entries
+        manifest.save()
+    return app
+
+
+def load_all(app, cipher):
+    return {
+        folder_id: FolderManifest.for_folder(app.hidden_dir, folder_id, cipher).load().entries
+        for folder_id in ("a", "b")
+    }
+
+
+def test_staging_leaves_the_manifests_untouched(app):
+    before = load_all(app, app.session_cipher)
+
+    app._stage_manifest_rekey(Fernet(Fernet.generate_key()))
+
+    assert load_all(app, app.session_cipher) == before
+
+
+def test_finish_with_the_new_key_swaps_the_manifests(app):
+    before = load_all(app, app.session_cipher)
+    new_cipher = Fernet(Fernet.generate_key())
+    app._stage_manifest_rekey(new_cipher)
+
+    # Katalog yeni anahtara geçtikten sonra (ya da sonraki girişte)
+    app._finish_manifest_rekey(new_cipher)
+
+    assert load_all(app, new_cipher) == before
+    assert not [name for name in os.listdir(os.path.join(app.hidden_dir, ".manifests"))
+                if name.endswith(FolderManifest.REKEY_SUFFIX)]
+
+
+def test_finish_with_the_old_key_discards_the_staged_copies(app):
+    before = load_all(app, app.session_cipher)
+    app._stage_manifest_rekey(Fernet(Fernet.generate_key()))
+
+    # Katalog kaydedilemeden kesilen şifre değişimi: giriş eski anahtarla olur
+    app._finish_manifest_rekey(app.session_cipher)
+
+    assert load_all(app, app.session_cipher) == before
+    assert sorted(os.listdir(os.path.join(app.hidden_dir, ".manifests"))) == ["a", "b"]
@@ -0,0 +1,129 @@
+import errno
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import Job, ParallelCopier  # noqa: E402
+
+
+def make_tree(root):
+    files = {
+        "a.txt": b"a" * 1000,
+        os.path.join("alt", "b.bin"): os.urandom(70000),
+        os.path.join("alt", "derin", "c.txt"): b"",
+    }
+    for rel_path, data in files.items():
+        path = os.path.join(root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+    os.makedirs(os.path.join(root, "bos"))
+    os.symlink("a.txt", os.path.join(root, "bag"))
+    return files
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture
+def copier():
+    copier = ParallelCopier(workers=4)
+    copier.BUFFER_SIZE = 4096  # Birden çok tur için küçük tampon
+    return copier
+
+
+def test_copy_tree_copies_everything(tmp_path, copier):
+    src = str(tmp_path / "kaynak")
+    dst = str(tmp_path / "hedef")
+    files = make_tree(src)
+    os.utime(os.path.join(src, "a.txt"), (1000000000, 1000000000))
+
+    copier.copy_tree(src, dst)
+
+    for rel_path, data in files.items():
+        assert read(os.path.join(dst, rel_path)) == data
+    assert os.path.isdir(os.path.join(dst, "bos"))
+    assert os.readlink(os.path.join(dst, "bag")) == "a.txt"
+    assert os.stat(os.path.join(dst, "a.txt")).st_mtime == 1000000000
+
+
+def test_copy_tree_refuses_existing_target(tmp_path, copier):
+    src = str(tmp_path / "kaynak")
+    make_tree(src)
+    os.makedirs(str(tmp_path / "hedef"))
+
+    with pytest.raises(FileExistsError):
+        copier.copy_tree(src, str(tmp_path / "hedef"))
+
+
+def unsupported(*args):
+    raise OSError(errno.EXDEV, "desteklenmiyor")
+
+
+@pytest.fixture
+def no_clone(monkeypatch, copier):
+    monkeypatch.setattr(copier, "_try_clone", lambda src_fd, dst_fd: False)
+
+
+def copy_one(tmp_path, copier):
+    data = os.urandom(50000)
+    (tmp_path / "kaynak").write_bytes(data)
+    job = Job("kopya", None)
+    job.set_total(len(data), 1)
+    copier.copy_file(str(tmp_path / "kaynak"), str(tmp_path / "hedef"), job)
+    assert read(str(tmp_path / "hedef")) == data
+    assert job.bytes_done == len(data)
+    assert job.files_done == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="sendfile yok")
+def test_copy_file_falls_back_to_sendfile(tmp_path, monkeypatch, copier, no_clone):
+    sent = []
+    sendfile = os.sendfile
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: sent.append(args) or sendfile(*args))
+
+    copy_one(tmp_path, copier)
+    assert sent
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range yok")
+def test_copy_file_continues_after_partial_kernel_copy(tmp_path, monkeypatch, copier, no_clone):
+    # İlk tur başarılı olur, sonra yöntem desteklenmiyormuş gibi davranır
+    calls = []
+    copy_file_range = os.copy_file_range
+
+    def flaky(*args):
+        calls.append(args)
+        if len(calls) > 1:
+            unsupported()
+        return copy_file_range(*args)
+
+    monkeypatch.setattr(os, "copy_file_range", flaky)
+    monkeypatch.delattr(os, "sendfile", raising=False)
+
+    copy_one(tmp_path, copier)
+    assert len(calls) == 2
+
+
+def test_copy_file_falls_back_to_buffered_copy(tmp_path, monkeypatch, copier, no_clone):
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    monkeypatch.delattr(os, "sendfile", raising=False)
+
+    copy_one(tmp_path, copier)
+
+
+def test_copy_file_raises_real_errors(tmp_path, monkeypatch, copier, no_clone):
+    def failing(*args):
+        raise OSError(errno.EIO, "G/Ç hatası")
+
+    monkeypatch.setattr(os, "copy_file_range", failing, raising=False)
+
+    with pytest.raises(OSError) as e:
+        copy_one(tmp_path, copier)
+    assert e.value.errno == errno.EIO
+
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+from cryptography.fernet import Fernet
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import SqliteCatalog  # noqa: E402
+
+
+def make_record(i):
+    return {
+        "name": f"Klasör {i}",
+        "hide_date": f"{i % 28 + 1:02d}.01.2026 12:00",
+        "original_path": os.path.join(os.sep, "home", "kullanici", f"klasör{i}"),
+        "size": 10 * i,
+    }
+
+
+@pytest.fixture
+def cipher():
+    return Fernet(Fernet.generate_key())
+
+
+@pytest.fixture
+def catalog(tmp_path, cipher):
+    path = str(tmp_path / "hidden_folders.db")
+    records = {f"id{i}": make_record(i) for i in range(5)}
+    SqliteCatalog.create(path, cipher, records).close()
+    catalog = SqliteCatalog(path, cipher)
+    yield catalog
+    catalog.close()
+
+
+def test_roundtrip_and_queries(catalog):
+    entries = catalog.load()
+
+    assert sorted(entries) == [f"id{i}" for i in range(5)]
+    assert entries["id3"] == make_record(3)
+    assert catalog.find_original_path(make_record(2)["original_path"]) == ["id2"]
+    assert sorted(catalog.search_names("klasör")) == [f"id{i}" for i in range(5)]
+    assert catalog.search_names("Klasör 4") == ["id4"]
+
+
+def test_find_original_path_sees_unsaved_changes(catalog):
+    # Grup kaydı henüz yazmadan aynı yol yeniden gizlenmek istenir
+    entries = catalog.load()
+    new_path = os.path.join(os.sep, "home", "kullanici", "yeni")
+    entries["yeni"] = dict(make_record(9), original_path=new_path)
+    assert catalog.find_original_path(new_path) == ["yeni"]
+
+    # Değişmiş yol eski yoluyla bulunmaz, silinen klasör hiç bulunmaz
+    entries["id1"]["original_path"] = new_path
+    del entries["id2"]
+    assert sorted(catalog.find_original_path(new_path)) == ["id1", "yeni"]
+    assert catalog.find_original_path(make_record(1)["original_path"]) == []
+    assert catalog.find_original_path(make_record(2)["original_path"]) == []
+
+    catalog.save(entries)
+    assert sorted(catalog.find_original_path(new_path)) == ["id1", "yeni"]
+    assert catalog.find_original_path(make_record(2)["original_path"]) == []
@@ -0,0 +1,168 @@
+import os
+import sys
+
+import pytest
+from cryptography.fernet import Fernet
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gizlilik import FolderMover, Job, JournalCorrupt, ParallelCopier, TransferJournal  # noqa: E402
+
+
+@pytest.fixture
+def cipher():
+    return Fernet(Fernet.generate_key())
+
+
+def open_journal(tmp_path, cipher):
+    return TransferJournal.create(str(tmp_path / "journal"), cipher, op="hide", folder_id="abc",
+                                  src="kaynak", dst="hedef", record={})
+
+
+def reload(journal, cipher):
+    loaded = TransferJournal(journal.path, cipher)
+    loaded.load()
+    return loaded
+
+
+def test_journal_roundtrip(tmp_path, cipher):
+    journal = open_journal(tmp_path, cipher)
+    journal.file_done("a.txt")
+    journal.file_done(os.path.join("alt", "b.txt"))
+    journal.set_phase("copied")
+    journal.close(remove=False)
+
+    loaded = reload(journal, cipher)
+    assert loaded.begin["folder_id"] == "abc"
+    assert loaded.done_files == {"a.txt", os.path.join("alt", "b.txt")}
+    assert loaded.phase == "copied"
+    assert [j.path for j in TransferJournal.pending(str(tmp_path / "journal"), cipher)] == [journal.path]
+
+
+def test_torn_last_line_is_ignored(tmp_path, cipher):
+    journal = open_journal(tmp_path, cipher)
+    journal.file_done("a.txt")
+    journal.close(remove=False)
+    token = cipher.encrypt(b'{"type": "phase", "phase": "copied"}')
+    with open(journal.path, 'ab') as f:
+        f.write(token[:len(token) // 2])
+
+    loaded = reload(journal, cipher)
+    assert loaded.done_files == {"a.txt"}
+    assert loaded.phase is None
+
+
+def test_corrupt_middle_line_is_not_skipped(tmp_path, cipher):
+    journal = open_journal(tmp_path, cipher)
+    journal.file_done("a.txt")
+    journal.file_done("b.txt")
+    journal.set_phase("copied")
+    journal.close(remove=False)
+
+    with open(journal.path, 'rb') as f:
+        lines = f.read().split(b"\n")
+    lines[2] = lines[2][:10] + b"x" + lines[2][11:]
+    with open(journal.path, 'wb') as f:
+        f.write(b"\n".join(lines))
+
+    # Atlanırsa "copied" aşaması kaybolur ve taşıma yanlış sürdürülür
+    with pytest.raises(JournalCorrupt):
+        reload(journal, cipher)
+
+
+def make_tree(root, count):
+    for i in range(count):
+        path = os.path.join(root, f"d{i % 3}", f"dosya{i}.txt")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(f"içerik {i}" * 100)
+    return root
+
+
+def failing_after(copier, limit):
+    copied = []
+
+    def transform(src, dst, job=None):
+        if len(copied) >= limit:
+            raise OSError("disk hatası")
+        copier.copy_file(src, dst, job)
+        copied.append(src)
+
+    transform.copied = copied
+    return transform
+
+
+
+def test_copy_tree_skips_journaled_files(tmp_path, cipher):
+    src = make_tree(str(tmp_path / "kaynak"), 3)
+    os.symlink("d0", os.path.join(src, "bag"))
+    dst = str(tmp_path / "hedef")
+    copier = ParallelCopier(workers=2)
+    journal = open_journal(tmp_path, cipher)
+
+    # Önceki denemede dosya0 tamamlanmış, dosya1 yarım kalmış
+    done = os.path.join("d0", "dosya0.txt")
+    torn = os.path.join("d1", "dosya1.txt")
+    for rel_path, size in ((done, None), (torn, 10)):
+        os.makedirs(os.path.join(dst, os.path.dirname(rel_path)))
+        with open(os.path.join(src, rel_path), 'rb') as fsrc, open(os.path.join(dst, rel_path), 'wb') as fdst:
+            fdst.write(fsrc.read(size))
+        journal.file_done(rel_path)
+    journal.close(remove=False)
+    journal = reload(journal, cipher)
+
+    job = Job("kopya", None)
+    transform = failing_after(copier, 100)
+    stats = copier.copy_tree(src, dst, job, file_func=transform, journal=journal)
+
+    # Dönüştürülen kopyalarda boyut karşılaştırılamaz; günlük esas alınır
+    assert [os.path.relpath(path, src) for path in transform.copied] == [os.path.join("d2", "dosya2.txt")]
+    assert os.readlink(os.path.join(dst, "bag")) == "d0"
+    assert job.bytes_done == job.bytes_total == stats.size
+    assert job.files_done == job.files_total == stats.file_count
+
+    # Düz kopyada boyutu tutmayan dosya yeniden kopyalanır
+    copier.copy_tree(src, dst, journal=journal)
+    with open(os.path.join(src, torn), 'rb') as fsrc, open(os.path.join(dst, torn), 'rb') as fdst:
+        assert fsrc.read() == fdst.read()
+
+
+def test_resume_keeps_progress_when_it_fails_again(tmp_path, cipher):
+    src = make_tree(str(tmp_path / "kaynak"), 12)
+    dst = str(tmp_path / "gizli" / "hedef")
+    copier = ParallelCopier(workers=1)
+    mover = FolderMover(copier)
+    journal = open_journal(tmp_path, cipher)
+
+    with pytest.raises(OSError):
+        mover.move(src, dst, transform=failing_after(copier, 4), journal=journal)
+    journal = reload(journal, cipher)
+    assert os.path.isdir(dst)
+    assert journal.phase is None
+    assert len(journal.done_files) == 4
+
+    # İkinci bir hata da ilerlemeyi silmez
+    with pytest.raises(OSError):
+        mover.resume(src, dst, journal, transform=failing_after(copier, 3))
+    journal = reload(journal, cipher)
+    assert os.path.isdir(dst)
+    assert journal.phase is None
+    assert len(journal.done_files) == 7
+
+    # Sonunda kopyalanmış dosyalar atlanarak tamamlanır
+    transform = failing_after(copier, 100)
+    method, stats = mover.resume(src, dst, journal, collect_stats=True, transform=transform)
+    assert len(transform.copied) == 5
+    assert journal.phase == "source_deleted"
+    assert not os.path.exists(src)
+    assert stats.file_count == 12
+
+
+def test_unjournaled_copy_is_rolled_back(tmp_path):
+    src = make_tree(str(tmp_path / "kaynak"), 6)
+    dst = str(tmp_path / "gizli" / "hedef")
+    copier = ParallelCopier(workers=1)
+
+    with pytest.raises(OSError):
+        FolderMover(copier).move(src, dst, transform=failing_after(copier, 2))
+    assert not os.path.exists(dst)
+    assert len(os.listdir(src)) == 3